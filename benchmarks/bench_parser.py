@@ -0,0 +1,71 @@
+"""
+게시글 목록 파싱 마이크로 벤치마크
+
+기존 방식(전체 문서를 html.parser로 파싱하고 항목마다 find를 두 번 호출)과
+utils.parser.parse_post_items(lxml + post-list 영역만 파싱 + 한 번의 순회)를 비교한다.
+
+사용법:
+    python -m benchmarks.bench_parser                 # 생성한 페이지로 측정
+    python -m benchmarks.bench_parser saved/*.html    # 저장해 둔 실제 페이지로 측정
+"""
+import os
+import sys
+import time
+from bs4 import BeautifulSoup
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import post_list_page
+from utils import parser
+
+def legacy_parse(html):
+    """기존 IminScraperWorker의 파싱 방식"""
+    soup = BeautifulSoup(html, 'html.parser')
+    post_list = soup.find("ul", class_="post-list")
+    if not post_list:
+        return None
+    valid_posts = [li for li in post_list.find_all("li") if "notice" not in li.get("class", [])]
+    return [
+        post.find("p", class_="title").text.strip()
+        for post in valid_posts
+        if post.find("p", class_="title")
+    ]
+
+def measure(func, pages, repeat):
+    """페이지 목록을 repeat번 파싱하는 데 걸린 페이지당 평균 시간(ms)"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for html in pages:
+            func(html)
+    return (time.perf_counter() - start) * 1000 / (repeat * len(pages))
+
+def load_pages(paths):
+    """저장된 HTML 파일 로드. 없으면 생성한 페이지 사용"""
+    if paths:
+        pages = []
+        for path in paths:
+            with open(path, 'r', encoding='utf-8') as f:
+                pages.append(f.read())
+        return pages
+    return [post_list_page(page) for page in range(1, 21)]
+
+def main(argv):
+    pages = load_pages(argv)
+    repeat = 5
+    size_kb = sum(len(html.encode('utf-8')) for html in pages) / len(pages) / 1024
+
+    # 두 방식의 추출 결과가 같은지 확인
+    for html in pages:
+        legacy = legacy_parse(html)
+        items = parser.parse_post_items(html)
+        assert legacy == ([item["title"] for item in items] if items is not None else None)
+
+    legacy_ms = measure(legacy_parse, pages, repeat)
+    new_ms = measure(parser.parse_post_items, pages, repeat)
+
+    print(f"페이지 {len(pages)}개 (평균 {size_kb:.0f} KB), 반복 {repeat}회")
+    print(f"기존 방식 (html.parser, 전체 문서): {legacy_ms:8.2f} ms/페이지")
+    print(f"새 방식 ({parser.HTML_PARSER}, post-list만): {new_ms:8.2f} ms/페이지")
+    print(f"속도 향상: {legacy_ms / new_ms:.1f}배")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
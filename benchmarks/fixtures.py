@@ -0,0 +1,111 @@
+"""
+벤치마크용 오르비 페이지 생성기
+
+실제 사이트와 같은 구조(ul.post-list, .content-wrap 등)에 머리글/사이드바/스크립트 같은
+불필요한 영역을 함께 넣어 실제 페이지와 비슷한 크기의 HTML을 만든다.
+같은 인자로 호출하면 항상 같은 HTML을 반환한다.
+"""
+import random
+import zlib
+import struct
+from html import escape
+
+WORDS = ["수학", "국어", "영어", "물리", "화학", "생명", "지구", "정시", "수시", "모의고사",
+         "질문", "후기", "공부법", "인강", "기출", "오답", "실모", "등급", "컷", "재수"]
+BOARDS = ["수능", "대학", "자유", "질문", "칼럼"]
+
+def _title(rng):
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8)))
+
+def _layout(body, title="오르비"):
+    """공통 머리글/사이드바/꼬리글이 포함된 페이지"""
+    nav = "".join(f'<li class="menu-item"><a href="/board/{i}">메뉴 {i}</a></li>' for i in range(40))
+    sidebar = "".join(
+        f'<div class="widget"><h3>위젯 {i}</h3><ul>'
+        + "".join(f'<li><a href="/{90000000 + i * 10 + j}">인기글 {i}-{j}</a></li>' for j in range(10))
+        + '</ul></div>'
+        for i in range(8)
+    )
+    scripts = "".join(f'<script>window.__data{i} = {{"k": "{"x" * 200}"}};</script>' for i in range(10))
+    return (
+        f'<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>{escape(title)}</title>'
+        f'<link rel="stylesheet" href="/static/app.css">{scripts}</head><body>'
+        f'<header class="header"><nav><ul class="gnb">{nav}</ul></nav></header>'
+        f'<div class="container"><main class="main">{body}</main><aside class="sidebar">{sidebar}</aside></div>'
+        f'<footer class="footer"><p>© 오르비</p></footer></body></html>'
+    )
+
+def _post_item(rng, post_id, notice=False):
+    cls = ' class="notice"' if notice else ""
+    return (
+        f'<li{cls}><p class="title"><a href="/{post_id:012d}">{escape(_title(rng))}</a></p>'
+        f'<div class="meta"><span class="board">{rng.choice(BOARDS)}</span>'
+        f'<span class="nickname">닉네임{rng.randint(1, 999)}</span>'
+        f'<span class="date">2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}</span>'
+        f'<span class="count">조회 {rng.randint(1, 9999)}</span></div></li>'
+    )
+
+def post_list_page(page, per_page=20, last_page=50, seed=0, skip_head=3):
+    """
+    게시글 목록 페이지 (검색 결과/내 글 목록/전체 목록 공통)
+
+    Args:
+        page (int): 페이지 번호
+        per_page (int): 페이지당 게시글 수
+        last_page (int): 마지막 페이지 번호 (이후 페이지는 공지사항만 포함)
+        seed (int): 난수 시드 (아이민 등 목록 구분용)
+        skip_head (int): 목록 앞에 붙는 인기글 수 (검색 결과에서 건너뛰는 항목)
+    """
+    rng = random.Random(seed * 100003 + page)
+    items = [_post_item(rng, 10000000 + i, notice=True) for i in range(3)]
+    if page <= last_page:
+        items += [_post_item(rng, 20000000 + i) for i in range(skip_head)]
+        base = seed * 1000000 + page * per_page
+        items += [_post_item(rng, base + i) for i in range(per_page)]
+    return _layout(f'<ul class="post-list">{"".join(items)}</ul>', "게시글 목록")
+
+def article_page(article_id, image_count=3, seed=0, image_pool=50):
+    """
+    게시글 페이지
+
+    Args:
+        article_id (int): 게시글 ID
+        image_count (int): 본문 이미지 수
+        seed (int): 난수 시드
+        image_pool (int): 이미지 종류 수 (작을수록 같은 이미지가 자주 반복됨)
+    """
+    rng = random.Random(seed * 100003 + article_id)
+    paragraphs = "".join(f"<p>{escape(_title(rng))} {escape(_title(rng))}</p>" for _ in range(20))
+    images = "".join(f'<p><img src="/images/{rng.randrange(image_pool)}.png"></p>' for _ in range(image_count))
+    comments = "".join(f'<li class="comment"><p>{escape(_title(rng))}</p></li>' for _ in range(15))
+    body = (
+        f'<div class="article"><h1 class="title">{escape(_title(rng))}</h1>'
+        f'<div class="content-wrap">{paragraphs}{images}</div>'
+        f'<ul class="comment-list">{comments}</ul></div>'
+    )
+    return _layout(body, "게시글")
+
+def login_page():
+    """로그인 페이지"""
+    return _layout(
+        '<form method="post" action="/login"><input name="username"><input name="password" type="password">'
+        '<button type="submit">로그인</button></form>',
+        "로그인"
+    )
+
+def png_image(index, size=64):
+    """
+    단색 PNG 이미지
+
+    Args:
+        index (int): 이미지 번호 (색상 결정)
+        size (int): 가로/세로 픽셀 수
+    """
+    color = bytes(((index * 37) % 256, (index * 91) % 256, (index * 53) % 256))
+    raw = b"".join(b"\x00" + color * size for _ in range(size))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff)
+
+    header = struct.pack(">IIBBBBB", size, size, 8, 2, 0, 0, 0)
+    return b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) + chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b"")
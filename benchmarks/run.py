@@ -0,0 +1,259 @@
+"""
+워커 처리량 벤치마크
+
+로컬 대체 서버(benchmarks.server)를 띄우고 워커 작업(modules)을 하나씩 Qt 없이 별도 프로세스에서 실행해
+pages/s, images/s, 응답 지연 p50/p99, 최대 메모리(RSS)를 측정한다.
+--baseline으로 이전 결과와 비교하면 허용 범위를 벗어난 항목이 있을 때 종료 코드 1로 끝나므로
+성능 관련 변경의 회귀 검사로 사용할 수 있다.
+
+Selenium 기반 워커(로그인이 필요한 기능)는 Chrome이 필요하므로 포함하지 않는다.
+title_fetch는 저장된 세션으로 브라우저 없이 내 글 목록을 가져오는 경로를 측정한다.
+
+사용법:
+    python -m benchmarks.run                               # 모든 시나리오 측정
+    python -m benchmarks.run imin --latency 0.05           # 응답 지연을 넣어 측정
+    python -m benchmarks.run --save baseline.json          # 결과 저장
+    python -m benchmarks.run --baseline baseline.json      # 저장한 결과와 비교
+"""
+import os
+import sys
+import json
+import time
+import tempfile
+import argparse
+import threading
+import subprocess
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+SCENARIOS = ["imin", "imin_batch", "images", "title_fetch"]
+RESULT_PREFIX = "BENCH_RESULT "
+
+# 지표별 비교 방향 (True면 클수록 좋음)
+METRICS = {
+    "pages_per_sec": True,
+    "images_per_sec": True,
+    "latency_p50_ms": False,
+    "latency_p99_ms": False,
+    "peak_rss_mb": False
+}
+
+def peak_rss_mb():
+    """현재 프로세스의 최대 메모리 사용량(MB). 측정할 수 없으면 None"""
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux는 KB, macOS는 바이트 단위
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        pass
+    try:
+        import psutil
+        info = psutil.Process().memory_info()
+        return getattr(info, "peak_wset", info.rss) / (1024 * 1024)
+    except ImportError:
+        return None
+
+def percentile(values, ratio):
+    """정렬 후 해당 비율 위치의 값"""
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+class ResponseRecorder:
+    """HttpClient 응답 훅으로 응답 수와 지연 시간을 기록"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.pages = 0
+        self.images = 0
+
+    def __call__(self, response, *args, **kwargs):
+        content_type = response.headers.get("Content-Type", "")
+        with self.lock:
+            self.latencies.append(response.elapsed.total_seconds() * 1000)
+            if content_type.startswith("image/"):
+                self.images += 1
+            else:
+                self.pages += 1
+
+def run_task(scenario, args, work_dir):
+    """시나리오에 해당하는 작업을 현재 스레드에서 실행"""
+    if scenario == "imin":
+        from modules.imin_scraper import IminScraperTask
+        task = IminScraperTask(
+            "1234",
+            os.path.join(work_dir, "titles.txt"),
+            extra_format="jsonl",
+            prefetch_depth=args.prefetch
+        )
+    elif scenario == "imin_batch":
+        from modules.imin_scraper import IminBatchTask
+        # 아이민 20개를 세션 하나로 동시에 처리하고 통합 파일까지 작성
+        task = IminBatchTask(
+            [str(number) for number in range(1, 21)],
+            os.path.join(work_dir, "batch"),
+            merge=True,
+            workers=args.workers,
+            prefetch_depth=args.prefetch
+        )
+    elif scenario == "images":
+        from modules.image_downloader import ImageDownloaderTask
+        task = ImageDownloaderTask(
+            args.duration / 60,
+            os.path.join(work_dir, "images"),
+            fetch_mode="http",
+            download_workers=args.workers,
+            resume=False
+        )
+    elif scenario == "title_fetch":
+        from modules.title_clicker import TitleClickerTask
+        from utils.session import get_session_manager
+        # 로그인된 세션이 있는 상태 (대체 서버는 쿠키를 검사하지 않음)
+        get_session_manager().save("benchmark", [{"name": "session", "value": "benchmark", "path": "/"}])
+        task = TitleClickerTask("benchmark", "")
+    else:
+        raise ValueError(f"알 수 없는 시나리오: {scenario}")
+
+    task.execute()
+    return task
+
+def run_child(scenario, base_url, args):
+    """자식 프로세스에서 작업 하나를 측정하고 결과를 출력"""
+    from utils import http
+    from utils.rate_limiter import RateLimiter, set_limiter
+    from utils.site import set_base_url
+
+    set_base_url(base_url)
+    if args.rate > 0:
+        set_limiter(RateLimiter(rate=args.rate, burst=max(1, int(args.rate))))
+    else:
+        set_limiter(RateLimiter(rate=1e9, burst=10 ** 9))  # 제한 없음
+
+    recorder = ResponseRecorder()
+    http.RESPONSE_HOOKS.append(recorder)
+
+    # 캐시/로그 파일은 임시 디렉터리에 만든다
+    with tempfile.TemporaryDirectory(prefix=f"orbi_bench_{scenario}_") as work_dir:
+        os.chdir(work_dir)
+        start = time.perf_counter()
+        task = run_task(scenario, args, work_dir)
+        elapsed = time.perf_counter() - start
+        os.chdir(os.path.dirname(work_dir))
+
+    p50 = percentile(recorder.latencies, 0.5)
+    p99 = percentile(recorder.latencies, 0.99)
+    rss = peak_rss_mb()
+    result = {
+        "success": task.result[0],
+        "elapsed_sec": round(elapsed, 3),
+        "pages": recorder.pages,
+        "images": recorder.images,
+        "pages_per_sec": round(recorder.pages / elapsed, 2) if elapsed else 0.0,
+        "images_per_sec": round(recorder.images / elapsed, 2) if elapsed else 0.0,
+        "latency_p50_ms": round(p50, 2) if p50 is not None else None,
+        "latency_p99_ms": round(p99, 2) if p99 is not None else None,
+        "peak_rss_mb": round(rss, 1) if rss is not None else None,
+        "phases": {name: round(seconds, 3) for name, seconds in task.phases}
+    }
+    print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+def run_scenario(scenario, base_url, args):
+    """시나리오를 별도 프로세스에서 실행하고 결과 반환 (워커별 메모리를 따로 측정하기 위해)"""
+    command = [
+        sys.executable, "-m", "benchmarks.run", scenario,
+        "--child", base_url,
+        "--duration", str(args.duration),
+        "--rate", str(args.rate),
+        "--prefetch", str(args.prefetch),
+        "--workers", str(args.workers)
+    ]
+    project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.run(command, cwd=project_dir, capture_output=True, text=True, encoding="utf-8")
+
+    for line in process.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"{scenario} 시나리오 실행 실패:\n{process.stderr.strip()}")
+
+def compare(results, baseline, tolerance):
+    """
+    기준 결과와 비교
+
+    Args:
+        results (dict): {시나리오: 결과}
+        baseline (dict): 저장해 둔 {시나리오: 결과}
+        tolerance (float): 허용 변화율 (0.2면 20%)
+
+    Returns:
+        list: 회귀로 판단된 항목 설명 목록
+    """
+    regressions = []
+    for scenario, result in results.items():
+        base = baseline.get(scenario)
+        if not base:
+            continue
+        for metric, higher_is_better in METRICS.items():
+            current, previous = result.get(metric), base.get(metric)
+            if not current or not previous:
+                continue
+            if higher_is_better and current < previous * (1 - tolerance):
+                regressions.append(f"{scenario}.{metric}: {previous} -> {current}")
+            elif not higher_is_better and current > previous * (1 + tolerance):
+                regressions.append(f"{scenario}.{metric}: {previous} -> {current}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 대체 서버를 이용한 워커 처리량 벤치마크")
+    parser.add_argument("scenarios", nargs="*", help=f"측정할 시나리오 {SCENARIOS} (기본: 전체)")
+    parser.add_argument("--duration", type=float, default=10.0, help="이미지 다운로드 실행 시간(초)")
+    parser.add_argument("--latency", type=float, default=0.0, help="서버 응답 지연 시간(초)")
+    parser.add_argument("--last-page", type=int, default=50, help="아이민 검색 결과의 마지막 페이지")
+    parser.add_argument("--rate", type=float, default=0.0, help="초당 요청 수 제한 (0이면 제한 없음)")
+    parser.add_argument("--prefetch", type=int, default=4, help="아이민 동시 요청 페이지 수")
+    parser.add_argument("--workers", type=int, default=4, help="동시 다운로드 수 (imin_batch는 동시에 처리할 아이민 수)")
+    parser.add_argument("--save", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="기준 대비 허용 변화율")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    scenarios = args.scenarios or SCENARIOS
+    unknown = [scenario for scenario in scenarios if scenario not in SCENARIOS]
+    if unknown:
+        parser.error(f"알 수 없는 시나리오: {', '.join(unknown)}")
+
+    if args.child:
+        run_child(scenarios[0], args.child, args)
+        return 0
+
+    from benchmarks.server import StandInServer
+    server = StandInServer(("127.0.0.1", 0), latency=args.latency, last_page=args.last_page).start()
+    results = {}
+    try:
+        for scenario in scenarios:
+            print(f"[{scenario}] 측정 중...", flush=True)
+            results[scenario] = run_scenario(scenario, server.base_url, args)
+            print(json.dumps(results[scenario], ensure_ascii=False), flush=True)
+    finally:
+        server.stop()
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"결과를 {args.save}에 저장했습니다.")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"기준 대비 {args.tolerance:.0%} 이상 나빠진 항목:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print("기준 결과 대비 회귀 없음")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,195 @@
+"""
+벤치마크용 로컬 오르비 대체 서버
+
+benchmarks.fixtures로 만든 목록/검색/게시글/이미지/로그인/내 글 페이지를 제공한다.
+워커는 ORBI_BASE_URL 환경 변수(또는 utils.site.set_base_url)로 이 서버를 가리키면 된다.
+
+제공 경로:
+    /list                       요청할 때마다 새 게시글이 올라온 전체 목록
+    /search?type=imin&q=&page=  아이민 검색 결과 (last_page 이후는 공지사항만)
+    /my/post?page=              내 글 목록
+    /<게시글 ID>                게시글 (본문 이미지 포함)
+    /images/<번호>.png          이미지
+    /login                      로그인 페이지 (POST 시 세션 쿠키 발급)
+
+사용법:
+    python -m benchmarks.server --port 8000 --latency 0.05
+"""
+import os
+import re
+import sys
+import time
+import hashlib
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks import fixtures
+
+ARTICLE_PATH = re.compile(r"^/(\d+)$")
+IMAGE_PATH = re.compile(r"^/images/(\d+)\.png$")
+
+class StandInServer(ThreadingHTTPServer):
+    """
+    오르비 대체 서버
+
+    응답마다 ETag를 붙이고 If-None-Match가 같으면 304를 반환한다.
+    경로 종류별 요청 수는 request_counts에 기록된다.
+    """
+    daemon_threads = True
+
+    def __init__(self, address, latency=0.0, last_page=50, image_count=3, image_size=64):
+        """
+        서버 초기화
+
+        Args:
+            address (tuple): (호스트, 포트). 포트가 0이면 빈 포트 사용
+            latency (float): 응답마다 추가할 지연 시간(초)
+            last_page (int): 검색 결과/내 글 목록의 마지막 페이지
+            image_count (int): 게시글당 이미지 수
+            image_size (int): 이미지 가로/세로 픽셀 수
+        """
+        super().__init__(address, StandInHandler)
+        self.latency = latency
+        self.last_page = last_page
+        self.image_count = image_count
+        self.image_size = image_size
+        self.lock = threading.Lock()
+        self.list_requests = 0
+        self.request_counts = {}
+
+    @property
+    def base_url(self):
+        """서버 주소"""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, kind):
+        """경로 종류별 요청 수 기록"""
+        with self.lock:
+            self.request_counts[kind] = self.request_counts.get(kind, 0) + 1
+
+    def next_list_page(self):
+        """전체 목록 요청마다 다음 페이지 번호 (새 게시글이 계속 올라오는 상황 재현)"""
+        with self.lock:
+            self.list_requests += 1
+            return self.list_requests
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        thread = threading.Thread(target=self.serve_forever, name="StandInServer", daemon=True)
+        thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.shutdown()
+        self.server_close()
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """대체 서버 요청 처리"""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass  # 요청마다 출력하면 측정에 영향을 준다
+
+    def _page(self, query):
+        try:
+            return max(1, int(query.get("page", ["1"])[0]))
+        except ValueError:
+            return 1
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"' if body else None
+        if etag and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+
+        self.send_response(status)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        if server.latency:
+            time.sleep(server.latency)
+
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        path = url.path.rstrip("/") or "/"
+
+        if path == "/list":
+            server.count("list")
+            html = fixtures.post_list_page(server.next_list_page(), last_page=float("inf"))
+        elif path == "/search":
+            server.count("search")
+            imin = query.get("q", [""])[0]
+            seed = int(imin) if imin.isdigit() else 0
+            html = fixtures.post_list_page(self._page(query), seed=seed, last_page=server.last_page)
+        elif path == "/my/post":
+            server.count("my_post")
+            html = fixtures.post_list_page(self._page(query), seed=1, last_page=server.last_page, skip_head=0)
+        elif path == "/login":
+            server.count("login")
+            html = fixtures.login_page()
+        elif path == "/":
+            server.count("home")
+            html = fixtures.post_list_page(1, last_page=1)
+        elif ARTICLE_PATH.match(path):
+            server.count("article")
+            html = fixtures.article_page(int(ARTICLE_PATH.match(path).group(1)), image_count=server.image_count)
+        elif IMAGE_PATH.match(path):
+            server.count("image")
+            index = int(IMAGE_PATH.match(path).group(1))
+            self._send(200, fixtures.png_image(index, server.image_size), content_type="image/png")
+            return
+        else:
+            server.count("not_found")
+            self._send(404, b"not found", content_type="text/plain")
+            return
+
+        self._send(200, html.encode("utf-8"))
+
+    do_HEAD = do_GET
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        if urlparse(self.path).path.rstrip("/") == "/login":
+            self.server.count("login")
+            self.send_response(302)
+            self.send_header("Location", "/")
+            self.send_header("Set-Cookie", "session=benchmark; Path=/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self._send(404, b"not found", content_type="text/plain")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="벤치마크용 로컬 오르비 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답마다 추가할 지연 시간(초)")
+    parser.add_argument("--last-page", type=int, default=50, help="검색 결과의 마지막 페이지")
+    args = parser.parse_args(argv)
+
+    server = StandInServer((args.host, args.port), latency=args.latency, last_page=args.last_page)
+    print(f"{server.base_url} 에서 대기 중 (Ctrl+C로 종료)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,58 @@
-import os, sys
+import os, sys, time
+_start_time = time.perf_counter()
 app_dir = os.path.dirname(os.path.abspath(__file__))
 os.chdir(app_dir)
 sys.path.append(app_dir)
 
+from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QStatusBar, QMessageBox, QStackedWidget
+from PyQt5.QtCore import Qt, QTimer
 
+from utils.config import Config
+from utils.logger import Logger
 
-import sys
-from PyQt5.QtWidgets import QApplication, QMainWindow, QAction, QStatusBar, QMessageBox, QStackedWidget
-from PyQt5.QtCore import Qt
+# 디버그 모드 (ORBI_DEBUG=1 또는 --debug): 시작 시간과 기능 화면 생성 시간을 로그에 기록
+DEBUG = os.environ.get("ORBI_DEBUG") == "1" or "--debug" in sys.argv
+
+# 기능 화면 위젯 클래스 (메뉴에서 처음 선택할 때 불러온다)
+# 모듈 이름을 문자열로 불러오면 PyInstaller가 찾지 못하므로 함수마다 import 문을 그대로 둔다
+def _attendance():
+    from ui.module_uis.attendance import AttendanceWidget
+    return AttendanceWidget
+
+def _commenter():
+    from ui.module_uis.commenter import CommenterWidget
+    return CommenterWidget
+
+def _imin_scraper():
+    from ui.module_uis.imin_scraper import IminScraperWidget
+    return IminScraperWidget
 
-# 각 기능 모듈 UI 가져오기
-from ui.module_uis.attendance import AttendanceWidget
-from ui.module_uis.commenter import CommenterWidget
-from ui.module_uis.imin_scraper import IminScraperWidget
-from ui.module_uis.image_downloader import ImageDownloaderWidget
-from ui.module_uis.lottery import LotteryWidget
-from ui.module_uis.title_clicker import TitleClickerWidget
+def _image_downloader():
+    from ui.module_uis.image_downloader import ImageDownloaderWidget
+    return ImageDownloaderWidget
+
+def _lottery():
+    from ui.module_uis.lottery import LotteryWidget
+    return LotteryWidget
+
+def _title_clicker():
+    from ui.module_uis.title_clicker import TitleClickerWidget
+    return TitleClickerWidget
+
+def _jobs():
+    from ui.module_uis.jobs import JobsWidget
+    return JobsWidget
+
+# 기능 메뉴 목록: (키, 메뉴 이름, 상태바 설명, 위젯 클래스를 불러오는 함수)
+MODULES = [
+    ("attendance", "출석 체크", "오르비 자동 출석 체크", _attendance),
+    ("commenter", "댓글 작성", "오르비 자동 댓글 작성", _commenter),
+    ("imin_scraper", "아이민 글 제목 추출", "아이민으로 작성된 글 제목 추출", _imin_scraper),
+    ("image_downloader", "이미지 다운로드", "오르비 게시글 이미지 자동 다운로드", _image_downloader),
+    ("lottery", "복권 구매", "오르비 복권 자동 구매", _lottery),
+    ("title_clicker", "글 삭제", "자신이 작성한 글 자동 삭제", _title_clicker),
+    ("jobs", "예약 작업", "작업 파일의 작업을 대기열에 넣어 동시에 실행", _jobs),
+]
 
 class OrbiApp(QMainWindow):
     """
@@ -58,36 +95,11 @@ class OrbiApp(QMainWindow):
         # 기능 메뉴
         functionsMenu = menubar.addMenu('기능')
         
-        attendanceAction = QAction('출석 체크', self)
-        attendanceAction.setStatusTip('오르비 자동 출석 체크')
-        attendanceAction.triggered.connect(self.openAttendance)
-        
-        commenterAction = QAction('댓글 작성', self)
-        commenterAction.setStatusTip('오르비 자동 댓글 작성')
-        commenterAction.triggered.connect(self.openCommenter)
-        
-        iminScraperAction = QAction('아이민 글 제목 추출', self)
-        iminScraperAction.setStatusTip('아이민으로 작성된 글 제목 추출')
-        iminScraperAction.triggered.connect(self.openIminScraper)
-        
-        imageDownloaderAction = QAction('이미지 다운로드', self)
-        imageDownloaderAction.setStatusTip('오르비 게시글 이미지 자동 다운로드')
-        imageDownloaderAction.triggered.connect(self.openImageDownloader)
-        
-        lotteryAction = QAction('복권 구매', self)
-        lotteryAction.setStatusTip('오르비 복권 자동 구매')
-        lotteryAction.triggered.connect(self.openLottery)
-        
-        titleClickerAction = QAction('글 삭제', self)
-        titleClickerAction.setStatusTip('자신이 작성한 글 자동 삭제')
-        titleClickerAction.triggered.connect(self.openTitleClicker)
-        
-        functionsMenu.addAction(attendanceAction)
-        functionsMenu.addAction(commenterAction)
-        functionsMenu.addAction(iminScraperAction)
-        functionsMenu.addAction(imageDownloaderAction)
-        functionsMenu.addAction(lotteryAction)
-        functionsMenu.addAction(titleClickerAction)
+        for key, label, tip, _ in MODULES:
+            action = QAction(label, self)
+            action.setStatusTip(tip)
+            action.triggered.connect(lambda checked=False, key=key: self.openModule(key))
+            functionsMenu.addAction(action)
         
         # 도움말 메뉴
         helpMenu = menubar.addMenu('도움말')
@@ -102,20 +114,8 @@ class OrbiApp(QMainWindow):
         self.stackedWidget = QStackedWidget()
         self.setCentralWidget(self.stackedWidget)
         
-        # 각 기능별 위젯 생성 및 스택에 추가
-        self.attendanceWidget = AttendanceWidget()
-        self.commenterWidget = CommenterWidget()
-        self.iminScraperWidget = IminScraperWidget()
-        self.imageDownloaderWidget = ImageDownloaderWidget()
-        self.lotteryWidget = LotteryWidget()
-        self.titleClickerWidget = TitleClickerWidget()
-        
-        self.stackedWidget.addWidget(self.attendanceWidget)
-        self.stackedWidget.addWidget(self.commenterWidget)
-        self.stackedWidget.addWidget(self.iminScraperWidget)
-        self.stackedWidget.addWidget(self.imageDownloaderWidget)
-        self.stackedWidget.addWidget(self.lotteryWidget)
-        self.stackedWidget.addWidget(self.titleClickerWidget)
+        # 기능별 위젯은 처음 열 때 생성 (키 -> 위젯)
+        self.moduleWidgets = {}
         
         # 기본 화면 설정
         self.welcomeWidget = self.createWelcomeWidget()
@@ -165,35 +165,27 @@ class OrbiApp(QMainWindow):
         # TODO: 설정 다이얼로그 구현
         QMessageBox.information(self, '알림', '설정 기능은 아직 구현되지 않았습니다.')
         
-    def openAttendance(self):
-        """출석 체크 기능 열기"""
-        self.statusBar.showMessage('출석 체크 기능 열기')
-        self.stackedWidget.setCurrentWidget(self.attendanceWidget)
+    def openModule(self, key):
+        """
+        기능 화면 열기 (처음 열 때 UI 모듈을 불러와 위젯 생성)
         
-    def openCommenter(self):
-        """댓글 작성 기능 열기"""
-        self.statusBar.showMessage('댓글 작성 기능 열기')
-        self.stackedWidget.setCurrentWidget(self.commenterWidget)
+        Args:
+            key (str): MODULES의 기능 키
+        """
+        _, label, _, load_widget_class = next(entry for entry in MODULES if entry[0] == key)
+        self.statusBar.showMessage(f'{label} 기능 열기')
         
-    def openIminScraper(self):
-        """아이민 글 제목 추출 기능 열기"""
-        self.statusBar.showMessage('아이민 글 제목 추출 기능 열기')
-        self.stackedWidget.setCurrentWidget(self.iminScraperWidget)
+        widget = self.moduleWidgets.get(key)
+        if widget is None:
+            started = time.perf_counter()
+            widget_class = load_widget_class()
+            widget = widget_class()
+            self.moduleWidgets[key] = widget
+            self.stackedWidget.addWidget(widget)
+            if DEBUG:
+                Logger().info(f"{label} 화면 생성: {(time.perf_counter() - started) * 1000:.0f}ms")
         
-    def openImageDownloader(self):
-        """이미지 다운로드 기능 열기"""
-        self.statusBar.showMessage('이미지 다운로드 기능 열기')
-        self.stackedWidget.setCurrentWidget(self.imageDownloaderWidget)
-        
-    def openLottery(self):
-        """복권 구매 기능 열기"""
-        self.statusBar.showMessage('복권 구매 기능 열기')
-        self.stackedWidget.setCurrentWidget(self.lotteryWidget)
-        
-    def openTitleClicker(self):
-        """글 삭제 기능 열기"""
-        self.statusBar.showMessage('글 삭제 기능 열기')
-        self.stackedWidget.setCurrentWidget(self.titleClickerWidget)
+        self.stackedWidget.setCurrentWidget(widget)
         
     def showAbout(self):
         """앱 정보 표시"""
@@ -202,10 +194,34 @@ class OrbiApp(QMainWindow):
                           '오르비 사이트 관련 자동화 기능을 제공하는 애플리케이션입니다.\n'
                           '© 2025 오르비 프로젝트')
 
+def shutdown_browser_pool():
+    """브라우저를 쓰는 기능을 실행한 적이 있으면 남은 브라우저 정리"""
+    # 브라우저 모듈을 불러온 적이 없으면 정리할 것도 없으므로 selenium을 불러오지 않는다
+    browser_module = sys.modules.get("utils.browser")
+    if browser_module is not None:
+        browser_module.shutdown_browser_pool()
+
+def shutdown_scheduler():
+    """예약 작업 화면을 연 적이 있으면 실행 중인 작업을 멈추고 다음 실행으로 넘김"""
+    scheduler_module = sys.modules.get("modules.scheduler")
+    if scheduler_module is not None:
+        scheduler_module.shutdown_scheduler()
+
 def main():
     app = QApplication(sys.argv)
+    
+    # 브라우저 풀: 설정에 따라 미리 시작하고, 앱 종료 시 남은 브라우저 정리
+    if (Config().get("browser") or {}).get("warm_up"):
+        from utils.browser import get_browser_pool
+        get_browser_pool().warm_up()
+    app.aboutToQuit.connect(shutdown_scheduler)
+    app.aboutToQuit.connect(shutdown_browser_pool)
+    
     window = OrbiApp()
     window.show()
+    if DEBUG:
+        # 이벤트 루프가 처음 돌 때 = 창이 화면에 나타난 시점
+        QTimer.singleShot(0, lambda: Logger().info(f"시작 시간: {(time.perf_counter() - _start_time) * 1000:.0f}ms"))
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
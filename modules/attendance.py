@@ -0,0 +1,100 @@
+from datetime import datetime, timedelta, time
+
+from modules.task import BrowserTask
+from utils.site import site_url
+
+class AttendanceTask(BrowserTask):
+    """
+    출석 체크 작업
+    """
+    name = "출석 체크"
+    profile = "light"  # 이미지/광고를 받지 않는 가벼운 설정
+    repeatable = False  # 출석 기록을 남기는 쓰기 작업
+
+    def __init__(self, username, password, message="q", target_time=None):
+        """
+        Args:
+            username (str): 아이디
+            password (str): 비밀번호
+            message (str): 출석 메시지
+            target_time (datetime.time 또는 str, optional): 출석 버튼을 누를 시각 ("HH:MM:SS" 형식 문자열 가능)
+        """
+        super().__init__(username, password)
+        self.message = message
+        if isinstance(target_time, str):
+            target_time = time.fromisoformat(target_time)
+        self.target_time = target_time
+
+    def run(self):
+        self.log("출석 체크 작업을 시작합니다...")
+        super().run()
+
+    def run_browser(self, browser):
+        driver = browser.get_driver()
+
+        # 출석 페이지로 이동
+        self.log("출석 페이지로 이동 중...")
+        browser.get(site_url("/amusement/attendance"))
+
+        # 출석 메시지 입력
+        try:
+            input_box = browser.wait_for_selector(".greets-wrap .input-wrap") or \
+                driver.find_element("css selector", ".greets-wrap .input-wrap")
+            input_box.send_keys(self.message)
+            self.log(f"출석 메시지 입력 완료: {self.message}")
+        except Exception as e:
+            self.log(f"출석 메시지 입력 중 오류 발생: {e}")
+
+        # 목표 시간까지 대기
+        if self.target_time:
+            with self.phase("목표 시간 대기"):
+                self.wait_until_target()
+
+        # 중단되었는지 확인
+        if not self.running:
+            self.finish(False, "사용자에 의해 중단되었습니다.")
+            return
+
+        # 출석 버튼 클릭
+        try:
+            shown = browser.count_text(self.message)
+            submit_button = driver.find_element("css selector", ".greets-wrap button.submit")
+            submit_button.click()
+            self.log("출석 버튼 클릭 완료!")
+
+            # 결과 확인: 인사말이 목록에 나타나거나 결과 알림창이 떠야 처리된 것으로 본다
+            self.log("출석 체크 결과 확인 중...")
+            result = browser.wait_for_alert_or_text(self.message, shown + 1, timeout=10)
+            if result is True:
+                self.finish(True, "출석 체크가 완료되었습니다.")
+            elif result:
+                alert_text = result.text
+                result.accept()
+                self.finish(True, f"출석 체크 결과: {alert_text}")
+            else:
+                self.finish(False, "출석 체크 결과를 확인하지 못했습니다. (인사말이 목록에 나타나지 않음)")
+        except Exception as e:
+            self.finish(False, f"출석 버튼 클릭 중 오류 발생: {e}")
+
+    def wait_until_target(self):
+        """목표 시간까지 대기 (중단 요청 시 바로 반환)"""
+        now = datetime.now()
+        target = datetime.combine(now.date(), self.target_time)
+
+        # 목표 시간이 현재보다 이전이면 다음 날로 설정
+        if target < now:
+            target = datetime.combine(now.date() + timedelta(days=1), self.target_time)
+
+        wait_seconds = (target - now).total_seconds()
+        self.log(f"목표 시간({target.strftime('%H:%M:%S')})까지 {wait_seconds:.1f}초 대기 중...")
+
+        # 1초 단위로 업데이트하며 대기
+        while self.running:
+            remaining = (target - datetime.now()).total_seconds()
+            if remaining <= 0:
+                break
+            if not self.wait(min(1.0, remaining)):
+                break
+            remaining = int(round((target - datetime.now()).total_seconds()))
+            if remaining > 0 and (remaining % 10 == 0 or remaining < 10):  # 10초마다 또는 10초 미만일 때 업데이트
+                self.log(f"목표 시간까지 {remaining}초 남음...")
@@ -0,0 +1,89 @@
+from modules.task import BrowserTask
+from utils.site import site_url
+
+class CommenterTask(BrowserTask):
+    """
+    댓글 작성 작업
+    """
+    name = "댓글 작성"
+    profile = "light"  # 이미지/광고를 받지 않는 가벼운 설정
+    repeatable = False  # 다시 실행하면 이미 작성한 댓글을 또 작성한다
+
+    def __init__(self, username, password, article_number, comment_text, num_comments):
+        """
+        Args:
+            username (str): 아이디
+            password (str): 비밀번호
+            article_number (str): 게시글 번호
+            comment_text (str): 댓글 내용
+            num_comments (int): 작성할 댓글 수
+        """
+        super().__init__(username, password)
+        self.article_number = article_number
+        self.comment_text = comment_text
+        self.num_comments = num_comments
+
+    def run(self):
+        self.log("댓글 작성 작업을 시작합니다...")
+        super().run()
+
+    def run_browser(self, browser):
+        driver = browser.get_driver()
+
+        # 게시글 페이지로 이동
+        article_url = site_url(f"/{self.article_number}")
+        self.log(f"게시글 페이지로 이동 중... ({article_url})")
+        browser.get(article_url)
+        browser.wait_for_selector('[name="content"]', timeout=10)
+
+        # 게시글 존재 확인
+        if "error" in driver.current_url or "404" in driver.page_source:
+            self.finish(False, f"게시글을 찾을 수 없습니다: {self.article_number}")
+            return
+
+        # 댓글 작성
+        success_count = 0
+        self.progress(0, self.num_comments)
+        for i in range(self.num_comments):
+            # 이전 댓글 전송이 끝난 뒤 쓰기 간격(설정의 write_interval)만큼 대기
+            if not self.wait_for_write_slot():
+                self.finish(False, "사용자에 의해 중단되었습니다.")
+                return
+
+            try:
+                self.log(f"댓글 {i+1}/{self.num_comments} 작성 중...")
+
+                # 댓글 입력 필드 찾기
+                comment_area = browser.wait_for_selector('[name="content"]', clickable=True) or \
+                    driver.find_element("name", "content")
+                comment_area.click()
+
+                # 댓글 내용 입력
+                comment_area.clear()
+                comment_area.send_keys(self.comment_text)
+
+                # 게시 버튼 클릭 (같은 내용의 댓글이 이미 몇 개 보이는지 먼저 세어 둠)
+                shown = browser.count_text(self.comment_text)
+                post_button = driver.find_element("class name", "send")
+                post_button.click()
+
+                # 작성한 댓글이 목록에 나타나야 성공 (오류 알림창이 뜨면 실패)
+                result = browser.wait_for_alert_or_text(self.comment_text, shown + 1, timeout=10)
+                if result is True:
+                    success_count += 1
+                    self.log(f"댓글 {i+1}/{self.num_comments} 작성 완료!")
+                elif result:
+                    alert_text = result.text
+                    result.accept()
+                    self.log(f"댓글 {i+1}/{self.num_comments} 작성 실패: {alert_text}")
+                else:
+                    self.log(f"댓글 {i+1}/{self.num_comments} 작성 여부를 확인하지 못했습니다. (댓글 목록에 나타나지 않음)")
+
+            except Exception as e:
+                self.log(f"댓글 {i+1}/{self.num_comments} 작성 중 오류 발생: {e}")
+            finally:
+                self.write_finished()
+
+            self.progress(i + 1)
+
+        self.finish(True, f"댓글 작성이 완료되었습니다. {success_count}/{self.num_comments}개 작성 성공!")
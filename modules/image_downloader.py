@@ -0,0 +1,215 @@
+import os
+import time
+from contextlib import ExitStack
+
+from modules.task import Task
+from utils.downloader import ImageDownloadPool
+from utils.frontier import CrawlFrontier, STATE_DONE, STATE_FAILED
+from utils.http_cache import HttpCache
+from utils.image_store import ImageStore
+from utils.rate_limiter import get_limiter
+from utils.site import site_url
+
+class ImageDownloaderTask(Task):
+    """
+    이미지 다운로드 작업
+
+    완료 콜백에는 다운로드 폴더 경로가 함께 전달된다.
+    """
+    name = "이미지 다운로드"
+
+    def __init__(self, run_time_minutes, download_dir, fetch_mode="http", download_workers=4, per_host_limit=2,
+                 resume=True):
+        """
+        Args:
+            run_time_minutes (int): 실행 시간(분)
+            download_dir (str): 다운로드 폴더
+            fetch_mode (str): 페이지 수집 방식 ("http" 또는 "browser")
+            download_workers (int): 동시 다운로드 수
+            per_host_limit (int): 호스트별 동시 다운로드 수
+            resume (bool): 이전 실행에서 방문한 게시글 건너뛰고 남은 이미지 이어 받기
+        """
+        super().__init__()
+        self.run_time_minutes = run_time_minutes
+        self.download_dir = download_dir
+        self.fetch_mode = fetch_mode
+        self.download_workers = download_workers
+        self.per_host_limit = per_host_limit
+        self.resume = resume
+        self.pool = None
+
+    @classmethod
+    def resource_for(cls, params):
+        # 브라우저로 페이지를 수집하면 브라우저 작업으로 취급
+        return "browser" if params.get("fetch_mode") == "browser" else "http"
+
+    def default_extra(self):
+        return (self.download_dir,)
+
+    def stop(self):
+        """작업 중단 (대기 중인 다운로드도 취소)"""
+        super().stop()
+        if self.pool:
+            self.pool.cancel()
+
+    def run(self):
+        from utils.fetcher import create_fetcher
+        from utils.http import HttpClient
+
+        self.log(f"이미지 다운로드 작업을 시작합니다... (실행 시간: {self.run_time_minutes}분)")
+
+        # 다운로드 디렉토리 생성
+        os.makedirs(self.download_dir, exist_ok=True)
+
+        # 생성한 순서의 반대로 정리 (생성 도중 오류가 나도 이미 연 클라이언트/DB는 닫힘)
+        cleanup = ExitStack()
+        try:
+            # 페이지 수집기 초기화 (HTTP 우선, 필요한 페이지만 브라우저 사용)
+            cache = HttpCache()
+            cleanup.callback(cache.close)
+            client = HttpClient(
+                pool_size=max(10, self.download_workers),
+                cache=cache,
+                limiter=get_limiter(),
+                should_stop=self.cancel,
+                log_callback=self.log
+            )
+            cleanup.callback(client.close)
+            fetcher = create_fetcher(self.fetch_mode, client=client)
+            cleanup.callback(fetcher.close)
+
+            # 중복 제거용 이미지 저장소 (이전 실행에서 받은 이미지 재사용)
+            store = ImageStore(os.path.join(self.download_dir, ".orbi_store"))
+
+            # 방문 기록 (중단 후 다시 실행하면 이어서 진행)
+            frontier = CrawlFrontier(os.path.join(store.root_dir, "frontier.sqlite3"))
+            cleanup.callback(frontier.close)
+            if not self.resume:
+                frontier.reset()
+
+            def on_image_result(img_url, save_path, article_id, result):
+                state = STATE_FAILED if result is False else STATE_DONE
+                frontier.set_image_state(article_id, save_path, state)
+                self.progress(step=1)
+
+            # 이미지 다운로드 풀 시작 (게시글 순회와 병렬로 다운로드)
+            self.pool = ImageDownloadPool(
+                client,
+                max_workers=self.download_workers,
+                per_host_limit=self.per_host_limit,
+                log_callback=self.log,
+                store=store,
+                result_callback=on_image_result
+            )
+            cleanup.callback(self.pool.close, cancel=True)
+            self.pool.start()
+
+            # 이전 실행에서 끝나지 않은 이미지 다시 대기열에 추가
+            pending_images = frontier.pending_images()
+            if pending_images:
+                self.log(f"이전 작업에서 남은 이미지 {len(pending_images)}개를 이어서 다운로드합니다.")
+                for img_url, save_path, article_id in pending_images:
+                    if not self.pool.submit(img_url, save_path, article_id):
+                        break
+
+            base_url = site_url("/list")
+            start_time = time.time()
+            run_time_seconds = self.run_time_minutes * 60
+
+            with self.phase("게시글 순회"):
+                while time.time() - start_time < run_time_seconds and self.running:
+                    # 남은 시간 계산
+                    elapsed_seconds = time.time() - start_time
+                    remaining_seconds = run_time_seconds - elapsed_seconds
+                    remaining_minutes = remaining_seconds / 60
+
+                    self.log(f"게시글 목록 페이지 로드 중... (남은 시간: {remaining_minutes:.1f}분)")
+
+                    try:
+                        # 게시글 목록에서 공지사항이 아닌 항목의 링크 찾기
+                        links = fetcher.get_article_links(base_url)
+
+                        if not links:
+                            self.log("게시글을 찾을 수 없습니다. 다시 시도합니다.")
+                            client.limiter.on_error(base_url)  # 다음 요청까지 백오프
+                            continue
+
+                        self.log(f"{len(links)}개의 게시글을 찾았습니다.")
+
+                        # 각 게시글 처리
+                        for link in links:
+                            if not self.running or time.time() - start_time >= run_time_seconds:
+                                break
+                            self.visit_article(link, fetcher, frontier)
+
+                    except Exception as e:
+                        self.log(f"게시글 목록 처리 중 오류 발생: {e}")
+
+                    # 목록 페이지 재요청 간격은 속도 제한기가 조절한다
+
+            # 남은 다운로드 처리 (중단된 경우 대기열을 비우고 종료)
+            if self.running and self.pool.pending():
+                self.log(f"남은 이미지 {self.pool.pending()}개 다운로드 대기 중...")
+            with self.phase("남은 다운로드"):
+                self.pool.close(cancel=not self.running)
+            downloaded_count = self.pool.downloaded_count
+            summary = f"다운로드 {downloaded_count}개, 재사용 {self.pool.skipped_count}개, 중복 내용 {store.duplicate_count}개"
+            self.log(cache.summary())
+
+            # 작업 완료
+            if not self.running:
+                self.finish(False, f"사용자에 의해 중단되었습니다. ({summary})", self.download_dir)
+            else:
+                self.finish(True, f"이미지 다운로드 작업이 완료되었습니다. 총 {downloaded_count}개의 이미지를 다운로드했습니다. ({summary})", self.download_dir)
+
+        except Exception as e:
+            self.finish(False, f"이미지 다운로드 중 오류 발생: {e}", self.download_dir)
+        finally:
+            cleanup.close()
+
+    def visit_article(self, link, fetcher, frontier):
+        """
+        게시글을 방문해 본문 이미지를 다운로드 대기열에 추가
+
+        Args:
+            link (str): 게시글 주소
+            fetcher: 페이지 수집기 (utils.fetcher)
+            frontier (CrawlFrontier): 방문 기록
+        """
+        try:
+            # 이미 방문한 게시글 건너뛰기 (이전 실행 포함)
+            article_id = link.rstrip('/').split('/')[-1]
+            if frontier.is_visited(article_id):
+                return
+
+            # 게시글 방문 후 본문 이미지 주소 가져오기
+            self.log(f"게시글 방문 중: {link}")
+            images = fetcher.get_image_urls(link) or []
+
+            # 이미지 파일명 생성
+            downloads = []
+            for idx, img_url in enumerate(images):
+                file_ext = img_url.split('.')[-1].split('?')[0]
+                if file_ext not in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
+                    file_ext = 'jpg'  # 기본 확장자
+
+                save_path = os.path.join(self.download_dir, f"{article_id}_img{idx}.{file_ext}")
+                downloads.append((img_url, save_path))
+
+            # 방문 표시 (발견한 이미지는 다운로드 대기 상태로 기록)
+            frontier.mark_visited(article_id, link, downloads)
+
+            if not downloads:
+                self.log("이미지가 없는 게시글입니다.")
+                return
+
+            self.log(f"{len(downloads)}개의 이미지를 찾았습니다.")
+
+            # 다운로드 대기열에 추가
+            for img_url, save_path in downloads:
+                if not self.running:
+                    break
+                self.pool.submit(img_url, save_path, article_id)
+
+        except Exception as e:
+            self.log(f"게시글 처리 중 오류 발생: {e}")
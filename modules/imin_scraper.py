@@ -0,0 +1,356 @@
+import os
+import re
+import csv
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from modules.task import Task
+from utils.archive import SOURCE_IMIN
+from utils.http_cache import HttpCache
+from utils.prefetch import PagePrefetcher
+from utils.rate_limiter import get_limiter
+from utils.site import site_url
+from utils.title_writer import TitleWriter, CSV_FIELDS, EXTRA_FORMATS
+
+class IminScraperTask(Task):
+    """
+    아이민 글 제목 추출 작업
+
+    완료 콜백에는 결과 파일 경로가 함께 전달된다 (추출된 제목이 없으면 빈 문자열).
+    """
+    name = "제목 추출"
+
+    def __init__(self, imin_number, save_path, extra_format=None, resume=False, prefetch_depth=4):
+        """
+        Args:
+            imin_number (str): 아이민 번호
+            save_path (str): 제목을 저장할 텍스트 파일 경로
+            extra_format (str, optional): 함께 저장할 형식 ("jsonl", "csv" 또는 None)
+            resume (bool): 중단된 작업의 마지막 페이지 다음부터 이어서 추출
+            prefetch_depth (int): 동시에 미리 가져올 페이지 수
+        """
+        super().__init__()
+        self.imin_number = imin_number
+        self.save_path = save_path
+        self.extra_format = extra_format
+        self.resume = resume
+        self.prefetch_depth = prefetch_depth
+
+    def default_extra(self):
+        return ("",)
+
+    def run(self):
+        from utils.http import HttpClient
+
+        self.log(f"아이민 {self.imin_number}의 글 제목 추출 작업을 시작합니다...")
+
+        # 변경되지 않은 페이지는 조건부 요청으로 캐시에서 가져온다
+        # 요청 간격은 공유 속도 제한기가 조절한다
+        cache = HttpCache()
+        client = HttpClient(cache=cache, limiter=get_limiter(), should_stop=self.cancel)
+
+        # 페이지마다 결과를 바로 파일에 기록
+        writer = TitleWriter(self.save_path, self.extra_format)
+
+        try:
+            page = writer.start(self.imin_number, resume=self.resume)
+            if page > 1:
+                self.log(f"이전 작업에 이어서 페이지 {page}부터 추출합니다. (기존 제목 {writer.count}개)")
+
+            with self.phase("페이지 수집"):
+                reached_end = self.scrape_pages(client, self.imin_number, writer, page, self.prefetch_depth)
+
+            if not self.running:
+                self.log("사용자에 의해 중단되었습니다.")
+
+            self.log(cache.summary())
+            writer.close(complete=reached_end)
+
+            # 결과 파일 확인
+            if writer.count:
+                self.log(f"총 {writer.count}개의 제목을 {self.save_path}에 저장했습니다.")
+                if writer.extra_path:
+                    self.log(f"게시글 정보를 {writer.extra_path}에 저장했습니다.")
+                self.finish(True, f"총 {writer.count}개의 제목 추출 완료", self.save_path)
+            else:
+                self.finish(False, "추출된 제목이 없습니다.", "")
+
+        except Exception as e:
+            self.finish(False, f"제목 추출 중 오류 발생: {e}", "")
+        finally:
+            writer.close()
+            client.close()
+            cache.close()
+
+    def scrape_pages(self, client, imin_number, writer, start_page, prefetch_depth, prefix=""):
+        """
+        아이민 검색 결과를 start_page부터 마지막 페이지까지 가져와 writer에 기록
+
+        Args:
+            client (HttpClient): 요청에 사용할 클라이언트
+            imin_number (str): 아이민 번호
+            writer (TitleWriter): 결과 기록기 (start() 호출 후)
+            start_page (int): 첫 페이지 번호
+            prefetch_depth (int): 동시에 미리 가져올 페이지 수
+            prefix (str): 로그 앞에 붙일 문자열 (일괄 추출에서 아이민 구분용)
+
+        Returns:
+            bool: 마지막 페이지까지 추출했으면 True (중단/실패 시 False)
+        """
+        from utils.http import RequestCancelled
+        from utils.parser import parse_post_items
+
+        base_url = site_url("/search")
+
+        def fetch_page(page_number, should_stop):
+            # 검색 파라미터 구성
+            params = {
+                "type": "imin",
+                "q": imin_number,
+                "page": page_number
+            }
+            return client.get(base_url, params=params, should_stop=should_stop)
+
+        # 다음 페이지들을 미리 병렬로 요청하고 결과는 순서대로 처리 (요청 속도는 속도 제한기가 조절)
+        self.log(f"{prefix}페이지 {start_page}부터 최대 {prefetch_depth}페이지씩 미리 가져옵니다...")
+        prefetcher = PagePrefetcher(fetch_page, start_page=start_page, depth=prefetch_depth, should_stop=self.cancel)
+
+        try:
+            for page, response in prefetcher:
+                if response.status_code != 200:
+                    self.log(f"{prefix}페이지 {page} 가져오기 실패. HTTP 상태 코드: {response.status_code}")
+                    return False
+
+                # 'post-list' 안의 공지사항이 아닌 항목 추출
+                items = parse_post_items(response.text)
+                if items is None:
+                    self.log(f"{prefix}더 이상 'post-list'를 찾을 수 없습니다. 중지합니다.")
+                    return True
+
+                # 첫 3개 유효 게시물 건너뛰기
+                page_items = items[3:]
+
+                # 유효한 제목이 없으면 중지 (마지막 페이지)
+                if not page_items:
+                    self.log(f"{prefix}이 페이지에서 제목을 찾을 수 없습니다. 중지합니다.")
+                    return True
+
+                # 빈 제목 제외하고 바로 파일에 기록
+                writer.write_page(page, [item for item in page_items if item["title"]])
+                self.archive_posts(page_items, SOURCE_IMIN, imin_number)
+                self.log(f"{prefix}페이지 {page}에서 {len(page_items)}개의 제목을 찾았습니다.")
+                self.on_page(writer)
+
+                # 중단 요청 확인
+                if not self.running:
+                    return False
+        except RequestCancelled:
+            pass  # 속도 제한 대기 중 중단 요청
+        finally:
+            prefetcher.close()  # 미리 보낸 요청이 끝난 뒤에 클라이언트와 캐시를 닫도록 대기
+        return False
+
+    def on_page(self, writer):
+        """페이지 하나를 기록한 뒤 진행 상황 갱신"""
+        self.progress(writer.count)
+
+def parse_imin_numbers(text):
+    """
+    아이민 번호 목록 해석 (쉼표/공백/줄바꿈 구분, # 뒤는 주석, 중복은 처음 것만)
+
+    Args:
+        text (str): 아이민 번호 목록 문자열
+
+    Returns:
+        list: 아이민 번호 목록 (입력 순서)
+    """
+    numbers = []
+    for line in text.splitlines():
+        for number in re.split(r"[\s,]+", line.split("#", 1)[0]):
+            if number and number not in numbers:
+                numbers.append(number)
+    return numbers
+
+def load_imin_numbers(path):
+    """
+    파일에서 아이민 번호 목록 읽기
+
+    Args:
+        path (str): 아이민 번호가 적힌 텍스트 파일
+
+    Returns:
+        list: 아이민 번호 목록
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_imin_numbers(f.read())
+
+class IminBatchTask(IminScraperTask):
+    """
+    여러 아이민의 글 제목을 한 번에 추출하는 작업
+
+    모든 아이민이 연결을 유지하는 HTTP 세션 하나와 공유 속도 제한기를 함께 쓰며, 동시에 workers개씩 처리한다.
+    결과는 아이민마다 <아이민>_log.txt로 저장하고, merge면 아이민 열을 붙인 통합 파일과 색인도 만든다.
+    완료 콜백에는 통합 파일(없으면 출력 폴더) 경로가 함께 전달된다.
+    """
+    name = "일괄 제목 추출"
+    merged_name = "imin_titles"
+
+    def __init__(self, imin_numbers, output_dir, extra_format=None, merge=False, resume=False, workers=4,
+                 prefetch_depth=2):
+        """
+        Args:
+            imin_numbers (list or str): 아이민 번호 목록 (문자열이면 쉼표/줄바꿈 구분)
+            output_dir (str): 결과를 저장할 폴더
+            extra_format (str, optional): 함께 저장할 형식 ("jsonl", "csv" 또는 None)
+            merge (bool): 모든 아이민의 결과를 하나의 파일로 합치기 (형식이 없으면 JSONL)
+            resume (bool): 완료된 아이민은 건너뛰고 중단된 아이민은 이어서 추출
+            workers (int): 동시에 처리할 아이민 수
+            prefetch_depth (int): 아이민별로 동시에 미리 가져올 페이지 수
+        """
+        if isinstance(imin_numbers, str):
+            imin_numbers = parse_imin_numbers(imin_numbers)
+        if merge and extra_format is None:
+            extra_format = "jsonl"  # 통합 파일은 아이민별 구조화 파일을 합쳐 만든다
+        super().__init__(None, output_dir, extra_format, resume, prefetch_depth)
+        self.imin_numbers = parse_imin_numbers("\n".join(str(number) for number in imin_numbers))
+        self.output_dir = output_dir
+        self.merge = merge
+        self.workers = max(1, workers)
+
+    def default_extra(self):
+        return (self.output_dir,)
+
+    def on_page(self, writer):
+        pass  # 진행률은 아이민 단위로 센다
+
+    def run(self):
+        from utils.http import HttpClient
+
+        if not self.imin_numbers:
+            self.finish(False, "아이민 번호가 없습니다.")
+            return
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.log(f"아이민 {len(self.imin_numbers)}개의 글 제목을 {self.workers}개씩 동시에 추출합니다...")
+        self.progress(0, len(self.imin_numbers))
+
+        # 모든 아이민이 하나의 세션(연결 유지)과 공유 속도 제한기를 사용
+        cache = HttpCache()
+        client = HttpClient(
+            pool_size=max(10, self.workers * self.prefetch_depth),
+            cache=cache,
+            limiter=get_limiter(),
+            should_stop=self.cancel
+        )
+        results = {}  # 아이민 -> {"count", "complete"}
+
+        try:
+            with self.phase("일괄 수집"), ThreadPoolExecutor(max_workers=self.workers,
+                                                         thread_name_prefix="IminBatch") as executor:
+                futures = {executor.submit(self.scrape_one, client, number): number for number in self.imin_numbers}
+                for future in as_completed(futures):
+                    number = futures[future]
+                    try:
+                        results[number] = future.result()
+                    except Exception as e:
+                        self.log(f"[{number}] 제목 추출 중 오류 발생: {e}")
+                    self.progress(step=1)
+
+            self.log(cache.summary())
+
+            complete = [number for number in self.imin_numbers if results.get(number, {}).get("complete")]
+            title_count = sum(result["count"] for result in results.values())
+            result_path = self.output_dir
+            if self.merge:
+                with self.phase("통합 파일 작성"):
+                    result_path = self.write_merged(results)
+                self.log(f"통합 파일 {result_path}을(를) 만들었습니다.")
+
+            summary = f"아이민 {len(self.imin_numbers)}개 중 {len(complete)}개 완료, 제목 {title_count}개"
+            if not self.running:
+                self.finish(False, f"사용자에 의해 중단되었습니다. ({summary})", result_path)
+            elif len(complete) < len(self.imin_numbers):
+                self.finish(False, f"일부 아이민을 끝까지 추출하지 못했습니다. ({summary})", result_path)
+            else:
+                self.finish(True, f"일괄 제목 추출 완료 ({summary})", result_path)
+
+        except Exception as e:
+            self.finish(False, f"일괄 제목 추출 중 오류 발생: {e}", self.output_dir)
+        finally:
+            client.close()
+            cache.close()
+
+    def save_path_for(self, imin_number):
+        """아이민별 제목 파일 경로"""
+        return os.path.join(self.output_dir, f"{imin_number}_log.txt")
+
+    def scrape_one(self, client, imin_number):
+        """
+        아이민 하나 추출 (작업 스레드 풀에서 실행)
+
+        Returns:
+            dict: {"count": 저장된 제목 수, "complete": 마지막 페이지까지 추출했는지}
+        """
+        writer = TitleWriter(self.save_path_for(imin_number), self.extra_format)
+        completed = writer.completed_count(imin_number) if self.resume else None
+        if completed is not None:
+            self.log(f"[{imin_number}] 이전 작업에서 완료되어 건너뜁니다. (제목 {completed}개)")
+            return {"count": completed, "complete": True}
+        if not self.running:
+            return {"count": 0, "complete": False}
+
+        prefix = f"[{imin_number}] "
+        try:
+            page = writer.start(imin_number, resume=self.resume)
+            if page > 1:
+                self.log(f"{prefix}이전 작업에 이어서 페이지 {page}부터 추출합니다. (기존 제목 {writer.count}개)")
+            reached_end = self.scrape_pages(client, imin_number, writer, page, self.prefetch_depth, prefix)
+            writer.close(complete=reached_end)
+            self.log(f"{prefix}제목 {writer.count}개 저장")
+            return {"count": writer.count, "complete": reached_end}
+        finally:
+            writer.close()
+
+    def write_merged(self, results):
+        """
+        아이민별 구조화 파일을 입력 순서대로 합쳐 통합 파일과 색인 작성
+
+        색인(<통합 파일>.index.json)에는 아이민마다 통합 파일에서의 시작 위치(바이트, 행)와
+        제목 수, 완료 여부를 기록해 특정 아이민의 결과만 바로 읽을 수 있게 한다.
+
+        Returns:
+            str: 통합 파일 경로
+        """
+        merged_path = os.path.join(self.output_dir, self.merged_name + EXTRA_FORMATS[self.extra_format])
+        index = {}
+        row = 0
+        temp_path = merged_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8', newline='') as merged:
+            csv_writer = None
+            if self.extra_format == "csv":
+                csv_writer = csv.DictWriter(merged, fieldnames=["imin"] + CSV_FIELDS, extrasaction='ignore')
+                csv_writer.writeheader()
+
+            for number in self.imin_numbers:
+                merged.flush()
+                entry = {"offset": merged.tell(), "row": row, "count": 0,
+                         "complete": bool(results.get(number, {}).get("complete"))}
+                part_path = os.path.splitext(self.save_path_for(number))[0] + EXTRA_FORMATS[self.extra_format]
+                if os.path.exists(part_path):
+                    with open(part_path, 'r', encoding='utf-8', newline='') as part:
+                        if csv_writer:
+                            for item in csv.DictReader(part):
+                                csv_writer.writerow({"imin": number, **item})
+                                entry["count"] += 1
+                        else:
+                            for line in part:
+                                if line.strip():
+                                    merged.write(json.dumps({"imin": number, **json.loads(line)}, ensure_ascii=False) + "\n")
+                                    entry["count"] += 1
+                row += entry["count"]
+                index[number] = entry
+        os.replace(temp_path, merged_path)
+
+        with open(os.path.splitext(merged_path)[0] + ".index.json", 'w', encoding='utf-8') as f:
+            json.dump({"file": os.path.basename(merged_path), "rows": row, "imin": index}, f, ensure_ascii=False, indent=2)
+        return merged_path
@@ -0,0 +1,143 @@
+import os
+import json
+import importlib
+
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+# 작업 종류 -> (모듈, 클래스). 모듈은 작업을 만들 때 불러온다
+TASK_TYPES = {
+    "attendance": ("modules.attendance", "AttendanceTask"),
+    "commenter": ("modules.commenter", "CommenterTask"),
+    "lottery": ("modules.lottery", "LotteryTask"),
+    "imin": ("modules.imin_scraper", "IminScraperTask"),
+    "imin_batch": ("modules.imin_scraper", "IminBatchTask"),
+    "images": ("modules.image_downloader", "ImageDownloaderTask"),
+    "titles": ("modules.title_clicker", "TitleClickerTask")
+}
+
+# 로그인이 필요한 작업의 아이디/비밀번호를 작업 파일에 적지 않았을 때 사용할 환경 변수
+CREDENTIAL_ENV = {"username": "ORBI_USERNAME", "password": "ORBI_PASSWORD"}
+
+def task_class(kind):
+    """
+    작업 종류에 해당하는 Task 클래스
+
+    Args:
+        kind (str): TASK_TYPES의 작업 종류
+
+    Returns:
+        type: Task 하위 클래스
+    """
+    if kind not in TASK_TYPES:
+        raise ValueError(f"알 수 없는 작업 종류: {kind} (가능한 종류: {', '.join(TASK_TYPES)})")
+    module_name, class_name = TASK_TYPES[kind]
+    return getattr(importlib.import_module(module_name), class_name)
+
+def task_resource(kind, params=None):
+    """
+    작업이 사용하는 자원 종류 ("http" 또는 "browser")
+
+    Args:
+        kind (str): TASK_TYPES의 작업 종류
+        params (dict, optional): 작업 인자
+    """
+    return task_class(kind).resource_for(params or {})
+
+def task_repeatable(kind, params=None):
+    """
+    도중에 중단된 작업을 처음부터 다시 실행해도 되는지 (읽기만 하는 작업)
+
+    Args:
+        kind (str): TASK_TYPES의 작업 종류
+        params (dict, optional): 작업 인자
+    """
+    return task_class(kind).repeatable_for(params or {})
+
+def fill_credentials(kind, params):
+    """
+    로그인이 필요한 작업의 아이디/비밀번호 보충 (params를 직접 수정)
+
+    비어 있는 값은 환경 변수(CREDENTIAL_ENV)에서 채우고, 그래도 비밀번호가 없으면
+    저장된 로그인 세션이 있을 때만 빈 비밀번호로 둔다 (로그인 단계에서 세션을 사용).
+
+    Args:
+        kind (str): TASK_TYPES의 작업 종류
+        params (dict): 작업 인자
+
+    Returns:
+        bool: 작업을 실행할 로그인 정보가 있으면 True (로그인이 필요 없는 작업도 True)
+    """
+    from modules.task import BrowserTask
+    if not issubclass(task_class(kind), BrowserTask):
+        return True
+
+    for key, env in CREDENTIAL_ENV.items():
+        if key not in params and os.environ.get(env):
+            params[key] = os.environ[env]
+    if "password" in params:
+        return True
+
+    from utils.session import get_session_manager
+    if params.get("username") and get_session_manager().has_session(params["username"]):
+        params["password"] = ""
+        return True
+    return False
+
+def create_task(kind, params=None):
+    """
+    작업 생성
+
+    Args:
+        kind (str): TASK_TYPES의 작업 종류
+        params (dict, optional): 작업 클래스 생성자에 넘길 인자
+
+    Returns:
+        Task: 생성된 작업
+    """
+    cls = task_class(kind)
+    params = dict(params or {})
+    fill_credentials(kind, params)
+
+    try:
+        return cls(**params)
+    except TypeError as e:
+        raise ValueError(f"{kind} 작업 인자가 올바르지 않습니다: {e}")
+
+def load_job_file(path):
+    """
+    작업 파일(JSON 또는 YAML) 읽기
+
+    파일 내용은 작업 목록이거나 {"jobs": [...]} 형태이며,
+    각 작업은 {"task": 작업 종류, "params": {...}, "name": 표시 이름(선택)} 형태이다.
+
+    Args:
+        path (str): 작업 파일 경로
+
+    Returns:
+        list: [{"task", "params", "name"}] 목록
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.lower().endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ValueError("YAML 작업 파일을 읽으려면 PyYAML이 필요합니다. (pip install pyyaml)")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+
+    jobs = data.get("jobs") if isinstance(data, dict) else data
+    if not isinstance(jobs, list):
+        raise ValueError("작업 파일에는 작업 목록(jobs)이 있어야 합니다.")
+
+    result = []
+    for index, job in enumerate(jobs):
+        if not isinstance(job, dict) or job.get("task") not in TASK_TYPES:
+            raise ValueError(f"{index + 1}번째 작업의 task가 올바르지 않습니다: {job}")
+        result.append({
+            "task": job["task"],
+            "params": job.get("params") or {},
+            "name": job.get("name") or f"{job['task']}#{index + 1}"
+        })
+    return result
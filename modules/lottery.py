@@ -0,0 +1,68 @@
+from modules.task import BrowserTask
+from utils.site import site_url
+
+class LotteryTask(BrowserTask):
+    """
+    복권 구매 작업
+    """
+    name = "복권 구매"
+    repeatable = False  # 다시 실행하면 포인트를 또 사용한다
+
+    def __init__(self, username, password, num_clicks):
+        """
+        Args:
+            username (str): 아이디
+            password (str): 비밀번호
+            num_clicks (int): 복권 클릭 횟수
+        """
+        super().__init__(username, password)
+        self.num_clicks = num_clicks
+
+    def run(self):
+        self.log(f"복권 구매 작업을 시작합니다... (클릭 횟수: {self.num_clicks})")
+        super().run()
+
+    def run_browser(self, browser):
+        driver = browser.get_driver()
+
+        # 복권 페이지로 이동
+        self.log("복권 페이지로 이동 중...")
+        lottery_url = site_url("/amusement/lottery")
+        browser.get(lottery_url)
+        browser.wait_for_selector(".balloon", timeout=10)
+
+        # 복권 클릭
+        success_count = 0
+        self.progress(0, self.num_clicks)
+        for i in range(self.num_clicks):
+            # 이전 클릭 처리가 끝난 뒤 쓰기 간격(설정의 write_interval)만큼 대기
+            if not self.wait_for_write_slot():
+                self.finish(False, "사용자에 의해 중단되었습니다.")
+                return
+
+            try:
+                self.log(f"복권 클릭 {i+1}/{self.num_clicks} 시도 중...")
+
+                # 풍선 요소 찾기
+                balloon = browser.wait_for_selector(".balloon", clickable=True) or \
+                    driver.find_element("class name", "balloon")
+                balloon.click()
+
+                # 결과 알림창이 떠야 클릭이 처리된 것으로 본다
+                alert = browser.wait_for_alert(timeout=5)
+                if alert:
+                    alert_text = alert.text
+                    alert.accept()
+                    success_count += 1
+                    self.log(f"복권 클릭 {i+1}/{self.num_clicks} 성공! ({alert_text})")
+                else:
+                    self.log(f"복권 클릭 {i+1}/{self.num_clicks} 결과를 확인하지 못했습니다. (알림창이 나타나지 않음)")
+
+            except Exception as e:
+                self.log(f"복권 클릭 {i+1}/{self.num_clicks} 실패: {e}")
+            finally:
+                self.write_finished()
+
+            self.progress(i + 1)
+
+        self.finish(True, f"복권 구매 작업이 완료되었습니다. {success_count}/{self.num_clicks}회 성공했습니다.")
@@ -0,0 +1,337 @@
+import os
+import time
+import atexit
+import threading
+
+from modules.jobs import create_task, fill_credentials, task_repeatable, task_resource
+from utils.config import Config
+from utils.job_store import JobStore, JOB_QUEUED, JOB_DONE, JOB_FAILED, JOB_CANCELLED, SECRET_PARAMS
+
+# 실행 중인 작업의 진행 상황을 저장소에 기록하는 최소 간격(초)
+METRICS_SAVE_INTERVAL = 1.0
+
+class Scheduler:
+    """
+    영구 작업 대기열을 처리하는 스케줄러
+
+    전체 동시 실행 수와 자원(브라우저/HTTP)별 동시 실행 수 안에서 우선순위가 높은 작업부터 실행하고,
+    작업이 끝나면 바로 다음 작업을 시작해 설정한 한도까지 계속 채운다.
+    앱 종료로 중단된 작업은 읽기 작업만 다음 실행에서 다시 처리하고, 쓰기 작업(댓글 작성 등)은 진행 상황을 남기고
+    취소 상태로 둬 다시 실행할지 사용자가 정한다 (retry()).
+    진행 상황은 add_listener()로 등록한 콜백에 (이벤트, 작업 ID, 내용) 형태로 전달된다.
+        "added"/"started"/"finished": 작업 딕셔너리, "log": 메시지, "progress": Task.metrics()
+    콜백은 작업 스레드에서 호출되므로 GUI에서는 시그널로 넘겨 받는다.
+    """
+    def __init__(self, store, max_jobs=3, limits=None):
+        """
+        스케줄러 초기화
+
+        Args:
+            store (JobStore): 작업 저장소
+            max_jobs (int): 전체 동시 실행 작업 수
+            limits (dict, optional): {자원 종류: 동시 실행 작업 수}
+        """
+        self.store = store
+        self.max_jobs = max(1, max_jobs)
+        self.limits = limits or {"browser": 1, "http": 2}
+        self.condition = threading.Condition()
+        self.running = {}  # 작업 ID -> (Task, 자원 종류). 작업을 만드는 중이면 Task는 None
+        self.stopping = set()  # 작업을 만드는 중에 취소된 작업 ID
+        self.secrets = {}  # 작업 ID -> 저장하지 않는 인자 (비밀번호 등)
+        self.listeners = []
+        self.thread = None
+        self.closed = False
+
+    def add_listener(self, callback):
+        """
+        진행 상황 콜백 등록
+
+        Args:
+            callback (callable): (이벤트, 작업 ID, 내용)을 받는 함수
+        """
+        self.listeners.append(callback)
+
+    def _notify(self, event, job_id, data=None):
+        """등록된 콜백 호출"""
+        for callback in list(self.listeners):
+            try:
+                callback(event, job_id, data)
+            except Exception as e:
+                print(f"작업 이벤트 처리 중 오류 발생: {e}")
+
+    def start(self):
+        """
+        작업 처리 시작 (이전 실행에서 끝나지 않은 작업은 다시 대기열에 넣음)
+
+        Returns:
+            Scheduler: 자기 자신
+        """
+        with self.condition:
+            if self.thread is not None or self.closed:
+                return self
+            self.store.requeue_running(
+                self._repeatable,
+                "앱이 작업 도중 종료되어 중단되었습니다. 처리한 만큼 확인한 뒤 필요하면 다시 실행하세요."
+            )
+            self.thread = threading.Thread(target=self._loop, name="JobScheduler", daemon=True)
+            self.thread.start()
+        return self
+
+    def _repeatable(self, job):
+        """중단된 작업을 처음부터 다시 실행해도 되는지 (알 수 없는 작업은 다시 대기시켜 실패로 기록되게 함)"""
+        try:
+            return task_repeatable(job["task"], job["params"])
+        except ValueError:
+            return True
+
+    def submit(self, task, params, name=None, priority=0):
+        """
+        작업 예약
+
+        Args:
+            task (str): 작업 종류 (modules.jobs.TASK_TYPES)
+            params (dict): 작업 인자
+            name (str, optional): 표시 이름
+            priority (int): 우선순위 (클수록 먼저 실행)
+
+        Returns:
+            int: 작업 ID
+        """
+        resource = task_resource(task, params)
+        job_id = self.store.add(name or task, task, params, priority=priority, resource=resource)
+        secrets = {key: params[key] for key in SECRET_PARAMS if key in params}
+        with self.condition:
+            if secrets:
+                self.secrets[job_id] = secrets
+            self.condition.notify_all()
+        self._notify("added", job_id, self.store.get(job_id))
+        return job_id
+
+    def cancel(self, job_id):
+        """
+        작업 취소 (대기 중이면 바로 취소, 실행 중이면 중단 요청)
+
+        Args:
+            job_id (int): 작업 ID
+        """
+        # 대기열에서 꺼내는 것과 겹치지 않도록 condition 안에서 취소
+        with self.condition:
+            cancelled = self.store.cancel_queued(job_id)
+            if cancelled:
+                self.secrets.pop(job_id, None)
+            entry = self.running.get(job_id)
+            if entry and entry[0] is None:
+                self.stopping.add(job_id)  # 작업을 만드는 중이면 만든 뒤 시작하지 않는다
+        if cancelled:
+            self._notify("finished", job_id, self.store.get(job_id))
+        elif entry and entry[0]:
+            entry[0].stop()
+
+    def provide_credentials(self, job_id, password):
+        """
+        비밀번호가 없어 멈춘 작업(JOB_NEEDS_CREDENTIALS)에 비밀번호를 넣고 다시 대기열에 추가
+
+        Args:
+            job_id (int): 작업 ID
+            password (str): 비밀번호 (파일에 저장하지 않음)
+
+        Returns:
+            bool: 다시 대기시켰으면 True
+        """
+        with self.condition:
+            if not self.store.requeue_waiting(job_id):
+                return False
+            self.secrets[job_id] = {"password": password}
+            self.condition.notify_all()
+        self._notify("added", job_id, self.store.get(job_id))
+        return True
+
+    def retry(self, job_id):
+        """
+        끝난 작업을 같은 인자로 다시 예약 (비밀번호는 저장하지 않으므로 세션이 없으면 다시 입력받는다)
+
+        Args:
+            job_id (int): 작업 ID
+
+        Returns:
+            int: 새 작업 ID. 작업이 없으면 None
+        """
+        job = self.store.get(job_id)
+        if job is None:
+            return None
+        return self.submit(job["task"], job["params"], name=job["name"], priority=job["priority"])
+
+    def counts(self):
+        """
+        자원별 실행 중인 작업 수
+
+        Returns:
+            dict: {자원 종류: 실행 중인 작업 수}
+        """
+        with self.condition:
+            counts = {resource: 0 for resource in self.limits}
+            for _, resource in self.running.values():
+                counts[resource] = counts.get(resource, 0) + 1
+        return counts
+
+    def _available_resources(self):
+        """지금 작업을 더 시작할 수 있는 자원 종류 (condition 안에서 호출)"""
+        if len(self.running) >= self.max_jobs:
+            return ()
+        counts = {}
+        for _, resource in self.running.values():
+            counts[resource] = counts.get(resource, 0) + 1
+        return tuple(resource for resource, limit in self.limits.items() if counts.get(resource, 0) < limit)
+
+    def _loop(self):
+        """대기열에서 실행할 수 있는 작업을 꺼내 시작하는 루프"""
+        while True:
+            with self.condition:
+                job = None
+                while not self.closed:
+                    job = self.store.next_queued(self._available_resources())
+                    if job:
+                        break
+                    self.condition.wait()
+                if self.closed:
+                    return
+
+                # 상태가 대기 중일 때만 가져온다 (그 사이 취소된 작업은 건너뜀)
+                if not self.store.mark_running(job["id"]):
+                    continue
+                # 작업을 만드는 동안에도 자원 한도에 포함되도록 자리를 먼저 잡는다
+                self.running[job["id"]] = (None, job["resource"])
+                params = dict(job["params"], **self.secrets.pop(job["id"], {}))
+
+            # 로그인 정보 확인과 작업 생성은 세션 복호화, 모듈/설정 로드가 있어 잠금 밖에서 한다
+            # 비밀번호는 저장하지 않으므로 재시작 후에는 환경 변수나 저장된 세션이 없으면 다시 입력받는다
+            task = None
+            error = None
+            try:
+                if fill_credentials(job["task"], params):
+                    task = create_task(job["task"], params)
+            except ValueError as e:
+                error = str(e)
+
+            with self.condition:
+                started = False
+                if self.closed:
+                    self.store.mark_finished(job["id"], JOB_QUEUED, "")  # 시작하기 전이므로 다음 실행에서 다시 처리
+                elif job["id"] in self.stopping:
+                    self.store.mark_finished(job["id"], JOB_CANCELLED, "작업이 취소되었습니다.")
+                elif error:
+                    self.store.mark_finished(job["id"], JOB_FAILED, error)
+                elif task is None:
+                    self.store.mark_needs_credentials(job["id"], "비밀번호를 입력해야 실행할 수 있습니다.")
+                else:
+                    self.running[job["id"]] = (task, job["resource"])
+                    started = True
+                self.stopping.discard(job["id"])
+                if not started:
+                    self.running.pop(job["id"], None)
+                    self.condition.notify_all()
+
+            if not started:
+                self._notify("finished", job["id"], self.store.get(job["id"]))
+                continue
+            self._notify("started", job["id"], self.store.get(job["id"]))
+            threading.Thread(target=self._run, args=(job, task), name=f"Job-{job['id']}", daemon=True).start()
+
+    def _run(self, job, task):
+        """작업 하나 실행 후 결과 기록"""
+        job_id = job["id"]
+        last_saved = [0.0]
+
+        def on_progress(metrics):
+            self._notify("progress", job_id, metrics)
+            # 앱이 도중에 종료되어도 어디까지 처리했는지 남도록 주기적으로 기록
+            now = time.monotonic()
+            if now - last_saved[0] >= METRICS_SAVE_INTERVAL:
+                last_saved[0] = now
+                self.store.update_metrics(job_id, metrics)
+
+        task.log_callback = lambda message: self._notify("log", job_id, message)
+        task.progress_callback = on_progress
+
+        success, message = task.execute()[:2]
+        if self.closed and not success:
+            # 앱 종료로 중단: 읽기 작업은 다음 실행에서 다시 처리하고, 쓰기 작업은 다시 실행할지 사용자가 정한다
+            if task.repeatable_for(job["params"]):
+                state = JOB_QUEUED
+            else:
+                state = JOB_CANCELLED
+                message = f"앱 종료로 중단되었습니다. ({task.done}개 처리)"
+        elif success:
+            state = JOB_DONE
+        elif not task.running:
+            state = JOB_CANCELLED
+        else:
+            state = JOB_FAILED
+        self.store.mark_finished(job_id, state, message, task.metrics())
+
+        with self.condition:
+            self.running.pop(job_id, None)
+            self.condition.notify_all()
+        self._notify("finished", job_id, self.store.get(job_id))
+
+    def shutdown(self, timeout=10):
+        """
+        스케줄러 종료 (실행 중인 작업에 중단 요청 후 끝날 때까지 대기)
+
+        Args:
+            timeout (float): 작업이 끝나기를 기다릴 최대 시간(초)
+        """
+        with self.condition:
+            if self.closed:
+                return
+            self.closed = True
+            tasks = [task for task, _ in self.running.values() if task]
+            self.condition.notify_all()
+        for task in tasks:
+            task.stop()
+
+        deadline = time.monotonic() + timeout
+        with self.condition:
+            while self.running and time.monotonic() < deadline:
+                self.condition.wait(deadline - time.monotonic())
+            finished = not self.running
+        # 아직 끝나지 않은 작업이 결과를 기록할 수 있도록 그때는 저장소를 열어 둔다 (다음 실행에서 다시 대기)
+        if finished:
+            self.store.close()
+
+# 앱 전체에서 공유하는 스케줄러
+_shared_scheduler = None
+_shared_lock = threading.Lock()
+
+def get_scheduler():
+    """
+    공유 스케줄러 반환 (설정 파일의 scheduler 섹션 사용, 처음 호출할 때 시작)
+
+    Returns:
+        Scheduler: 프로세스 전역 스케줄러
+    """
+    global _shared_scheduler
+    with _shared_lock:
+        if _shared_scheduler is None:
+            settings = Config().get("scheduler") or {}
+            db_path = settings.get("db_path", os.path.join("cache", "jobs.sqlite3"))
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            _shared_scheduler = Scheduler(
+                JobStore(db_path),
+                max_jobs=settings.get("max_jobs", 3),
+                limits={
+                    "browser": settings.get("max_browser_jobs", 1),
+                    "http": settings.get("max_http_jobs", 2)
+                }
+            ).start()
+        return _shared_scheduler
+
+def shutdown_scheduler():
+    """공유 스케줄러 종료 (실행 중인 작업은 다음 실행에서 다시 처리)"""
+    global _shared_scheduler
+    with _shared_lock:
+        scheduler, _shared_scheduler = _shared_scheduler, None
+    if scheduler:
+        scheduler.shutdown()
+
+atexit.register(shutdown_scheduler)
@@ -0,0 +1,304 @@
+import time
+import threading
+from contextlib import contextmanager
+
+from utils.config import Config
+from utils.rate_limiter import get_limiter
+
+class CancelToken(threading.Event):
+    """
+    작업 중단 신호
+
+    호출하면 중단 요청 여부를 반환하므로 기존의 should_stop 콜백 자리에 그대로 넘길 수 있고,
+    wait()로 대기하면 중단 요청 즉시 깨어난다.
+    """
+    def __call__(self):
+        return self.is_set()
+
+class Task:
+    """
+    Qt 없이 실행할 수 있는 작업 기반 클래스
+
+    중단 신호, 중단 가능한 대기, 진행률(처리 수, 초당 처리량, 경과/남은 시간)과 단계별 소요 시간을 제공한다.
+    결과는 콜백으로 전달하며, GUI에서는 modules.worker.TaskWorker가 콜백을 시그널로 연결한다.
+    """
+    name = "작업"
+    resource = "http"  # 동시 실행 수를 제한할 자원 종류 ("http" 또는 "browser")
+    repeatable = True  # 도중에 중단된 뒤 처음부터 다시 실행해도 되는지 (읽기만 하는 작업)
+    progress_interval = 0.2  # 진행률 콜백 최소 간격(초)
+
+    def __init__(self):
+        self.cancel = CancelToken()
+        self.log_callback = None  # (메시지)
+        self.progress_callback = None  # (metrics 딕셔너리)
+        self.finished_callback = None  # (성공 여부, 메시지, *추가 결과)
+
+        self.started_at = None
+        self.finished_at = None
+        self.done = 0
+        self.total = None
+        self.phases = []  # [(단계 이름, 소요 시간)]
+        self.result = None
+        self.last_progress = 0.0
+        self.progress_lock = threading.Lock()  # 여러 스레드에서 진행 상황을 갱신할 수 있음
+
+    @classmethod
+    def resource_for(cls, params):
+        """
+        작업 인자로 사용할 자원 종류 판단 (작업을 만들기 전에 스케줄러가 사용)
+
+        Args:
+            params (dict): 작업 인자
+
+        Returns:
+            str: "http" 또는 "browser"
+        """
+        return cls.resource
+
+    @classmethod
+    def repeatable_for(cls, params):
+        """
+        작업 인자로 다시 실행해도 되는 작업인지 판단 (앱 종료로 중단된 작업을 다시 대기시킬 때 스케줄러가 사용)
+
+        Args:
+            params (dict): 작업 인자
+
+        Returns:
+            bool: 처음부터 다시 실행해도 결과가 같으면 True (댓글 작성처럼 쓰기 작업이면 False)
+        """
+        return cls.repeatable
+
+    @property
+    def running(self):
+        """중단 요청이 없으면 True"""
+        return not self.cancel.is_set()
+
+    def stop(self):
+        """작업 중단 요청"""
+        self.cancel.set()
+
+    def wait(self, seconds):
+        """
+        중단 요청이 올 때까지 최대 seconds초 대기
+
+        Args:
+            seconds (float): 대기 시간(초)
+
+        Returns:
+            bool: 끝까지 기다렸으면 True, 중단 요청으로 깨어났으면 False
+        """
+        return not self.cancel.wait(max(0, seconds))
+
+    def log(self, message):
+        """진행 메시지 전달"""
+        if self.log_callback:
+            self.log_callback(message)
+
+    def progress(self, done=None, total=None, step=0):
+        """
+        진행 상황 갱신
+
+        Args:
+            done (int, optional): 지금까지 처리한 수
+            total (int, optional): 전체 수 (알 수 없으면 None)
+            step (int): done 대신 이만큼 증가
+        """
+        with self.progress_lock:
+            if done is not None:
+                self.done = done
+            self.done += step
+            if total is not None:
+                self.total = total
+
+            now = time.monotonic()
+            finished = self.total is not None and self.done >= self.total
+            if not self.progress_callback or (not finished and now - self.last_progress < self.progress_interval):
+                return
+            self.last_progress = now
+            metrics = self.metrics()
+        self.progress_callback(metrics)
+
+    def metrics(self):
+        """
+        현재 진행 지표
+
+        Returns:
+            dict: done, total, elapsed(초), rate(초당 처리 수), eta(남은 시간, 초 또는 None), phases
+        """
+        end = self.finished_at or time.monotonic()
+        elapsed = end - self.started_at if self.started_at else 0.0
+        rate = self.done / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if self.total is not None and rate > 0:
+            eta = max(0.0, (self.total - self.done) / rate)
+        return {
+            "task": self.name,
+            "done": self.done,
+            "total": self.total,
+            "elapsed": elapsed,
+            "rate": rate,
+            "eta": eta,
+            "phases": dict(self.phases)
+        }
+
+    def archive_posts(self, posts, source, imin=None):
+        """
+        수집한 게시글을 게시글 저장소(utils.archive)에 기록 (설정에서 꺼져 있으면 무시)
+
+        저장소 기록에 실패해도 작업은 계속한다.
+
+        Args:
+            posts (list): {"id", "title", "date", "board"} 목록
+            source (str): 출처 (utils.archive.SOURCE_*)
+            imin (str, optional): 작성자 아이민
+        """
+        from utils.archive import get_archive
+        try:
+            archive = get_archive()
+            if archive:
+                archive.add_posts(posts, source, imin)
+        except Exception as e:
+            self.log(f"게시글 저장소 기록 중 오류 발생: {e}")
+
+    @contextmanager
+    def phase(self, name):
+        """
+        단계별 소요 시간 기록
+
+        Args:
+            name (str): 단계 이름
+        """
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.monotonic() - started))
+
+    def timing_summary(self):
+        """소요 시간과 처리량 요약 문자열"""
+        metrics = self.metrics()
+        summary = f"소요 시간 {metrics['elapsed']:.1f}초"
+        if self.done:
+            summary += f", 처리 {self.done}개 (초당 {metrics['rate']:.1f}개)"
+        if self.phases:
+            summary += " / " + ", ".join(f"{name} {seconds:.1f}초" for name, seconds in self.phases)
+        return summary
+
+    def default_extra(self):
+        """완료 콜백에 함께 전달할 추가 결과의 기본값"""
+        return ()
+
+    def finish(self, success, message, *extra):
+        """
+        작업 결과 기록 (처음 한 번만 적용, 콜백은 run()이 끝난 뒤 호출)
+
+        Args:
+            success (bool): 성공 여부
+            message (str): 결과 메시지
+            *extra: 작업별 추가 결과 (결과 파일 경로 등)
+        """
+        if self.result is None:
+            self.result = (success, message) + (extra or self.default_extra())
+
+    def execute(self):
+        """
+        작업 실행 (호출한 스레드에서 끝날 때까지)
+
+        Returns:
+            tuple: (성공 여부, 메시지, *추가 결과)
+        """
+        self.started_at = time.monotonic()
+        try:
+            self.run()
+        except Exception as e:
+            self.finish(False, f"{self.name} 중 오류 발생: {e}")
+        finally:
+            if self.result is None:
+                self.finish(False, "사용자에 의해 중단되었습니다." if not self.running else f"{self.name} 결과가 없습니다.")
+            self.finished_at = time.monotonic()
+            if self.progress_callback:
+                self.progress_callback(self.metrics())  # 마지막 진행 상황
+            self.log(self.timing_summary())
+            if self.finished_callback:
+                self.finished_callback(*self.result)
+        return self.result
+
+    def run(self):
+        """작업 내용 (하위 클래스에서 구현하고 finish()로 결과 전달)"""
+        raise NotImplementedError
+
+class BrowserTask(Task):
+    """
+    브라우저 풀에서 빌린 브라우저로 로그인한 뒤 실행하는 작업
+
+    하위 클래스는 run_browser()만 구현한다. 브라우저는 작업이 끝나면 항상 풀에 반납된다.
+    """
+    resource = "browser"
+    profile = "default"  # utils.browser.BROWSER_PROFILES의 설정 이름
+
+    def __init__(self, username, password):
+        super().__init__()
+        self.username = username
+        self.password = password
+        self.limiter = get_limiter()
+
+        # 쓰기 동작(댓글 작성, 복권 클릭) 사이의 최소 간격(초). 페이지 요청 속도 제한과 따로 적용
+        self.write_interval = (Config().get("network") or {}).get("write_interval", 2.0)
+        self.last_write = None
+
+    def wait_for_write_slot(self):
+        """
+        이전 쓰기 동작이 끝난 뒤 write_interval초가 지날 때까지 대기
+
+        Returns:
+            bool: 계속 진행할 수 있으면 True, 중단 요청을 받았으면 False
+        """
+        if self.last_write is not None:
+            remaining = self.last_write + self.write_interval - time.monotonic()
+            if remaining > 0 and not self.wait(remaining):
+                return False
+        return self.running
+
+    def write_finished(self):
+        """쓰기 동작 완료 시각 기록 (다음 쓰기 동작 간격의 기준)"""
+        self.last_write = time.monotonic()
+
+    def run(self):
+        from utils.browser import get_browser_pool
+        from utils.session import get_session_manager
+
+        pool = get_browser_pool()
+        with self.phase("브라우저 준비"):
+            browser = pool.acquire(limiter=self.limiter, should_stop=self.cancel, profile=self.profile)
+        if browser is None:
+            self.finish(False, "브라우저를 시작할 수 없습니다." if self.running else "사용자에 의해 중단되었습니다.")
+            return
+
+        try:
+            # 로그인 (저장된 세션이 유효하면 로그인 페이지를 거치지 않음)
+            self.log("오르비 로그인 중...")
+            with self.phase("로그인"):
+                logged_in = get_session_manager().login(browser, self.username, self.password)
+            if not logged_in:
+                if not self.password:
+                    self.finish(False, "저장된 로그인 세션이 만료되었습니다. 비밀번호를 입력해 다시 실행해주세요.")
+                else:
+                    self.finish(False, "로그인에 실패했습니다. 아이디와 비밀번호를 확인해주세요.")
+                return
+
+            self.log("로그인 성공!")
+            with self.phase(self.name):
+                self.run_browser(browser)
+        except Exception as e:
+            self.finish(False, f"{self.name} 중 오류 발생: {e}")
+        finally:
+            pool.release(browser)
+
+    def run_browser(self, browser):
+        """
+        로그인된 브라우저로 작업 수행
+
+        Args:
+            browser (Browser): 로그인된 브라우저
+        """
+        raise NotImplementedError
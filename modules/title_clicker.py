@@ -0,0 +1,234 @@
+from modules.task import BrowserTask
+from utils.archive import SOURCE_MY_POSTS
+from utils.prefetch import PagePrefetcher
+from utils.site import site_url
+
+class TitleClickerTask(BrowserTask):
+    """
+    내 게시글 목록 가져오기 / 선택한 게시글 삭제 작업
+
+    post_ids가 없으면 목록을 가져오고, 있으면 해당 게시글을 삭제한다.
+    목록은 페이지마다 posts_page_callback으로 새로 찾은 게시글만 전달한다.
+    """
+    name = "글 삭제"
+    profile = "light"  # 목록 순회 시 이미지/광고를 받지 않는 가벼운 설정
+
+    def __init__(self, username, password, post_ids=None):
+        """
+        Args:
+            username (str): 아이디
+            password (str): 비밀번호
+            post_ids (list, optional): 삭제할 게시글 ID 목록
+        """
+        super().__init__(username, password)
+        self.post_ids = post_ids
+        self.mode = "fetch" if post_ids is None else "delete"
+        self.http_tried = False
+        self.posts_page_callback = None  # (페이지에서 새로 찾은 게시글 목록)
+
+    @classmethod
+    def repeatable_for(cls, params):
+        # 목록 가져오기만 다시 실행해도 된다 (삭제는 이미 지운 게시글을 다시 처리함)
+        return params.get("post_ids") is None
+
+    def run(self):
+        from utils.session import get_session_manager
+
+        if self.mode == "fetch":
+            self.log("내 게시글 목록을 가져오는 중...")
+        else:
+            self.log(f"선택한 게시글 삭제 작업을 시작합니다... (게시글 수: {len(self.post_ids)})")
+
+        # 저장된 세션이 유효하면 브라우저 없이 HTTP로 목록 가져오기
+        if self.mode == "fetch":
+            cookies = get_session_manager().valid_cookies(self.username, self.password)
+            if cookies:
+                self.http_tried = True
+                with self.phase("목록 수집 (HTTP)"):
+                    posts = self.extract_posts_http(cookies)
+                if posts is not None:
+                    self.finish_fetch(posts)
+                    return
+                self.log("HTTP로 게시글 목록을 가져오지 못했습니다. 브라우저로 다시 시도합니다.")
+
+        super().run()
+
+    def run_browser(self, browser):
+        from utils.session import get_session_manager
+
+        if self.mode == "fetch":
+            # 내 게시글 목록 가져오기 (로그인한 세션으로 HTTP 우선, 실패하면 브라우저)
+            posts = None
+            cookies = None if self.http_tried else get_session_manager().valid_cookies(self.username, self.password)
+            if cookies:
+                posts = self.extract_posts_http(cookies)
+            if posts is None:
+                posts = self.extract_posts(browser)
+            self.finish_fetch(posts)
+        else:
+            self.delete_posts(browser)
+
+    def delete_posts(self, browser):
+        """선택한 게시글 삭제"""
+        driver = browser.get_driver()
+        success_count = 0
+        total = len(self.post_ids)
+        self.progress(0, total)
+        for i, post_id in enumerate(self.post_ids):
+            if not self.running:
+                self.finish(False, "사용자에 의해 중단되었습니다.")
+                return
+
+            # 게시글 수정 페이지로 이동
+            modify_url = site_url(f"/modify/{post_id}")
+            try:
+                self.log(f"게시글 삭제 {i+1}/{total} 시도 중... (ID: {post_id})")
+
+                if not browser.get(modify_url):
+                    # 중단 요청 또는 이동 실패 시 이전 페이지에서 삭제하지 않도록 건너뜀
+                    self.log(f"게시글 삭제 {i+1}/{total} 건너뜀: 페이지 이동 실패")
+                    continue
+
+                # 삭제 버튼 찾기
+                delete_button = browser.wait_for_selector(".button.delete", clickable=True) or \
+                    driver.find_element("css selector", ".button.delete")
+                delete_button.click()
+
+                # 확인 알림창 처리
+                alert = browser.wait_for_alert(timeout=3)
+                if alert:
+                    alert.accept()
+                    self.log("삭제 확인 알림창 처리 완료")
+                else:
+                    self.log("삭제 확인 알림창이 나타나지 않았습니다.")
+
+                # 삭제되면 다른 페이지로 이동하므로 삭제 버튼이 문서에서 사라져야 성공
+                if browser.wait_for_staleness(delete_button, timeout=10):
+                    success_count += 1
+                    self.log(f"게시글 삭제 {i+1}/{total} 성공!")
+                else:
+                    self.log(f"게시글 삭제 {i+1}/{total} 결과를 확인하지 못했습니다. (수정 페이지에 그대로 있음)")
+
+            except Exception as e:
+                # 요소 찾기/클릭 오류는 서버 오류가 아니므로 속도 제한기에 알리지 않는다 (시간 초과는 Browser.get에서 처리)
+                self.log(f"게시글 삭제 {i+1}/{total} 실패: {e}")
+            finally:
+                self.progress(i + 1)
+
+        self.finish(True, f"게시글 삭제 작업이 완료되었습니다. {success_count}/{total}개 삭제 성공!")
+
+    def finish_fetch(self, posts):
+        """게시글 목록 가져오기 결과 전달"""
+        if posts:
+            self.finish(True, f"{len(posts)}개의 게시글을 찾았습니다.")
+        else:
+            self.finish(False, "게시글을 찾을 수 없습니다.")
+
+    def add_page(self, posts, page_posts):
+        """페이지에서 찾은 게시글 추가"""
+        posts.extend(page_posts)
+        self.progress(len(posts))
+        self.archive_posts(page_posts, SOURCE_MY_POSTS)
+        if self.posts_page_callback:
+            self.posts_page_callback(page_posts)
+
+    def extract_posts_http(self, cookies):
+        """
+        로그인 쿠키를 넣은 HTTP 세션으로 내 게시글 목록 추출
+
+        다음 페이지들을 미리 병렬로 요청하고, 각 페이지의 목록은 HTML에서 한 번에 파싱한다.
+
+        Args:
+            cookies (list): 로그인 쿠키 목록
+
+        Returns:
+            list: {"title", "id"} 목록. 첫 페이지부터 목록을 가져올 수 없으면 None
+        """
+        import requests
+        from utils.http import HttpClient, RequestCancelled
+        from utils.parser import parse_post_items
+        from utils.session import get_session_manager
+
+        posts = []
+        client = HttpClient(limiter=self.limiter, should_stop=self.cancel)
+        get_session_manager().apply_to_session(client.session, cookies)
+        base_url = site_url("/my/post")
+        prefetcher = PagePrefetcher(
+            lambda page, should_stop: client.get(base_url, params={"page": page}, should_stop=should_stop),
+            should_stop=self.cancel
+        )
+
+        try:
+            for page, response in prefetcher:
+                # 로그인 페이지로 이동되었거나 목록이 없으면 중지
+                items = None
+                if response.status_code == 200 and "login" not in response.url:
+                    items = parse_post_items(response.text)
+                if items is None:
+                    if page == 1:
+                        return None
+                    self.log(f"페이지 {page}에서 게시글 목록을 찾을 수 없습니다.")
+                    break
+
+                page_posts = [{"title": item["title"], "id": item["id"]} for item in items if item["title"] and item["id"]]
+                if not page_posts:
+                    self.log("더 이상 유효한 게시글이 없습니다.")
+                    break
+
+                self.add_page(posts, page_posts)
+                self.log(f"페이지 {page}에서 {len(page_posts)}개의 게시글을 찾았습니다.")
+
+                if not self.running:
+                    break
+        except RequestCancelled:
+            pass  # 속도 제한 대기 중 중단 요청
+        except requests.RequestException as e:
+            if not posts:
+                return None
+            self.log(f"게시글 목록 요청 중 오류: {e}")
+        finally:
+            prefetcher.close()  # 진행 중인 요청이 끝난 뒤에 클라이언트를 닫는다
+            client.close()
+
+        return posts
+
+    def extract_posts(self, browser):
+        """내 게시글 목록 추출 (브라우저 사용)"""
+        posts = []
+        page = 1
+
+        while self.running:
+            self.log(f"게시글 목록 페이지 {page} 가져오는 중...")
+            browser.get(site_url(f"/my/post?page={page}"))
+            browser.wait_for_selector("ul.post-list > li", timeout=3)
+
+            try:
+                # 게시글 목록의 제목/링크를 한 번에 가져오기
+                post_elements = browser.extract_all("ul.post-list > li", {"title": ("p.title", "text"), "href": ("a", "href")})
+
+                if not post_elements:
+                    self.log(f"페이지 {page}에서 게시글을 찾을 수 없습니다.")
+                    break
+
+                page_posts = []
+                for post in post_elements:
+                    title = post["title"]
+                    href = post["href"]
+                    post_id = href.split('/')[-1] if href else None
+
+                    if title and post_id:
+                        page_posts.append({"title": title, "id": post_id})
+                        self.log(f"게시글 발견: {title} (ID: {post_id})")
+
+                self.add_page(posts, page_posts)
+                if not page_posts:
+                    self.log("더 이상 유효한 게시글이 없습니다.")
+                    break
+
+                page += 1
+
+            except Exception as e:
+                self.log(f"게시글 목록 처리 중 오류: {e}")
+                break
+
+        return posts
@@ -0,0 +1,37 @@
+from PyQt5.QtCore import QThread, pyqtSignal
+
+class TaskWorker(QThread):
+    """
+    modules.task.Task를 별도 스레드에서 실행하고 콜백을 Qt 시그널로 전달하는 워커
+
+    작업마다 완료 시그널의 형태가 다르면 하위 클래스에서 finished_signal을 다시 정의한다.
+    """
+    update_signal = pyqtSignal(str)
+    progress_signal = pyqtSignal(dict)  # Task.metrics() 결과
+    finished_signal = pyqtSignal(bool, str)
+
+    def __init__(self, task):
+        """
+        워커 초기화
+
+        Args:
+            task (Task): 실행할 작업
+        """
+        super().__init__()
+        self.task = task
+        task.log_callback = self.update_signal.emit
+        task.progress_callback = self.progress_signal.emit
+        task.finished_callback = self.finished_signal.emit
+
+    @property
+    def running(self):
+        """중단 요청이 없으면 True"""
+        return self.task.running
+
+    def run(self):
+        """스레드 실행"""
+        self.task.execute()
+
+    def stop(self):
+        """작업 중단 (대기 중인 작업도 바로 깨어남)"""
+        self.task.stop()
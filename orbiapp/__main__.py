@@ -0,0 +1,8 @@
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from orbiapp.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
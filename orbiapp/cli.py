@@ -0,0 +1,275 @@
+"""
+오르비 프로젝트 명령줄 실행기
+
+GUI(PyQt5) 없이 modules의 작업을 그대로 실행한다. 서버에서 스크립트로 돌리거나 작업 하나만 따로 측정할 때 사용한다.
+
+사용법:
+    python -m orbiapp imin 1234 -o titles.txt --format jsonl    # 아이민 글 제목 추출
+    python -m orbiapp imin-batch 1234 5678 --file ids.txt --dir out --merge   # 여러 아이민 일괄 추출
+    python -m orbiapp images --minutes 30 --dir ./images         # 이미지 다운로드
+    python -m orbiapp run jobs.json                              # 작업 파일(JSON/YAML)의 작업을 차례로 실행
+    python -m orbiapp search 공부법 --imin 1234                   # 저장된 게시글 제목 검색 (사이트 요청 없음)
+    python -m orbiapp tasks                                      # 작업 종류와 인자 목록
+
+진행 상황은 한 줄에 하나의 JSON 객체로 표준 출력에 기록한다 (--text면 사람이 읽는 형식).
+    {"event": "log", "job": ..., "message": ...}
+    {"event": "progress", "job": ..., "done": ..., "total": ..., "elapsed": ..., "rate": ..., "eta": ...}
+    {"event": "finished", "job": ..., "success": ..., "message": ..., "result": [...], "metrics": {...}}
+로그인이 필요한 작업은 작업 파일의 username/password 또는 ORBI_USERNAME/ORBI_PASSWORD 환경 변수를 사용한다.
+"""
+import sys
+import json
+import time
+import inspect
+import argparse
+import threading
+
+from modules.jobs import TASK_TYPES, create_task, load_job_file, task_class
+
+class Reporter:
+    """작업 진행 상황을 표준 출력에 기록 (여러 스레드에서 호출 가능)"""
+    def __init__(self, text=False, quiet=False, stream=None):
+        """
+        Args:
+            text (bool): JSON 대신 사람이 읽는 형식으로 출력
+            quiet (bool): 로그 메시지는 출력하지 않음 (진행률/결과만)
+            stream (file, optional): 출력 대상 (기본: 표준 출력)
+        """
+        self.text = text
+        self.quiet = quiet
+        self.stream = stream or sys.stdout
+        self.lock = threading.Lock()
+
+    def emit(self, event, job, **fields):
+        """
+        이벤트 한 줄 출력
+
+        Args:
+            event (str): "log", "progress", "finished"
+            job (str): 작업 이름
+            **fields: 이벤트 내용
+        """
+        if event == "log" and self.quiet:
+            return
+        if self.text:
+            line = self._format_text(event, job, fields)
+        else:
+            line = json.dumps(dict(event=event, job=job, time=round(time.time(), 3), **fields), ensure_ascii=False)
+        with self.lock:
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+    def _format_text(self, event, job, fields):
+        """사람이 읽는 형식의 한 줄"""
+        if event == "log":
+            return f"[{job}] {fields['message']}"
+        if event == "progress":
+            total = f"/{fields['total']}" if fields.get("total") is not None else ""
+            eta = f", 남은 시간 {fields['eta']:.0f}초" if fields.get("eta") is not None else ""
+            return f"[{job}] 진행 {fields['done']}{total} (초당 {fields['rate']:.1f}개, 경과 {fields['elapsed']:.1f}초{eta})"
+        mark = "완료" if fields["success"] else "실패"
+        return f"[{job}] {mark}: {fields['message']}"
+
+def run_job(job, reporter):
+    """
+    작업 하나 실행 (Ctrl+C를 누르면 작업에 중단 요청 후 정리가 끝날 때까지 대기)
+
+    Args:
+        job (dict): {"task", "params", "name"}
+        reporter (Reporter): 진행 상황 출력기
+
+    Returns:
+        tuple: (성공 여부, 사용자 중단 여부)
+    """
+    name = job["name"]
+    try:
+        task = create_task(job["task"], job["params"])
+    except ValueError as e:
+        reporter.emit("finished", name, success=False, message=str(e), result=[], metrics={})
+        return False, False
+
+    task.log_callback = lambda message: reporter.emit("log", name, message=message)
+    task.progress_callback = lambda metrics: reporter.emit(
+        "progress", name, **{key: metrics[key] for key in ("done", "total", "elapsed", "rate", "eta")}
+    )
+    task.finished_callback = lambda success, message, *extra: reporter.emit(
+        "finished", name, success=success, message=message, result=list(extra), metrics=task.metrics()
+    )
+
+    # 작업은 별도 스레드에서 실행하고, 메인 스레드는 Ctrl+C를 받을 수 있도록 짧게 나눠 대기
+    # (Thread.join()이 Ctrl+C로 중단되면 스레드가 끝난 것으로 잘못 판단될 수 있어 완료 이벤트로 기다린다)
+    done = threading.Event()
+
+    def execute():
+        try:
+            task.execute()
+        finally:
+            done.set()
+
+    threading.Thread(target=execute, name=f"Task-{name}", daemon=True).start()
+    interrupted = False
+    while not done.is_set():
+        try:
+            done.wait(0.2)
+        except KeyboardInterrupt:
+            if not interrupted:
+                interrupted = True
+                reporter.emit("log", name, message="중단 요청을 받았습니다. 정리 후 종료합니다...")
+            task.stop()
+
+    return bool(task.result and task.result[0]), interrupted
+
+def run_jobs(jobs, reporter):
+    """
+    작업을 차례로 실행
+
+    Returns:
+        int: 종료 코드 (모두 성공하면 0, 실패가 있으면 1, 사용자 중단은 130)
+    """
+    failed = False
+    for job in jobs:
+        success, interrupted = run_job(job, reporter)
+        if interrupted:
+            return 130
+        failed = failed or not success
+    return 1 if failed else 0
+
+def print_tasks():
+    """작업 종류와 생성자 인자 출력"""
+    for kind in TASK_TYPES:
+        cls = task_class(kind)
+        signature = str(inspect.signature(cls.__init__)).replace("(self, ", "(").replace("(self)", "()")
+        summary = (cls.__doc__ or "").strip().splitlines()[0]
+        print(f"{kind:<12}{cls.__name__}{signature}  # {summary}")
+
+def search_archive(args, parser):
+    """게시글 저장소 검색 결과를 한 줄에 하나씩 출력 (JSON 또는 --text면 제목만)"""
+    from utils.archive import get_archive
+
+    if not args.query and not args.imin:
+        parser.error("찾을 문자열이나 --imin을 지정하세요.")
+    archive = get_archive()
+    if archive is None:
+        parser.error("설정에서 게시글 저장소(archive)가 꺼져 있습니다.")
+
+    if args.query:
+        posts = archive.search(args.query, imin=args.imin, limit=args.limit)
+    else:
+        posts = archive.posts_by_imin(args.imin, since=args.since, until=args.until, limit=args.limit)
+    for post in posts:
+        if args.text:
+            print(f"{post['posted_at'] or '':<12}{post['id']:<16}{post['title']}")
+        else:
+            print(json.dumps(post, ensure_ascii=False))
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m orbiapp", description="오르비 프로젝트 작업을 GUI 없이 실행")
+    parser.add_argument("--base-url", help="사이트 주소 (기본: ORBI_BASE_URL 또는 실제 사이트)")
+    parser.add_argument("--rate", type=float, help="호스트별 초당 요청 수 (기본: 설정 파일 값)")
+    parser.add_argument("--text", action="store_true", help="JSON 대신 사람이 읽는 형식으로 출력")
+    parser.add_argument("--quiet", action="store_true", help="로그 메시지 없이 진행률과 결과만 출력")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="작업 파일의 작업을 차례로 실행")
+    run_parser.add_argument("job_file", help="작업 파일 (JSON 또는 YAML)")
+
+    imin_parser = commands.add_parser("imin", help="아이민 글 제목 추출")
+    imin_parser.add_argument("imin_number", help="아이민 번호")
+    imin_parser.add_argument("-o", "--output", help="저장할 텍스트 파일 (기본: <아이민>_log.txt)")
+    imin_parser.add_argument("--format", choices=["jsonl", "csv"], help="함께 저장할 형식")
+    imin_parser.add_argument("--resume", action="store_true", help="중단된 작업 이어서 추출")
+    imin_parser.add_argument("--prefetch", type=int, default=4, help="동시에 미리 가져올 페이지 수")
+
+    batch_parser = commands.add_parser("imin-batch", help="여러 아이민 글 제목 일괄 추출")
+    batch_parser.add_argument("imin_numbers", nargs="*", help="아이민 번호 목록")
+    batch_parser.add_argument("--file", help="아이민 번호 목록 파일 (쉼표/줄바꿈 구분, # 뒤는 주석)")
+    batch_parser.add_argument("--dir", default="imin_titles", help="결과를 저장할 폴더")
+    batch_parser.add_argument("--format", choices=["jsonl", "csv"], help="함께 저장할 형식")
+    batch_parser.add_argument("--merge", action="store_true", help="모든 결과를 색인이 있는 하나의 파일로 합치기")
+    batch_parser.add_argument("--resume", action="store_true", help="완료된 아이민은 건너뛰고 중단된 아이민은 이어서 추출")
+    batch_parser.add_argument("--workers", type=int, default=4, help="동시에 처리할 아이민 수")
+    batch_parser.add_argument("--prefetch", type=int, default=2, help="아이민별로 동시에 미리 가져올 페이지 수")
+
+    images_parser = commands.add_parser("images", help="게시글 이미지 다운로드")
+    images_parser.add_argument("--minutes", type=float, default=10, help="실행 시간(분)")
+    images_parser.add_argument("--dir", default="orbi_images", help="다운로드 폴더")
+    images_parser.add_argument("--mode", choices=["http", "browser"], default="http", help="페이지 수집 방식")
+    images_parser.add_argument("--workers", type=int, default=4, help="동시 다운로드 수")
+    images_parser.add_argument("--no-resume", action="store_true", help="이전 방문 기록을 지우고 처음부터 시작")
+
+    search_parser = commands.add_parser("search", help="게시글 저장소에서 제목 검색 (사이트 요청 없음)")
+    search_parser.add_argument("query", nargs="?", default="", help="찾을 문자열 (생략하면 --imin의 게시글 전체)")
+    search_parser.add_argument("--imin", help="이 아이민의 게시글만")
+    search_parser.add_argument("--since", help="이 날짜 이후 (YYYY-MM-DD, --imin만 지정한 경우)")
+    search_parser.add_argument("--until", help="이 날짜까지 (YYYY-MM-DD, --imin만 지정한 경우)")
+    search_parser.add_argument("--limit", type=int, default=100, help="최대 개수")
+
+    commands.add_parser("tasks", help="작업 종류와 인자 목록 출력")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.command == "tasks":
+        print_tasks()
+        return 0
+    if args.command == "search":
+        return search_archive(args, parser)
+
+    if args.base_url:
+        from utils.site import set_base_url
+        set_base_url(args.base_url)
+    if args.rate:
+        from utils.rate_limiter import RateLimiter, set_limiter
+        set_limiter(RateLimiter(rate=args.rate, burst=max(1, int(args.rate))))
+
+    if args.command == "run":
+        try:
+            jobs = load_job_file(args.job_file)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+    elif args.command == "imin":
+        jobs = [{"task": "imin", "name": f"imin-{args.imin_number}", "params": {
+            "imin_number": args.imin_number,
+            "save_path": args.output or f"{args.imin_number}_log.txt",
+            "extra_format": args.format,
+            "resume": args.resume,
+            "prefetch_depth": args.prefetch
+        }}]
+    elif args.command == "imin-batch":
+        imin_numbers = list(args.imin_numbers)
+        if args.file:
+            from modules.imin_scraper import load_imin_numbers
+            try:
+                imin_numbers += load_imin_numbers(args.file)
+            except OSError as e:
+                parser.error(str(e))
+        if not imin_numbers:
+            parser.error("아이민 번호나 --file을 지정하세요.")
+        jobs = [{"task": "imin_batch", "name": "imin-batch", "params": {
+            "imin_numbers": imin_numbers,
+            "output_dir": args.dir,
+            "extra_format": args.format,
+            "merge": args.merge,
+            "resume": args.resume,
+            "workers": args.workers,
+            "prefetch_depth": args.prefetch
+        }}]
+    else:
+        jobs = [{"task": "images", "name": "images", "params": {
+            "run_time_minutes": args.minutes,
+            "download_dir": args.dir,
+            "fetch_mode": args.mode,
+            "download_workers": args.workers,
+            "resume": not args.no_resume
+        }}]
+
+    # 진행 상황만 표준 출력에 남도록 다른 모듈의 print() 출력은 표준 오류로 보낸다
+    reporter = Reporter(text=args.text, quiet=args.quiet, stream=sys.stdout)
+    sys.stdout = sys.stderr
+    try:
+        return run_jobs(jobs, reporter)
+    finally:
+        sys.stdout = reporter.stream
@@ -0,0 +1,64 @@
+from collections import deque
+from datetime import datetime
+
+from PyQt5.QtWidgets import QPlainTextEdit
+from PyQt5.QtCore import QTimer
+
+class LogPanel(QPlainTextEdit):
+    """
+    모든 기능 위젯이 공유하는 실행 로그 표시 영역
+
+    메시지가 올 때마다 화면을 갱신하지 않고 interval_ms마다 모아서 한 번에 추가한다.
+    화면에는 최근 max_lines줄만 남기며, 파일 로그(Logger)도 같은 주기로 모아서 기록한다.
+    """
+    def __init__(self, parent=None, logger=None, max_lines=5000, interval_ms=100):
+        """
+        로그 영역 초기화
+
+        Args:
+            parent (QWidget, optional): 부모 위젯
+            logger (Logger, optional): 메시지를 함께 기록할 로거
+            max_lines (int): 화면에 남길 최대 줄 수
+            interval_ms (int): 화면 갱신 주기(ms)
+        """
+        super().__init__(parent)
+        self.logger = logger
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(max_lines)
+
+        # 다음 갱신 때 표시할 줄 (오래된 줄부터 버려지는 고정 크기 버퍼)
+        self.pending = deque(maxlen=max_lines)
+        self.pending_log = []
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.flush)
+
+    def log(self, message):
+        """
+        메시지 추가 (다음 갱신 때 표시)
+
+        Args:
+            message (str): 로그 메시지
+        """
+        self.pending.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
+        self.pending_log.append(message)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        """모아 둔 메시지를 화면과 로거에 기록"""
+        if self.pending:
+            self.appendPlainText("\n".join(self.pending))
+            self.pending.clear()
+
+        messages, self.pending_log = self.pending_log, []
+        if self.logger:
+            for message in messages:
+                self.logger.info(message)
+
+    def clear(self):
+        """화면과 표시 대기 중인 메시지 지우기 (로거에는 기록)"""
+        self.pending.clear()
+        super().clear()
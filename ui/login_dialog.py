@@ -3,8 +3,6 @@ from PyQt5.QtCore import Qt, QThread, pyqtSignal
 import os
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils.browser import Browser
-from utils.logger import Logger
 
 class LoginWidget(QWidget):
     """
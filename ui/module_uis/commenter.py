@@ -1,114 +1,22 @@
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QSpinBox, QGroupBox, QMessageBox
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtCore import Qt
 import os
 import sys
-import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.commenter import CommenterTask
+from modules.worker import TaskWorker
+from ui.log_panel import LogPanel
 from ui.login_dialog import LoginWidget
-from utils.browser import Browser
+from ui.task_progress import TaskProgress
 from utils.logger import Logger
 
-class CommenterWorker(QThread):
+class CommenterWorker(TaskWorker):
     """
-    댓글 작성 작업을 수행하는 워커 스레드
+    댓글 작성 작업(modules.commenter.CommenterTask)을 실행하는 워커 스레드
     """
-    update_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal(bool, str)
-    
     def __init__(self, username, password, article_number, comment_text, num_comments):
-        super().__init__()
-        self.username = username
-        self.password = password
-        self.article_number = article_number
-        self.comment_text = comment_text
-        self.num_comments = num_comments
-        self.logger = Logger()
-        self.running = True
-        
-    def run(self):
-        """스레드 실행"""
-        self.update_signal.emit("댓글 작성 작업을 시작합니다...")
-        
-        # 브라우저 초기화
-        browser = Browser(headless=True)
-        if not browser.start():
-            self.finished_signal.emit(False, "브라우저를 시작할 수 없습니다.")
-            return
-            
-        try:
-            driver = browser.get_driver()
-            
-            # 로그인
-            self.update_signal.emit("오르비 로그인 중...")
-            browser.get("https://login.orbi.kr/login")
-            
-            # 아이디/비밀번호 입력
-            driver.find_element("name", "username").send_keys(self.username)
-            driver.find_element("name", "password").send_keys(self.password)
-            driver.find_element("name", "password").send_keys("\n")
-            time.sleep(3)
-            
-            # 로그인 성공 확인
-            if "login" in driver.current_url:
-                self.finished_signal.emit(False, "로그인에 실패했습니다. 아이디와 비밀번호를 확인해주세요.")
-                browser.stop()
-                return
-                
-            self.update_signal.emit("로그인 성공!")
-            
-            # 게시글 페이지로 이동
-            article_url = f"https://orbi.kr/{self.article_number}"
-            self.update_signal.emit(f"게시글 페이지로 이동 중... ({article_url})")
-            browser.get(article_url)
-            time.sleep(3)
-            
-            # 게시글 존재 확인
-            if "error" in driver.current_url or "404" in driver.page_source:
-                self.finished_signal.emit(False, f"게시글을 찾을 수 없습니다: {self.article_number}")
-                browser.stop()
-                return
-                
-            # 댓글 작성
-            for i in range(self.num_comments):
-                if not self.running:
-                    self.finished_signal.emit(False, "사용자에 의해 중단되었습니다.")
-                    browser.stop()
-                    return
-                    
-                try:
-                    self.update_signal.emit(f"댓글 {i+1}/{self.num_comments} 작성 중...")
-                    
-                    # 댓글 입력 필드 찾기
-                    comment_area = driver.find_element("name", "content")
-                    comment_area.click()
-                    time.sleep(1)
-                    
-                    # 댓글 내용 입력
-                    comment_area.clear()
-                    comment_area.send_keys(self.comment_text)
-                    
-                    # 게시 버튼 클릭
-                    post_button = driver.find_element("class name", "send")
-                    post_button.click()
-                    
-                    self.update_signal.emit(f"댓글 {i+1}/{self.num_comments} 작성 완료!")
-                    time.sleep(2)  # 댓글 작성 간 딜레이
-                    
-                except Exception as e:
-                    self.update_signal.emit(f"댓글 {i+1}/{self.num_comments} 작성 중 오류 발생: {e}")
-                    time.sleep(2)  # 오류 발생 시 잠시 대기
-                    
-            self.finished_signal.emit(True, f"{self.num_comments}개의 댓글 작성이 완료되었습니다.")
-                
-        except Exception as e:
-            self.finished_signal.emit(False, f"댓글 작성 중 오류 발생: {e}")
-        finally:
-            browser.stop()
-            
-    def stop(self):
-        """작업 중단"""
-        self.running = False
+        super().__init__(CommenterTask(username, password, article_number, comment_text, num_comments))
 
 class CommenterWidget(QWidget):
     """
@@ -174,11 +82,13 @@ class CommenterWidget(QWidget):
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
         
+        # 진행률 표시 영역
+        self.progress_panel = TaskProgress()
+        
         # 로그 출력 영역
         log_group = QGroupBox("실행 로그")
         log_layout = QVBoxLayout()
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogPanel(logger=self.logger)  # 100ms마다 모아서 표시, 최근 줄만 유지
         log_layout.addWidget(self.log_text)
         log_group.setLayout(log_layout)
         
@@ -186,15 +96,14 @@ class CommenterWidget(QWidget):
         layout.addWidget(login_group)
         layout.addWidget(settings_group)
         layout.addLayout(button_layout)
+        layout.addWidget(self.progress_panel)
         layout.addWidget(log_group)
         
         self.setLayout(layout)
         
     def log(self, message):
         """로그 출력"""
-        from datetime import datetime
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.logger.info(message)
+        self.log_text.log(message)
         
     def start_commenter(self):
         """댓글 작성 시작"""
@@ -236,6 +145,7 @@ class CommenterWidget(QWidget):
             num_comments
         )
         self.worker.update_signal.connect(self.log)
+        self.progress_panel.attach(self.worker)
         self.worker.finished_signal.connect(self.on_commenter_finished)
         self.worker.start()
         
@@ -1,175 +1,25 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QSpinBox, QGroupBox, QMessageBox, QFileDialog
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QSpinBox, QComboBox, QCheckBox, QGroupBox, QMessageBox, QFileDialog
+from PyQt5.QtCore import Qt, pyqtSignal
 import os
 import sys
-import time
-import requests
-from datetime import datetime
-
-# 최신 Selenium API를 위한 import 추가
-from selenium.webdriver.common.by import By
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.image_downloader import ImageDownloaderTask
+from modules.worker import TaskWorker
+from ui.log_panel import LogPanel
 from ui.login_dialog import LoginWidget
-from utils.browser import Browser
+from ui.task_progress import TaskProgress
 from utils.logger import Logger
 
-class ImageDownloaderWorker(QThread):
+class ImageDownloaderWorker(TaskWorker):
     """
-    이미지 다운로드 작업을 수행하는 워커 스레드
+    이미지 다운로드 작업(modules.image_downloader.ImageDownloaderTask)을 실행하는 워커 스레드
     """
-    update_signal = pyqtSignal(str)
     finished_signal = pyqtSignal(bool, str, str)  # 성공 여부, 메시지, 다운로드 폴더 경로
     
-    def __init__(self, run_time_minutes, download_dir):
-        super().__init__()
-        self.run_time_minutes = run_time_minutes
-        self.download_dir = download_dir
-        self.logger = Logger()
-        self.running = True
-        
-    def run(self):
-        """스레드 실행"""
-        self.update_signal.emit(f"이미지 다운로드 작업을 시작합니다... (실행 시간: {self.run_time_minutes}분)")
-        
-        # 다운로드 디렉토리 생성
-        os.makedirs(self.download_dir, exist_ok=True)
-        
-        # 브라우저 초기화
-        browser = Browser(headless=True)
-        if not browser.start():
-            self.finished_signal.emit(False, "브라우저를 시작할 수 없습니다.", self.download_dir)
-            return
-            
-        try:
-            driver = browser.get_driver()
-            base_url = "https://orbi.kr/list"
-            visited_urls = set()
-            start_time = time.time()
-            run_time_seconds = self.run_time_minutes * 60
-            downloaded_count = 0
-            
-            while time.time() - start_time < run_time_seconds and self.running:
-                # 남은 시간 계산
-                elapsed_seconds = time.time() - start_time
-                remaining_seconds = run_time_seconds - elapsed_seconds
-                remaining_minutes = remaining_seconds / 60
-                
-                self.update_signal.emit(f"게시글 목록 페이지 로드 중... (남은 시간: {remaining_minutes:.1f}분)")
-                browser.get(base_url)
-                time.sleep(2)
-                
-                try:
-                    # 게시글 목록에서 공지사항이 아닌 항목 찾기
-                    # 수정: find_elements_by_css_selector -> find_elements(By.CSS_SELECTOR, ...)
-                    articles = driver.find_elements(By.CSS_SELECTOR, "ul.post-list > li:not(.notice)")
-                    
-                    if not articles:
-                        self.update_signal.emit("게시글을 찾을 수 없습니다. 다시 시도합니다.")
-                        time.sleep(3)
-                        continue
-                        
-                    self.update_signal.emit(f"{len(articles)}개의 게시글을 찾았습니다.")
-                    
-                    # 각 게시글 처리
-                    for article in articles:
-                        if not self.running or time.time() - start_time >= run_time_seconds:
-                            break
-                            
-                        try:
-                            # 게시글 링크 가져오기
-                            # 수정: find_element_by_css_selector -> find_element(By.CSS_SELECTOR, ...)
-                            title_element = article.find_element(By.CSS_SELECTOR, "p.title a")
-                            link = title_element.get_attribute("href")
-                            
-                            # 이미 방문한 링크 건너뛰기
-                            if not link or link in visited_urls:
-                                continue
-                                
-                            visited_urls.add(link)  # 방문 표시
-                            
-                            # 게시글 방문
-                            self.update_signal.emit(f"게시글 방문 중: {link}")
-                            browser.get(link)
-                            time.sleep(2)
-                            
-                            # 게시글 내용에서 이미지 찾기
-                            # Selenium explicit wait을 사용하여 content-wrap 및 이미지 로드 대기
-                            from selenium.webdriver.support.ui import WebDriverWait
-                            from selenium.webdriver.support import expected_conditions as EC
-
-                            content_wrap = WebDriverWait(driver, 10).until(
-                                EC.presence_of_element_located((By.CLASS_NAME, "content-wrap"))
-                            )
-
-                            WebDriverWait(driver, 5).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, ".content-wrap img"))
-                            )
-
-                            images = content_wrap.find_elements(By.TAG_NAME, "img")
-                            
-                            if not images:
-                                self.update_signal.emit("이미지가 없는 게시글입니다.")
-                                continue
-                                
-                            self.update_signal.emit(f"{len(images)}개의 이미지를 찾았습니다.")
-                            
-                            # 이미지 다운로드
-                            article_id = link.split('/')[-1]
-                            for idx, img in enumerate(images):
-                                if not self.running:
-                                    break
-                                    
-                                img_url = img.get_attribute("src")
-                                if not img_url:
-                                    continue
-                                    
-                                # 이미지 파일명 생성
-                                file_ext = img_url.split('.')[-1].split('?')[0]
-                                if file_ext not in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
-                                    file_ext = 'jpg'  # 기본 확장자
-                                    
-                                save_path = os.path.join(self.download_dir, f"{article_id}_img{idx}.{file_ext}")
-                                
-                                # 이미지 다운로드
-                                try:
-                                    self.update_signal.emit(f"이미지 다운로드 중: {img_url}")
-                                    response = requests.get(img_url, stream=True)
-                                    
-                                    if response.status_code == 200:
-                                        with open(save_path, 'wb') as file:
-                                            for chunk in response.iter_content(1024):
-                                                file.write(chunk)
-                                        self.update_signal.emit(f"이미지 저장 완료: {save_path}")
-                                        downloaded_count += 1
-                                    else:
-                                        self.update_signal.emit(f"이미지 다운로드 실패. 상태 코드: {response.status_code}")
-                                except Exception as e:
-                                    self.update_signal.emit(f"이미지 다운로드 중 오류 발생: {e}")
-                                    
-                        except Exception as e:
-                            self.update_signal.emit(f"게시글 처리 중 오류 발생: {e}")
-                            
-                except Exception as e:
-                    self.update_signal.emit(f"게시글 목록 처리 중 오류 발생: {e}")
-                    
-                # 잠시 대기 후 다시 목록 페이지로
-                time.sleep(2)
-                
-            # 작업 완료
-            if not self.running:
-                self.finished_signal.emit(False, "사용자에 의해 중단되었습니다.", self.download_dir)
-            else:
-                self.finished_signal.emit(True, f"이미지 다운로드 작업이 완료되었습니다. 총 {downloaded_count}개의 이미지를 다운로드했습니다.", self.download_dir)
-                
-        except Exception as e:
-            self.finished_signal.emit(False, f"이미지 다운로드 중 오류 발생: {e}", self.download_dir)
-        finally:
-            browser.stop()
-            
-    def stop(self):
-        """작업 중단"""
-        self.running = False
+    def __init__(self, run_time_minutes, download_dir, fetch_mode="http", download_workers=4, per_host_limit=2,
+                 resume=True):
+        super().__init__(ImageDownloaderTask(run_time_minutes, download_dir, fetch_mode, download_workers, per_host_limit, resume))
 
 class ImageDownloaderWidget(QWidget):
     """
@@ -209,8 +59,34 @@ class ImageDownloaderWidget(QWidget):
         path_layout.addWidget(self.path_input)
         path_layout.addWidget(self.browse_button)
         
+        # 수집 방식
+        mode_layout = QHBoxLayout()
+        mode_label = QLabel("수집 방식:")
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItem("HTTP (필요 시 브라우저 사용)", "http")
+        self.mode_combo.addItem("브라우저만 사용", "browser")
+        mode_layout.addWidget(mode_label)
+        mode_layout.addWidget(self.mode_combo)
+        
+        # 동시 다운로드 수
+        workers_layout = QHBoxLayout()
+        workers_label = QLabel("동시 다운로드 수:")
+        self.workers_spinbox = QSpinBox()
+        self.workers_spinbox.setMinimum(1)
+        self.workers_spinbox.setMaximum(16)
+        self.workers_spinbox.setValue(4)
+        workers_layout.addWidget(workers_label)
+        workers_layout.addWidget(self.workers_spinbox)
+        
         settings_layout.addLayout(time_layout)
         settings_layout.addLayout(path_layout)
+        settings_layout.addLayout(mode_layout)
+        settings_layout.addLayout(workers_layout)
+        
+        # 이어서 받기
+        self.resume_checkbox = QCheckBox("이전 작업 이어서 하기 (방문한 게시글 건너뛰기)")
+        self.resume_checkbox.setChecked(True)
+        settings_layout.addWidget(self.resume_checkbox)
         settings_group.setLayout(settings_layout)
         
         # 실행 버튼
@@ -223,17 +99,20 @@ class ImageDownloaderWidget(QWidget):
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
         
+        # 진행률 표시 영역
+        self.progress_panel = TaskProgress()
+        
         # 로그 출력 영역
         log_group = QGroupBox("실행 로그")
         log_layout = QVBoxLayout()
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogPanel(logger=self.logger)  # 100ms마다 모아서 표시, 최근 줄만 유지
         log_layout.addWidget(self.log_text)
         log_group.setLayout(log_layout)
         
         # 레이아웃 구성
         layout.addWidget(settings_group)
         layout.addLayout(button_layout)
+        layout.addWidget(self.progress_panel)
         layout.addWidget(log_group)
         
         self.setLayout(layout)
@@ -244,8 +123,7 @@ class ImageDownloaderWidget(QWidget):
         
     def log(self, message):
         """로그 출력"""
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.logger.info(message)
+        self.log_text.log(message)
         
     def browse_save_path(self):
         """저장 경로 선택"""
@@ -265,6 +143,11 @@ class ImageDownloaderWidget(QWidget):
         # 실행 시간 확인
         run_time_minutes = self.time_spinbox.value()
         
+        # 수집 방식 및 동시 다운로드 수 확인
+        fetch_mode = self.mode_combo.currentData()
+        download_workers = self.workers_spinbox.value()
+        resume = self.resume_checkbox.isChecked()
+        
         # 저장 경로 확인
         download_dir = self.path_input.text().strip()
         if not download_dir:
@@ -281,8 +164,15 @@ class ImageDownloaderWidget(QWidget):
         self.log(f"이미지 다운로드 작업 준비 중... (실행 시간: {run_time_minutes}분, 저장 경로: {download_dir})")
         
         # 워커 스레드 시작
-        self.worker = ImageDownloaderWorker(run_time_minutes, download_dir)
+        self.worker = ImageDownloaderWorker(
+            run_time_minutes,
+            download_dir,
+            fetch_mode,
+            download_workers,
+            resume=resume
+        )
         self.worker.update_signal.connect(self.log)
+        self.progress_panel.attach(self.worker)
         self.worker.finished_signal.connect(self.on_downloader_finished)
         self.worker.start()
         
@@ -1,113 +1,32 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QFileDialog, QGroupBox, QMessageBox
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QSpinBox, QComboBox, QCheckBox, QFileDialog, QGroupBox, QMessageBox
+from PyQt5.QtCore import Qt, pyqtSignal
 import os
 import sys
-import time
-import requests
-from bs4 import BeautifulSoup
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.imin_scraper import IminScraperTask, IminBatchTask, parse_imin_numbers, load_imin_numbers
+from modules.worker import TaskWorker
+from ui.log_panel import LogPanel
+from ui.task_progress import TaskProgress
 from utils.logger import Logger
 
-class IminScraperWorker(QThread):
+class IminScraperWorker(TaskWorker):
     """
-    아이민 글 제목 추출 작업을 수행하는 워커 스레드
+    아이민 글 제목 추출 작업(modules.imin_scraper.IminScraperTask)을 실행하는 워커 스레드
     """
-    update_signal = pyqtSignal(str)
     finished_signal = pyqtSignal(bool, str, str)  # 성공 여부, 메시지, 결과 파일 경로
     
-    def __init__(self, imin_number, save_path):
-        super().__init__()
-        self.imin_number = imin_number
-        self.save_path = save_path
-        self.logger = Logger()
-        self.running = True
-        
-    def run(self):
-        """스레드 실행"""
-        self.update_signal.emit(f"아이민 {self.imin_number}의 글 제목 추출 작업을 시작합니다...")
-        
-        try:
-            base_url = "https://orbi.kr/search"
-            page = 1
-            titles = []
-            
-            while self.running:
-                # 검색 파라미터 구성
-                params = {
-                    "type": "imin",
-                    "q": self.imin_number,
-                    "page": page
-                }
-                
-                self.update_signal.emit(f"페이지 {page} 가져오는 중...")
-                
-                # GET 요청
-                response = requests.get(base_url, params=params)
-                if response.status_code != 200:
-                    self.update_signal.emit(f"페이지 {page} 가져오기 실패. HTTP 상태 코드: {response.status_code}")
-                    break
-                    
-                # HTML 파싱
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # 'post-list' 클래스 컨테이너 찾기
-                post_list = soup.find("ul", class_="post-list")
-                if not post_list:
-                    self.update_signal.emit("더 이상 'post-list'를 찾을 수 없습니다. 중지합니다.")
-                    break
-                    
-                # 모든 리스트 아이템 찾기
-                list_items = post_list.find_all("li")
-                
-                # 'notice' 클래스가 있는 첫 3개 항목 제외
-                valid_posts = [
-                    li for li in list_items
-                    if "notice" not in li.get("class", [])
-                ][3:]  # 첫 3개 유효 게시물 건너뛰기
-                
-                # 'title' 클래스가 있는 <p> 태그에서 제목 추출
-                page_titles = [
-                    post.find("p", class_="title").text.strip()
-                    for post in valid_posts
-                    if post.find("p", class_="title")
-                ]
-                
-                # 유효한 제목이 없으면 중지
-                if not page_titles:
-                    self.update_signal.emit("이 페이지에서 제목을 찾을 수 없습니다. 중지합니다.")
-                    break
-                    
-                # 빈 제목 필터링하고 리스트에 추가
-                titles.extend([title for title in page_titles if title])
-                self.update_signal.emit(f"페이지 {page}에서 {len(page_titles)}개의 제목을 찾았습니다.")
-                
-                page += 1  # 다음 페이지로 이동
-                time.sleep(1)  # 요청 간 딜레이
-                
-                # 중단 요청 확인
-                if not self.running:
-                    self.update_signal.emit("사용자에 의해 중단되었습니다.")
-                    break
-                    
-            # 결과를 텍스트 파일로 저장
-            if titles:
-                try:
-                    with open(self.save_path, "w", encoding="utf-8") as file:
-                        file.write("\n".join(titles))
-                    self.update_signal.emit(f"총 {len(titles)}개의 제목을 {self.save_path}에 저장했습니다.")
-                    self.finished_signal.emit(True, f"총 {len(titles)}개의 제목 추출 완료", self.save_path)
-                except Exception as e:
-                    self.finished_signal.emit(False, f"파일 저장 중 오류 발생: {e}", "")
-            else:
-                self.finished_signal.emit(False, "추출된 제목이 없습니다.", "")
-                
-        except Exception as e:
-            self.finished_signal.emit(False, f"제목 추출 중 오류 발생: {e}", "")
-            
-    def stop(self):
-        """작업 중단"""
-        self.running = False
+    def __init__(self, imin_number, save_path, extra_format=None, resume=False, prefetch_depth=4):
+        super().__init__(IminScraperTask(imin_number, save_path, extra_format, resume, prefetch_depth))
+
+class IminBatchWorker(TaskWorker):
+    """
+    여러 아이민 일괄 추출 작업(modules.imin_scraper.IminBatchTask)을 실행하는 워커 스레드
+    """
+    finished_signal = pyqtSignal(bool, str, str)  # 성공 여부, 메시지, 통합 파일 또는 출력 폴더 경로
+
+    def __init__(self, imin_numbers, output_dir, extra_format=None, merge=False, resume=False, workers=4, prefetch_depth=2):
+        super().__init__(IminBatchTask(imin_numbers, output_dir, extra_format, merge, resume, workers, prefetch_depth))
 
 class IminScraperWidget(QWidget):
     """
@@ -130,8 +49,12 @@ class IminScraperWidget(QWidget):
         imin_layout = QHBoxLayout()
         imin_label = QLabel("아이민 번호:")
         self.imin_input = QLineEdit()
+        self.imin_input.setPlaceholderText("여러 개는 쉼표로 구분 (일괄 추출)")
+        self.imin_file_button = QPushButton("목록 파일")
+        self.imin_file_button.clicked.connect(self.browse_imin_file)
         imin_layout.addWidget(imin_label)
         imin_layout.addWidget(self.imin_input)
+        imin_layout.addWidget(self.imin_file_button)
         
         # 저장 경로
         path_layout = QHBoxLayout()
@@ -144,8 +67,47 @@ class IminScraperWidget(QWidget):
         path_layout.addWidget(self.path_input)
         path_layout.addWidget(self.browse_button)
         
+        # 추가 저장 형식
+        format_layout = QHBoxLayout()
+        format_label = QLabel("추가 저장 형식:")
+        self.format_combo = QComboBox()
+        self.format_combo.addItem("없음 (제목 텍스트만)", None)
+        self.format_combo.addItem("JSONL (게시글 ID, 날짜, 게시판 포함)", "jsonl")
+        self.format_combo.addItem("CSV (게시글 ID, 날짜, 게시판 포함)", "csv")
+        format_layout.addWidget(format_label)
+        format_layout.addWidget(self.format_combo)
+        
+        # 미리 가져올 페이지 수
+        prefetch_layout = QHBoxLayout()
+        prefetch_label = QLabel("동시 요청 페이지 수:")
+        self.prefetch_spinbox = QSpinBox()
+        self.prefetch_spinbox.setMinimum(1)
+        self.prefetch_spinbox.setMaximum(8)
+        self.prefetch_spinbox.setValue(4)
+        prefetch_layout.addWidget(prefetch_label)
+        prefetch_layout.addWidget(self.prefetch_spinbox)
+        
+        # 일괄 추출 설정 (아이민을 여러 개 입력한 경우)
+        batch_layout = QHBoxLayout()
+        batch_label = QLabel("일괄 추출 동시 아이민 수:")
+        self.workers_spinbox = QSpinBox()
+        self.workers_spinbox.setMinimum(1)
+        self.workers_spinbox.setMaximum(8)
+        self.workers_spinbox.setValue(4)
+        self.merge_checkbox = QCheckBox("하나의 파일로 합치기 (색인 포함)")
+        batch_layout.addWidget(batch_label)
+        batch_layout.addWidget(self.workers_spinbox)
+        batch_layout.addWidget(self.merge_checkbox)
+        
+        # 이어서 추출
+        self.resume_checkbox = QCheckBox("중단된 작업 이어서 추출 (마지막 페이지 다음부터)")
+        
         settings_layout.addLayout(imin_layout)
         settings_layout.addLayout(path_layout)
+        settings_layout.addLayout(format_layout)
+        settings_layout.addLayout(prefetch_layout)
+        settings_layout.addLayout(batch_layout)
+        settings_layout.addWidget(self.resume_checkbox)
         settings_group.setLayout(settings_layout)
         
         # 실행 버튼
@@ -158,26 +120,27 @@ class IminScraperWidget(QWidget):
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
         
+        # 진행률 표시 영역
+        self.progress_panel = TaskProgress()
+        
         # 로그 출력 영역
         log_group = QGroupBox("실행 로그")
         log_layout = QVBoxLayout()
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogPanel(logger=self.logger)  # 100ms마다 모아서 표시, 최근 줄만 유지
         log_layout.addWidget(self.log_text)
         log_group.setLayout(log_layout)
         
         # 레이아웃 구성
         layout.addWidget(settings_group)
         layout.addLayout(button_layout)
+        layout.addWidget(self.progress_panel)
         layout.addWidget(log_group)
         
         self.setLayout(layout)
         
     def log(self, message):
         """로그 출력"""
-        from datetime import datetime
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.logger.info(message)
+        self.log_text.log(message)
         
     def browse_save_path(self):
         """저장 경로 선택"""
@@ -196,13 +159,35 @@ class IminScraperWidget(QWidget):
                 file_path += '.txt'
             self.path_input.setText(file_path)
         
+    def browse_imin_file(self):
+        """아이민 번호 목록 파일 불러오기"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "아이민 목록 파일 선택",
+            os.path.expanduser("~/Desktop"),
+            "텍스트 파일 (*.txt *.csv);;모든 파일 (*)"
+        )
+        if not file_path:
+            return
+        try:
+            imin_numbers = load_imin_numbers(file_path)
+        except OSError as e:
+            QMessageBox.warning(self, "경고", f"파일을 읽을 수 없습니다.\n{e}")
+            return
+        self.imin_input.setText(", ".join(imin_numbers))
+        self.log(f"{os.path.basename(file_path)}에서 아이민 {len(imin_numbers)}개를 불러왔습니다.")
+        
     def start_scraper(self):
         """제목 추출 시작"""
         # 아이민 번호 확인
-        imin_number = self.imin_input.text().strip()
-        if not imin_number:
+        imin_numbers = parse_imin_numbers(self.imin_input.text())
+        if not imin_numbers:
             QMessageBox.warning(self, "경고", "아이민 번호를 입력해주세요.")
             return
+        if len(imin_numbers) > 1:
+            self.start_batch(imin_numbers)
+            return
+        imin_number = imin_numbers[0]
             
         # 저장 경로 확인
         save_path = self.path_input.text().strip()
@@ -220,8 +205,43 @@ class IminScraperWidget(QWidget):
         self.log(f"아이민 {imin_number}의 글 제목 추출 작업 준비 중...")
         
         # 워커 스레드 시작
-        self.worker = IminScraperWorker(imin_number, save_path)
+        self.worker = IminScraperWorker(
+            imin_number,
+            save_path,
+            extra_format=self.format_combo.currentData(),
+            resume=self.resume_checkbox.isChecked(),
+            prefetch_depth=self.prefetch_spinbox.value()
+        )
+        self.worker.update_signal.connect(self.log)
+        self.progress_panel.attach(self.worker)
+        self.worker.finished_signal.connect(self.on_scraper_finished)
+        self.worker.start()
+        
+    def start_batch(self, imin_numbers):
+        """여러 아이민 일괄 추출 시작 (저장 경로의 폴더에 아이민별 파일 저장)"""
+        save_path = self.path_input.text().strip()
+        output_dir = os.path.dirname(save_path) if save_path else os.path.join(os.path.expanduser("~"), "imin_titles")
+        
+        # UI 상태 변경
+        self.start_button.setEnabled(False)
+        self.stop_button.setEnabled(True)
+        
+        # 로그 초기화
+        self.log_text.clear()
+        self.log(f"아이민 {len(imin_numbers)}개의 일괄 추출 작업 준비 중... (저장 폴더: {output_dir})")
+        
+        # 워커 스레드 시작
+        self.worker = IminBatchWorker(
+            imin_numbers,
+            output_dir,
+            extra_format=self.format_combo.currentData(),
+            merge=self.merge_checkbox.isChecked(),
+            resume=self.resume_checkbox.isChecked(),
+            workers=self.workers_spinbox.value(),
+            prefetch_depth=self.prefetch_spinbox.value()
+        )
         self.worker.update_signal.connect(self.log)
+        self.progress_panel.attach(self.worker)
         self.worker.finished_signal.connect(self.on_scraper_finished)
         self.worker.start()
         
@@ -0,0 +1,255 @@
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QSpinBox, QFileDialog, QGroupBox, QMessageBox, QInputDialog, QLineEdit, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+from PyQt5.QtCore import Qt, pyqtSignal
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.jobs import load_job_file
+from modules.scheduler import get_scheduler
+from ui.log_panel import LogPanel
+from utils.job_store import JOB_QUEUED, JOB_FAILED, JOB_CANCELLED, JOB_NEEDS_CREDENTIALS
+from utils.logger import Logger
+
+# 상태 표시 이름
+STATE_LABELS = {
+    "queued": "대기",
+    "running": "실행 중",
+    "done": "완료",
+    "failed": "실패",
+    "cancelled": "취소됨",
+    "needs_credentials": "비밀번호 필요"
+}
+
+# 표 열: ID, 이름, 종류, 우선순위, 상태, 진행, 초당 처리, 경과
+COLUMNS = ["ID", "이름", "종류", "우선순위", "상태", "진행", "초당 처리", "경과"]
+COL_ID, COL_NAME, COL_TASK, COL_PRIORITY, COL_STATE, COL_DONE, COL_RATE, COL_ELAPSED = range(len(COLUMNS))
+
+class JobsWidget(QWidget):
+    """
+    예약 작업 목록 위젯 (작업 파일 불러오기, 취소, 상태/처리 속도 표시)
+    """
+    # 스케줄러 이벤트를 GUI 스레드로 넘기는 시그널: 이벤트, 작업 ID, 내용
+    job_signal = pyqtSignal(str, int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.logger = Logger()
+        self.scheduler = get_scheduler()
+        self.rows = {}  # 작업 ID -> 표 행 번호
+        self.names = {}  # 작업 ID -> 표시 이름
+        self.rates = {}  # 실행 중인 작업 ID -> 초당 처리 수
+        self.initUI()
+
+        for job in self.scheduler.store.list():
+            self.update_job(job)
+        self.update_summary()
+
+        self.job_signal.connect(self.on_job_event)
+        self.scheduler.add_listener(self.job_signal.emit)
+
+    def initUI(self):
+        layout = QVBoxLayout()
+
+        # 작업 추가
+        add_group = QGroupBox("작업 추가")
+        add_layout = QHBoxLayout()
+        priority_label = QLabel("우선순위:")
+        self.priority_spinbox = QSpinBox()
+        self.priority_spinbox.setRange(-10, 10)
+        self.priority_spinbox.setValue(0)
+        self.load_button = QPushButton("작업 파일 불러오기")
+        self.load_button.clicked.connect(self.load_jobs)
+        add_layout.addWidget(priority_label)
+        add_layout.addWidget(self.priority_spinbox)
+        add_layout.addWidget(self.load_button)
+        add_layout.addStretch()
+        add_group.setLayout(add_layout)
+
+        # 작업 목록
+        list_group = QGroupBox("작업 목록")
+        list_layout = QVBoxLayout()
+        limits = self.scheduler.limits
+        self.limit_label = QLabel(
+            f"동시 실행: 최대 {self.scheduler.max_jobs}개 "
+            f"(브라우저 {limits.get('browser', 0)}개, HTTP {limits.get('http', 0)}개)"
+        )
+        self.summary_label = QLabel()
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.horizontalHeader().setSectionResizeMode(COL_NAME, QHeaderView.Stretch)
+
+        button_layout = QHBoxLayout()
+        self.cancel_button = QPushButton("선택한 작업 취소")
+        self.cancel_button.clicked.connect(self.cancel_selected)
+        self.clear_button = QPushButton("끝난 작업 정리")
+        self.clear_button.clicked.connect(self.clear_finished)
+        self.password_button = QPushButton("비밀번호 입력")
+        self.password_button.setToolTip("앱을 다시 시작해 비밀번호가 필요한 작업에 비밀번호를 넣고 다시 실행")
+        self.password_button.clicked.connect(self.enter_password)
+        self.retry_button = QPushButton("다시 실행")
+        self.retry_button.setToolTip("실패하거나 중단된 작업을 같은 설정으로 다시 예약 (이미 처리한 부분도 다시 실행됨)")
+        self.retry_button.clicked.connect(self.retry_selected)
+        button_layout.addWidget(self.cancel_button)
+        button_layout.addWidget(self.retry_button)
+        button_layout.addWidget(self.password_button)
+        button_layout.addWidget(self.clear_button)
+
+        list_layout.addWidget(self.limit_label)
+        list_layout.addWidget(self.summary_label)
+        list_layout.addWidget(self.table)
+        list_layout.addLayout(button_layout)
+        list_group.setLayout(list_layout)
+
+        # 로그 출력 영역
+        log_group = QGroupBox("실행 로그")
+        log_layout = QVBoxLayout()
+        self.log_text = LogPanel(logger=self.logger)
+        log_layout.addWidget(self.log_text)
+        log_group.setLayout(log_layout)
+
+        # 레이아웃 구성
+        layout.addWidget(add_group)
+        layout.addWidget(list_group, 2)
+        layout.addWidget(log_group, 1)
+
+        self.setLayout(layout)
+
+    def log(self, message):
+        """로그 출력"""
+        self.log_text.log(message)
+
+    def load_jobs(self):
+        """작업 파일을 골라 작업 예약"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "작업 파일 선택",
+            os.path.expanduser("~"),
+            "작업 파일 (*.json *.yaml *.yml)"
+        )
+        if not file_path:
+            return
+
+        try:
+            jobs = load_job_file(file_path)
+            priority = self.priority_spinbox.value()
+            for job in jobs:
+                self.scheduler.submit(job["task"], job["params"], name=job["name"], priority=priority)
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "경고", f"작업 파일을 불러올 수 없습니다.\n{e}")
+            return
+        self.log(f"{os.path.basename(file_path)}에서 작업 {len(jobs)}개를 예약했습니다. (우선순위 {priority})")
+
+    def selected_job_ids(self):
+        """선택한 행의 작업 ID 목록"""
+        rows = {index.row() for index in self.table.selectionModel().selectedRows()}
+        return [int(self.table.item(row, COL_ID).text()) for row in sorted(rows)]
+
+    def cancel_selected(self):
+        """선택한 작업 취소 (실행 중이면 중단 요청)"""
+        for job_id in self.selected_job_ids():
+            self.scheduler.cancel(job_id)
+
+    def selected_job_ids_in(self, *states):
+        """선택한 작업 중 지정한 상태인 작업 ID 목록"""
+        labels = {STATE_LABELS[state] for state in states}
+        return [job_id for job_id in self.selected_job_ids()
+                if self.table.item(self.rows[job_id], COL_STATE).text() in labels]
+
+    def retry_selected(self):
+        """선택한 실패/취소 작업을 같은 설정으로 다시 예약"""
+        job_ids = self.selected_job_ids_in(JOB_FAILED, JOB_CANCELLED)
+        if not job_ids:
+            QMessageBox.information(self, "알림", "실패하거나 취소된 작업을 선택해주세요.")
+            return
+
+        reply = QMessageBox.question(
+            self, "다시 실행",
+            f"작업 {len(job_ids)}개를 처음부터 다시 실행합니다.\n"
+            "댓글 작성·복권 구매·글 삭제 작업은 이미 처리한 부분도 다시 실행됩니다. 계속하시겠습니까?",
+            QMessageBox.Yes | QMessageBox.No
+        )
+        if reply != QMessageBox.Yes:
+            return
+        for job_id in job_ids:
+            self.scheduler.retry(job_id)
+
+    def enter_password(self):
+        """선택한 작업 중 비밀번호가 필요한 작업에 비밀번호를 넣어 다시 대기열에 추가"""
+        job_ids = self.selected_job_ids_in(JOB_NEEDS_CREDENTIALS)
+        if not job_ids:
+            QMessageBox.information(self, "알림", "비밀번호가 필요한 작업을 선택해주세요.")
+            return
+
+        password, ok = QInputDialog.getText(self, "비밀번호 입력", "오르비 비밀번호:", QLineEdit.Password)
+        if not ok or not password:
+            return
+        for job_id in job_ids:
+            self.scheduler.provide_credentials(job_id, password)
+
+    def clear_finished(self):
+        """끝난 작업을 저장소와 표에서 삭제"""
+        self.scheduler.store.clear_finished()
+        self.table.setRowCount(0)
+        self.rows.clear()
+        for job in self.scheduler.store.list():
+            self.update_job(job)
+
+    def on_job_event(self, event, job_id, data):
+        """스케줄러 이벤트 처리 (GUI 스레드)"""
+        if event == "log":
+            self.log(f"[{self.names.get(job_id, job_id)}] {data}")
+        elif event == "progress":
+            self.update_metrics(job_id, data)
+            self.rates[job_id] = data["rate"]
+        elif data:
+            self.update_job(data)
+            if event == "started":
+                self.log(f"[{data['name']}] 작업을 시작합니다.")
+            elif event == "finished":
+                self.rates.pop(job_id, None)
+                self.log(f"[{data['name']}] {STATE_LABELS.get(data['state'], data['state'])}: {data['message']}")
+        self.update_summary()
+
+    def update_job(self, job):
+        """작업 행 추가 또는 갱신"""
+        job_id = job["id"]
+        self.names[job_id] = job["name"]
+        row = self.rows.get(job_id)
+        if row is None:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self.rows[job_id] = row
+            for column in range(len(COLUMNS)):
+                self.table.setItem(row, column, QTableWidgetItem(""))
+
+        self.table.item(row, COL_ID).setText(str(job_id))
+        self.table.item(row, COL_NAME).setText(job["name"])
+        self.table.item(row, COL_TASK).setText(job["task"])
+        self.table.item(row, COL_PRIORITY).setText(str(job["priority"]))
+        self.table.item(row, COL_STATE).setText(STATE_LABELS.get(job["state"], job["state"]))
+        if job["metrics"]:
+            self.update_metrics(job_id, job["metrics"])
+
+    def update_metrics(self, job_id, metrics):
+        """작업 행의 진행/처리 속도/경과 시간 갱신"""
+        row = self.rows.get(job_id)
+        if row is None:
+            return
+        done = str(metrics["done"]) if metrics.get("total") is None else f"{metrics['done']}/{metrics['total']}"
+        self.table.item(row, COL_DONE).setText(done)
+        self.table.item(row, COL_RATE).setText(f"{metrics['rate']:.1f}")
+        self.table.item(row, COL_ELAPSED).setText(f"{metrics['elapsed']:.0f}초")
+
+    def update_summary(self):
+        """실행/대기 작업 수와 전체 처리 속도 표시"""
+        counts = self.scheduler.counts()
+        running = sum(counts.values())
+        queued = sum(1 for row in range(self.table.rowCount())
+                     if self.table.item(row, COL_STATE).text() == STATE_LABELS[JOB_QUEUED])
+        self.summary_label.setText(
+            f"실행 중 {running}개 (브라우저 {counts.get('browser', 0)}, HTTP {counts.get('http', 0)}) · "
+            f"대기 {queued}개 · 전체 처리 속도 초당 {sum(self.rates.values()):.1f}개"
+        )
@@ -1,108 +1,22 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QTextEdit, QSpinBox, QGroupBox, QMessageBox
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QSpinBox, QGroupBox, QMessageBox
+from PyQt5.QtCore import Qt
 import os
 import sys
-import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.lottery import LotteryTask
+from modules.worker import TaskWorker
+from ui.log_panel import LogPanel
 from ui.login_dialog import LoginWidget
-from utils.browser import Browser
+from ui.task_progress import TaskProgress
 from utils.logger import Logger
 
-class LotteryWorker(QThread):
+class LotteryWorker(TaskWorker):
     """
-    복권 구매 작업을 수행하는 워커 스레드
+    복권 구매 작업(modules.lottery.LotteryTask)을 실행하는 워커 스레드
     """
-    update_signal = pyqtSignal(str)
-    finished_signal = pyqtSignal(bool, str)
-    
     def __init__(self, username, password, num_clicks):
-        super().__init__()
-        self.username = username
-        self.password = password
-        self.num_clicks = num_clicks
-        self.logger = Logger()
-        self.running = True
-        
-    def run(self):
-        """스레드 실행"""
-        self.update_signal.emit(f"복권 구매 작업을 시작합니다... (클릭 횟수: {self.num_clicks})")
-        
-        # 브라우저 초기화
-        browser = Browser(headless=True)
-        if not browser.start():
-            self.finished_signal.emit(False, "브라우저를 시작할 수 없습니다.")
-            return
-            
-        try:
-            driver = browser.get_driver()
-            
-            # 로그인
-            self.update_signal.emit("오르비 로그인 중...")
-            browser.get("https://login.orbi.kr/login")
-            
-            # 아이디/비밀번호 입력
-            driver.find_element("name", "username").send_keys(self.username)
-            driver.find_element("name", "password").send_keys(self.password)
-            driver.find_element("name", "password").send_keys("\n")
-            time.sleep(3)
-            
-            # 로그인 성공 확인
-            if "login" in driver.current_url:
-                self.finished_signal.emit(False, "로그인에 실패했습니다. 아이디와 비밀번호를 확인해주세요.")
-                browser.stop()
-                return
-                
-            self.update_signal.emit("로그인 성공!")
-            
-            # 복권 페이지로 이동
-            self.update_signal.emit("복권 페이지로 이동 중...")
-            browser.get("https://orbi.kr/amusement/lottery")
-            time.sleep(3)
-            
-            # 복권 클릭
-            success_count = 0
-            for i in range(self.num_clicks):
-                if not self.running:
-                    self.finished_signal.emit(False, "사용자에 의해 중단되었습니다.")
-                    browser.stop()
-                    return
-                    
-                try:
-                    self.update_signal.emit(f"복권 클릭 {i+1}/{self.num_clicks} 시도 중...")
-                    
-                    # 풍선 요소 찾기
-                    balloon = driver.find_element("class name", "balloon")
-                    balloon.click()
-                    time.sleep(1)
-                    
-                    # 알림창 처리
-                    try:
-                        alert = driver.switch_to.alert
-                        alert_text = alert.text
-                        alert.accept()
-                        self.update_signal.emit(f"알림창 처리: {alert_text}")
-                    except:
-                        pass
-                        
-                    success_count += 1
-                    self.update_signal.emit(f"복권 클릭 {i+1}/{self.num_clicks} 성공!")
-                    time.sleep(2)  # 클릭 간 딜레이
-                    
-                except Exception as e:
-                    self.update_signal.emit(f"복권 클릭 {i+1}/{self.num_clicks} 실패: {e}")
-                    time.sleep(2)  # 오류 발생 시 잠시 대기
-                    
-            self.finished_signal.emit(True, f"복권 구매 작업이 완료되었습니다. {success_count}/{self.num_clicks}회 성공했습니다.")
-                
-        except Exception as e:
-            self.finished_signal.emit(False, f"복권 구매 중 오류 발생: {e}")
-        finally:
-            browser.stop()
-            
-    def stop(self):
-        """작업 중단"""
-        self.running = False
+        super().__init__(LotteryTask(username, password, num_clicks))
 
 class LotteryWidget(QWidget):
     """
@@ -151,11 +65,13 @@ class LotteryWidget(QWidget):
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
         
+        # 진행률 표시 영역
+        self.progress_panel = TaskProgress()
+        
         # 로그 출력 영역
         log_group = QGroupBox("실행 로그")
         log_layout = QVBoxLayout()
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogPanel(logger=self.logger)  # 100ms마다 모아서 표시, 최근 줄만 유지
         log_layout.addWidget(self.log_text)
         log_group.setLayout(log_layout)
         
@@ -163,15 +79,14 @@ class LotteryWidget(QWidget):
         layout.addWidget(login_group)
         layout.addWidget(settings_group)
         layout.addLayout(button_layout)
+        layout.addWidget(self.progress_panel)
         layout.addWidget(log_group)
         
         self.setLayout(layout)
         
     def log(self, message):
         """로그 출력"""
-        from datetime import datetime
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.logger.info(message)
+        self.log_text.log(message)
         
     def start_lottery(self):
         """복권 구매 시작"""
@@ -199,6 +114,7 @@ class LotteryWidget(QWidget):
             num_clicks
         )
         self.worker.update_signal.connect(self.log)
+        self.progress_panel.attach(self.worker)
         self.worker.finished_signal.connect(self.on_lottery_finished)
         self.worker.start()
         
@@ -1,172 +1,26 @@
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTextEdit, QListWidget, QListWidgetItem, QGroupBox, QMessageBox, QAbstractItemView
-from PyQt5.QtCore import Qt, QThread, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QListView, QGroupBox, QMessageBox, QAbstractItemView
+from PyQt5.QtCore import Qt, pyqtSignal
 import os
 import sys
-import time
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from modules.title_clicker import TitleClickerTask
+from modules.worker import TaskWorker
+from ui.log_panel import LogPanel
 from ui.login_dialog import LoginWidget
-from utils.browser import Browser
+from ui.post_list_model import PostListModel
+from ui.task_progress import TaskProgress
 from utils.logger import Logger
 
-class TitleClickerWorker(QThread):
+class TitleClickerWorker(TaskWorker):
     """
-    글 삭제 작업을 수행하는 워커 스레드
+    글 삭제 작업(modules.title_clicker.TitleClickerTask)을 실행하는 워커 스레드
     """
-    update_signal = pyqtSignal(str)
-    posts_found_signal = pyqtSignal(list)  # 게시글 목록 전달
-    finished_signal = pyqtSignal(bool, str)
+    posts_page_signal = pyqtSignal(list)  # 페이지마다 새로 찾은 게시글 전달
     
     def __init__(self, username, password, post_ids=None):
-        super().__init__()
-        self.username = username
-        self.password = password
-        self.post_ids = post_ids  # 삭제할 게시글 ID 목록
-        self.logger = Logger()
-        self.running = True
-        self.mode = "fetch" if post_ids is None else "delete"
-        
-    def run(self):
-        """스레드 실행"""
-        if self.mode == "fetch":
-            self.update_signal.emit("내 게시글 목록을 가져오는 중...")
-        else:
-            self.update_signal.emit(f"선택한 게시글 삭제 작업을 시작합니다... (게시글 수: {len(self.post_ids)})")
-        
-        # 브라우저 초기화
-        browser = Browser(headless=True)
-        if not browser.start():
-            self.finished_signal.emit(False, "브라우저를 시작할 수 없습니다.")
-            return
-            
-        try:
-            driver = browser.get_driver()
-            
-            # 로그인
-            self.update_signal.emit("오르비 로그인 중...")
-            browser.get("https://login.orbi.kr/login")
-            
-            # 아이디/비밀번호 입력
-            driver.find_element("name", "username").send_keys(self.username)
-            driver.find_element("name", "password").send_keys(self.password)
-            driver.find_element("name", "password").send_keys("\n")
-            time.sleep(3)
-            
-            # 로그인 성공 확인
-            if "login" in driver.current_url:
-                self.finished_signal.emit(False, "로그인에 실패했습니다. 아이디와 비밀번호를 확인해주세요.")
-                browser.stop()
-                return
-                
-            self.update_signal.emit("로그인 성공!")
-            
-            if self.mode == "fetch":
-                # 내 게시글 목록 가져오기
-                posts = self.extract_posts(browser)
-                if posts:
-                    self.posts_found_signal.emit(posts)
-                    self.finished_signal.emit(True, f"{len(posts)}개의 게시글을 찾았습니다.")
-                else:
-                    self.finished_signal.emit(False, "게시글을 찾을 수 없습니다.")
-            else:
-                # 선택한 게시글 삭제
-                success_count = 0
-                for i, post_id in enumerate(self.post_ids):
-                    if not self.running:
-                        self.finished_signal.emit(False, "사용자에 의해 중단되었습니다.")
-                        browser.stop()
-                        return
-                        
-                    try:
-                        self.update_signal.emit(f"게시글 삭제 {i+1}/{len(self.post_ids)} 시도 중... (ID: {post_id})")
-                        
-                        # 게시글 수정 페이지로 이동
-                        modify_url = f"https://orbi.kr/modify/{post_id}"
-                        browser.get(modify_url)
-                        time.sleep(2)
-                        
-                        # 삭제 버튼 찾기
-                        delete_button = driver.find_element("css selector", ".button.delete")
-                        delete_button.click()
-                        time.sleep(1)
-                        
-                        # 확인 알림창 처리
-                        try:
-                            alert = driver.switch_to.alert
-                            alert.accept()
-                            self.update_signal.emit("삭제 확인 알림창 처리 완료")
-                        except:
-                            self.update_signal.emit("삭제 확인 알림창이 나타나지 않았습니다.")
-                            
-                        time.sleep(2)
-                        success_count += 1
-                        self.update_signal.emit(f"게시글 삭제 {i+1}/{len(self.post_ids)} 성공!")
-                        
-                    except Exception as e:
-                        self.update_signal.emit(f"게시글 삭제 {i+1}/{len(self.post_ids)} 실패: {e}")
-                        time.sleep(2)  # 오류 발생 시 잠시 대기
-                        
-                self.finished_signal.emit(True, f"게시글 삭제 작업이 완료되었습니다. {success_count}/{len(self.post_ids)}개 삭제 성공!")
-                
-        except Exception as e:
-            self.finished_signal.emit(False, f"작업 중 오류 발생: {e}")
-        finally:
-            browser.stop()
-            
-    def extract_posts(self, browser):
-        """내 게시글 목록 추출"""
-        posts = []
-        page = 1
-        
-        while self.running:
-            self.update_signal.emit(f"게시글 목록 페이지 {page} 가져오는 중...")
-            browser.get(f"https://orbi.kr/my/post?page={page}")
-            time.sleep(2)
-            
-            driver = browser.get_driver()
-            
-            try:
-                # 게시글 목록 요소 찾기
-                post_elements = driver.find_elements("css selector", "ul.post-list > li")
-                
-                if not post_elements:
-                    self.update_signal.emit(f"페이지 {page}에서 게시글을 찾을 수 없습니다.")
-                    break
-                    
-                valid_posts_found = False
-                for post in post_elements:
-                    try:
-                        # 제목 요소 찾기
-                        title_element = post.find_element("css selector", "p.title")
-                        title = title_element.text.strip()
-                        
-                        # 링크 요소 찾기
-                        link_element = post.find_element("tag name", "a")
-                        href = link_element.get_attribute("href")
-                        post_id = href.split('/')[-1] if href else None
-                        
-                        if title and post_id:
-                            posts.append({"title": title, "id": post_id})
-                            valid_posts_found = True
-                            self.update_signal.emit(f"게시글 발견: {title} (ID: {post_id})")
-                    except Exception as e:
-                        self.update_signal.emit(f"게시글 정보 추출 중 오류: {e}")
-                        
-                if not valid_posts_found:
-                    self.update_signal.emit("더 이상 유효한 게시글이 없습니다.")
-                    break
-                    
-                page += 1
-                
-            except Exception as e:
-                self.update_signal.emit(f"게시글 목록 처리 중 오류: {e}")
-                break
-                
-        return posts
-            
-    def stop(self):
-        """작업 중단"""
-        self.running = False
+        super().__init__(TitleClickerTask(username, password, post_ids))
+        self.task.posts_page_callback = self.posts_page_signal.emit
 
 class TitleClickerWidget(QWidget):
     """
@@ -176,7 +30,6 @@ class TitleClickerWidget(QWidget):
         super().__init__(parent)
         self.logger = Logger()
         self.worker = None
-        self.posts = []
         self.initUI()
         
     def initUI(self):
@@ -193,7 +46,23 @@ class TitleClickerWidget(QWidget):
         posts_group = QGroupBox("내 게시글 목록")
         posts_layout = QVBoxLayout()
         
-        self.posts_list = QListWidget()
+        # 제목 검색
+        filter_layout = QHBoxLayout()
+        filter_label = QLabel("제목 검색:")
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("검색어를 포함한 게시글만 표시")
+        self.filter_input.textChanged.connect(self.filter_posts)
+        filter_layout.addWidget(filter_label)
+        filter_layout.addWidget(self.filter_input)
+        posts_layout.addLayout(filter_layout)
+        
+        # 게시글이 많아도 보이는 행만 그리는 목록
+        self.posts_model = PostListModel(self)
+        self.posts_list = QListView()
+        self.posts_list.setModel(self.posts_model)
+        self.posts_list.setUniformItemSizes(True)
+        self.posts_list.setLayoutMode(QListView.Batched)  # 행 배치를 나눠서 처리해 UI가 멈추지 않게 함
+        self.posts_list.setBatchSize(500)
         self.posts_list.setSelectionMode(QAbstractItemView.MultiSelection)
         posts_layout.addWidget(self.posts_list)
         
@@ -217,11 +86,13 @@ class TitleClickerWidget(QWidget):
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.stop_button)
         
+        # 진행률 표시 영역
+        self.progress_panel = TaskProgress()
+        
         # 로그 출력 영역
         log_group = QGroupBox("실행 로그")
         log_layout = QVBoxLayout()
-        self.log_text = QTextEdit()
-        self.log_text.setReadOnly(True)
+        self.log_text = LogPanel(logger=self.logger)  # 100ms마다 모아서 표시, 최근 줄만 유지
         log_layout.addWidget(self.log_text)
         log_group.setLayout(log_layout)
         
@@ -229,15 +100,14 @@ class TitleClickerWidget(QWidget):
         layout.addWidget(login_group)
         layout.addWidget(posts_group)
         layout.addLayout(button_layout)
+        layout.addWidget(self.progress_panel)
         layout.addWidget(log_group)
         
         self.setLayout(layout)
         
     def log(self, message):
         """로그 출력"""
-        from datetime import datetime
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
-        self.logger.info(message)
+        self.log_text.log(message)
         
     def fetch_posts(self):
         """내 게시글 목록 가져오기"""
@@ -257,8 +127,7 @@ class TitleClickerWidget(QWidget):
         self.log("내 게시글 목록을 가져오는 중...")
         
         # 게시글 목록 초기화
-        self.posts_list.clear()
-        self.posts = []
+        self.posts_model.clear()
         
         # 워커 스레드 시작
         self.worker = TitleClickerWorker(
@@ -266,32 +135,29 @@ class TitleClickerWidget(QWidget):
             credentials["password"]
         )
         self.worker.update_signal.connect(self.log)
-        self.worker.posts_found_signal.connect(self.update_posts_list)
+        self.progress_panel.attach(self.worker)
+        self.worker.posts_page_signal.connect(self.add_posts)
         self.worker.finished_signal.connect(self.on_fetch_finished)
         self.worker.start()
         
-    def update_posts_list(self, posts):
-        """게시글 목록 업데이트"""
-        self.posts = posts
-        self.posts_list.clear()
+    def add_posts(self, posts):
+        """페이지마다 찾은 게시글을 목록에 추가"""
+        self.posts_model.append_posts(posts)
         
-        for post in posts:
-            item = QListWidgetItem(f"{post['title']} (ID: {post['id']})")
-            item.setData(Qt.UserRole, post['id'])
-            self.posts_list.addItem(item)
-            
-        self.log(f"{len(posts)}개의 게시글을 목록에 추가했습니다.")
+    def filter_posts(self, text):
+        """검색어를 포함한 게시글만 표시 (선택은 초기화됨)"""
+        self.posts_model.set_filter(text)
         
     def start_title_clicker(self):
         """글 삭제 시작"""
         # 선택한 게시글 확인
-        selected_items = self.posts_list.selectedItems()
-        if not selected_items:
+        selected_rows = self.posts_list.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.warning(self, "경고", "삭제할 게시글을 선택해주세요.")
             return
             
         # 선택한 게시글 ID 추출
-        post_ids = [item.data(Qt.UserRole) for item in selected_items]
+        post_ids = [self.posts_model.post_id(index.row()) for index in selected_rows]
         
         # 로그인 정보 확인
         credentials = self.login_widget.get_credentials()
@@ -327,6 +193,7 @@ class TitleClickerWidget(QWidget):
             post_ids
         )
         self.worker.update_signal.connect(self.log)
+        self.progress_panel.attach(self.worker)
         self.worker.finished_signal.connect(self.on_delete_finished)
         self.worker.start()
         
@@ -340,7 +207,8 @@ class TitleClickerWidget(QWidget):
         """게시글 목록 가져오기 완료 처리"""
         if success:
             self.log(f"✅ {message}")
-            self.start_button.setEnabled(len(self.posts) > 0)
+            self.log(f"{self.posts_model.total_count()}개의 게시글을 목록에 추가했습니다.")
+            self.start_button.setEnabled(self.posts_model.total_count() > 0)
         else:
             self.log(f"❌ {message}")
             self.start_button.setEnabled(False)
@@ -370,5 +238,5 @@ class TitleClickerWidget(QWidget):
             
         # UI 상태 복원
         self.fetch_button.setEnabled(True)
-        self.start_button.setEnabled(len(self.posts) > 0)
+        self.start_button.setEnabled(self.posts_model.total_count() > 0)
         self.stop_button.setEnabled(False)
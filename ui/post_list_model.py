@@ -0,0 +1,102 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex
+
+class PostListModel(QAbstractListModel):
+    """
+    게시글 목록 모델
+
+    게시글 ID와 제목을 두 개의 리스트로만 보관하고, 표시할 문자열은 화면에 보이는 행에 대해서만 만든다.
+    페이지 단위로 행을 한 번에 추가하며, 검색어 필터는 위젯을 다시 만들지 않고 표시할 행 번호만 다시 계산한다.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.ids = []
+        self.titles = []
+        self.folded_titles = []  # 검색용 소문자 제목
+        self.filter_text = ""
+        self.visible = None  # 필터 적용 시 표시할 게시글 번호 목록 (None이면 전체)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.ids) if self.visible is None else len(self.visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        position = self._position(index.row())
+        if role == Qt.DisplayRole:
+            return f"{self.titles[position]} (ID: {self.ids[position]})"
+        if role == Qt.ToolTipRole:
+            return self.titles[position]
+        if role == Qt.UserRole:
+            return self.ids[position]
+        return None
+
+    def _position(self, row):
+        """표시 중인 행 번호를 전체 목록에서의 위치로 변환"""
+        return row if self.visible is None else self.visible[row]
+
+    def append_posts(self, posts):
+        """
+        게시글 추가 (한 번에 여러 행 삽입)
+
+        Args:
+            posts (list): {"id", "title"} 목록
+        """
+        if not posts:
+            return
+        start = len(self.ids)
+        folded = [post["title"].casefold() for post in posts]
+
+        # 필터 중이면 검색어에 맞는 게시글만 화면에 추가
+        new_rows = None
+        if self.visible is not None:
+            new_rows = [start + i for i, title in enumerate(folded) if self.filter_text in title]
+        count = len(posts) if new_rows is None else len(new_rows)
+
+        if count:
+            first = self.rowCount()
+            self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self.ids.extend(post["id"] for post in posts)
+        self.titles.extend(post["title"] for post in posts)
+        self.folded_titles.extend(folded)
+        if new_rows:
+            self.visible.extend(new_rows)
+        if count:
+            self.endInsertRows()
+
+    def set_filter(self, text):
+        """
+        검색어 필터 적용 (빈 문자열이면 전체 표시)
+
+        Args:
+            text (str): 제목에 포함되어야 하는 문자열 (대소문자 무시)
+        """
+        text = text.strip().casefold()
+        if text == self.filter_text:
+            return
+        self.beginResetModel()
+        self.filter_text = text
+        if text:
+            self.visible = [i for i, title in enumerate(self.folded_titles) if text in title]
+        else:
+            self.visible = None
+        self.endResetModel()
+
+    def clear(self):
+        """모든 게시글 삭제"""
+        self.beginResetModel()
+        self.ids = []
+        self.titles = []
+        self.folded_titles = []
+        if self.visible is not None:
+            self.visible = []
+        self.endResetModel()
+
+    def post_id(self, row):
+        """표시 중인 행의 게시글 ID"""
+        return self.ids[self._position(row)]
+
+    def total_count(self):
+        """필터와 관계없는 전체 게시글 수"""
+        return len(self.ids)
@@ -0,0 +1,64 @@
+from PyQt5.QtWidgets import QWidget, QHBoxLayout, QLabel, QProgressBar
+
+def _format_seconds(seconds):
+    """초를 "1분 5초" 형식으로 변환"""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    return f"{minutes}분 {seconds}초" if minutes else f"{seconds}초"
+
+class TaskProgress(QWidget):
+    """
+    실행 중인 작업의 진행률 표시 영역 (진행 막대와 처리 수/속도/남은 시간)
+
+    attach()로 워커(modules.worker.TaskWorker)의 progress_signal을 연결하면 Task.metrics()가 올 때마다 갱신된다.
+    전체 수를 모르는 작업은 진행 막대를 움직이는 상태로 두고 처리 수만 표시한다.
+    """
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        layout = QHBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.bar = QProgressBar()
+        self.bar.setRange(0, 1)
+        self.bar.setValue(0)
+        self.label = QLabel("대기 중")
+        layout.addWidget(self.bar, 1)
+        layout.addWidget(self.label)
+        self.setLayout(layout)
+
+    def attach(self, worker):
+        """
+        워커의 진행 상황 표시 시작
+
+        Args:
+            worker (TaskWorker): 시작할 워커
+        """
+        self.bar.setRange(0, 0)  # 첫 진행 상황이 올 때까지 움직이는 상태
+        self.label.setText("준비 중...")
+        worker.progress_signal.connect(self.update_metrics)
+        worker.finished.connect(self.on_finished)
+
+    def update_metrics(self, metrics):
+        """
+        진행 상황 갱신
+
+        Args:
+            metrics (dict): Task.metrics() 결과
+        """
+        done, total = metrics["done"], metrics["total"]
+        if total:
+            self.bar.setRange(0, total)
+            self.bar.setValue(min(done, total))
+            parts = [f"{done}/{total}개"]
+        else:
+            parts = [f"{done}개 처리"]
+        if metrics["rate"] > 0:
+            parts.append(f"초당 {metrics['rate']:.1f}개")
+        parts.append(f"경과 {_format_seconds(metrics['elapsed'])}")
+        if metrics.get("eta") is not None:
+            parts.append(f"남은 시간 {_format_seconds(metrics['eta'])}")
+        self.label.setText(" · ".join(parts))
+
+    def on_finished(self):
+        """워커 스레드 종료 시 움직이는 상태 해제"""
+        if self.bar.maximum() == 0:
+            self.bar.setRange(0, 1)
+            self.bar.setValue(1)
@@ -0,0 +1,314 @@
+import os
+import re
+import atexit
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from utils.config import Config
+
+# 게시글 출처
+SOURCE_IMIN = "imin"  # 아이민 검색 결과 (IminScraperTask)
+SOURCE_MY_POSTS = "my_posts"  # 내 게시글 목록 (TitleClickerTask)
+
+# 사이트에 표시되는 작성일 형식
+FULL_DATE_PATTERN = re.compile(r"^(\d{2}|\d{4})[./-]\s*(\d{1,2})[./-]\s*(\d{1,2})")  # 2024.05.03, 24.05.03, 2024-05-03
+MONTH_DAY_PATTERN = re.compile(r"^(\d{1,2})[./-](\d{1,2})\.?$")  # 05.03 (올해)
+TIME_PATTERN = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")  # 14:05 (오늘, 지금보다 늦으면 어제)
+RELATIVE_PATTERN = re.compile(r"^(\d+)\s*(초|분|시간|일|주)\s*전$")  # 3시간 전
+RELATIVE_UNITS = {"초": "seconds", "분": "minutes", "시간": "hours", "일": "days", "주": "weeks"}
+
+def normalize_date(text, now=None):
+    """
+    사이트에 표시된 작성일을 ISO 날짜(YYYY-MM-DD)로 변환
+
+    "2024.05.03", "24.05.03", "05.03"(올해, 미래면 작년), "14:05"(오늘, 지금보다 늦으면 어제), "3시간 전", "방금", "어제"
+    형식을 처리한다.
+
+    Args:
+        text (str): 작성일 문자열
+        now (datetime, optional): 상대 날짜의 기준 시각 (기본: 현재)
+
+    Returns:
+        str: YYYY-MM-DD. 알 수 없는 형식이면 None
+    """
+    if not text:
+        return None
+    text = text.strip()
+    now = now or datetime.now()
+    try:
+        match = FULL_DATE_PATTERN.match(text)
+        if match:
+            year, month, day = (int(value) for value in match.groups())
+            if year < 100:
+                year += 2000
+            return datetime(year, month, day).date().isoformat()
+
+        match = MONTH_DAY_PATTERN.match(text)
+        if match:
+            month, day = (int(value) for value in match.groups())
+            date = datetime(now.year, month, day)
+            if date.date() > now.date():
+                date = datetime(now.year - 1, month, day)
+            return date.date().isoformat()
+
+        match = TIME_PATTERN.match(text)
+        if match:
+            hour, minute, second = (int(value or 0) for value in match.groups())
+            posted = now.replace(hour=hour, minute=minute, second=second, microsecond=0)
+            if posted > now:
+                posted -= timedelta(days=1)  # 자정 직후에 본 "23:50"은 어제 글
+            return posted.date().isoformat()
+    except ValueError:
+        return None  # 존재하지 않는 날짜/시각
+
+    if text in ("방금", "방금 전", "오늘"):
+        return now.date().isoformat()
+    if text == "어제":
+        return (now - timedelta(days=1)).date().isoformat()
+    match = RELATIVE_PATTERN.match(text)
+    if match:
+        delta = timedelta(**{RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+        return (now - delta).date().isoformat()
+    return None
+
+class PostArchive:
+    """
+    수집한 게시글 제목을 보관하는 로컬 저장소 (SQLite, WAL)
+
+    게시글 ID를 키로 페이지 단위 일괄 upsert하며, 아이민/작성일 색인과 제목 전문 검색(FTS5)을 제공한다.
+    같은 아이민을 다시 조회할 때 사이트를 처음부터 다시 긁지 않고 바로 찾을 수 있다.
+    """
+    def __init__(self, db_path):
+        """
+        게시글 저장소 초기화
+
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS posts (
+                id TEXT PRIMARY KEY,
+                imin TEXT,
+                title TEXT NOT NULL,
+                board TEXT,
+                posted_at TEXT,
+                source TEXT NOT NULL,
+                archived_at TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_posts_imin ON posts (imin, posted_at);
+            CREATE INDEX IF NOT EXISTS idx_posts_date ON posts (posted_at);
+        """)
+        self.fts = self._create_fts()
+        self._normalize_stored_dates()
+        self.conn.commit()
+
+    def _normalize_stored_dates(self):
+        """이전 버전이 사이트 표시 그대로 저장한 작성일을 저장 시각 기준으로 ISO 날짜로 변환"""
+        rows = self.conn.execute(
+            "SELECT id, posted_at, archived_at FROM posts WHERE posted_at IS NOT NULL "
+            "AND posted_at NOT GLOB '[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]'"
+        ).fetchall()
+        if rows:
+            self.conn.executemany("UPDATE posts SET posted_at = ? WHERE id = ?", [
+                (normalize_date(row["posted_at"], datetime.fromisoformat(row["archived_at"])), row["id"])
+                for row in rows
+            ])
+
+    def _create_fts(self):
+        """
+        제목 전문 검색 테이블과 동기화 트리거 생성
+
+        한국어는 띄어쓰기 단위로 나누면 조사가 붙은 단어를 찾을 수 없으므로 trigram 토크나이저(SQLite 3.34+)를 쓰고,
+        지원하지 않으면 unicode61로 만든다. FTS5가 없는 SQLite에서는 LIKE 검색만 사용한다.
+
+        Returns:
+            str: 사용하는 토크나이저 ("trigram", "unicode61"). FTS5를 쓸 수 없으면 None
+        """
+        row = self.conn.execute("SELECT sql FROM sqlite_master WHERE name = 'posts_fts'").fetchone()
+        if row:
+            return "trigram" if "trigram" in row["sql"] else "unicode61"
+
+        for tokenizer in ("trigram", "unicode61"):
+            try:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE posts_fts USING fts5("
+                    f"title, content='posts', content_rowid='rowid', tokenize='{tokenizer}')"
+                )
+                break
+            except sqlite3.OperationalError:
+                continue
+        else:
+            return None
+
+        self.conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS posts_ai AFTER INSERT ON posts BEGIN
+                INSERT INTO posts_fts (rowid, title) VALUES (new.rowid, new.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS posts_ad AFTER DELETE ON posts BEGIN
+                INSERT INTO posts_fts (posts_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+            END;
+            CREATE TRIGGER IF NOT EXISTS posts_au AFTER UPDATE OF title ON posts BEGIN
+                INSERT INTO posts_fts (posts_fts, rowid, title) VALUES ('delete', old.rowid, old.title);
+                INSERT INTO posts_fts (rowid, title) VALUES (new.rowid, new.title);
+            END;
+        """)
+        # 트리거가 생기기 전에 저장된 게시글도 검색되도록 색인 재구성
+        self.conn.execute("INSERT INTO posts_fts (posts_fts) VALUES ('rebuild')")
+        return tokenizer
+
+    def add_posts(self, posts, source, imin=None):
+        """
+        게시글 목록을 한 트랜잭션으로 저장 (이미 있으면 갱신)
+
+        작성일은 ISO 날짜로 바꿔 저장하고(알 수 없는 형식은 NULL), 새 값이 비어 있는 항목(아이민, 게시판, 작성일)은
+        기존 값을 유지한다.
+
+        Args:
+            posts (list): {"id", "title", "date"(선택, 사이트 표시 형식), "board"(선택)} 목록
+            source (str): 출처 (SOURCE_IMIN, SOURCE_MY_POSTS)
+            imin (str, optional): 작성자 아이민
+
+        Returns:
+            int: 저장한 게시글 수 (ID가 없는 항목 제외)
+        """
+        now = datetime.now()
+        archived_at = now.isoformat(timespec="seconds")
+        rows = [
+            (post["id"], imin, post["title"], post.get("board"), normalize_date(post.get("date"), now), source, archived_at)
+            for post in posts if post.get("id") and post.get("title")
+        ]
+        if not rows:
+            return 0
+        with self.lock, self.conn:
+            self.conn.executemany("""
+                INSERT INTO posts (id, imin, title, board, posted_at, source, archived_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (id) DO UPDATE SET
+                    imin = COALESCE(excluded.imin, posts.imin),
+                    title = excluded.title,
+                    board = COALESCE(excluded.board, posts.board),
+                    posted_at = COALESCE(excluded.posted_at, posts.posted_at),
+                    source = excluded.source,
+                    archived_at = excluded.archived_at
+            """, rows)
+        return len(rows)
+
+    def _query(self, sql, args):
+        """조회 결과를 딕셔너리 목록으로 반환"""
+        with self.lock:
+            rows = self.conn.execute(sql, args).fetchall()
+        return [dict(row) for row in rows]
+
+    def posts_by_imin(self, imin, since=None, until=None, limit=None):
+        """
+        아이민이 작성한 게시글 (최근 작성일 순)
+
+        Args:
+            imin (str): 아이민 번호
+            since (str, optional): 이 날짜 이후 (YYYY-MM-DD 또는 2024.05.03 형식)
+            until (str, optional): 이 날짜 이전 (당일 포함)
+            limit (int, optional): 최대 개수
+
+        Returns:
+            list: 게시글 딕셔너리 목록
+        """
+        sql = "SELECT * FROM posts WHERE imin = ?"
+        args = [imin]
+        if since:
+            sql += " AND posted_at >= ?"
+            args.append(normalize_date(since) or since)
+        if until:
+            sql += " AND posted_at <= ?"
+            args.append(normalize_date(until) or until)
+        # 작성일을 알 수 없는 게시글은 뒤로
+        sql += " ORDER BY posted_at IS NULL, posted_at DESC, id DESC"
+        if limit:
+            sql += " LIMIT ?"
+            args.append(limit)
+        return self._query(sql, args)
+
+    def search(self, text, imin=None, limit=100):
+        """
+        제목 검색 (입력한 문자열이 제목에 포함된 게시글, 최근 작성일 순)
+
+        Args:
+            text (str): 찾을 문자열 (공백으로 나누면 모든 단어를 포함하는 제목)
+            imin (str, optional): 이 아이민의 게시글만
+            limit (int): 최대 개수
+
+        Returns:
+            list: 게시글 딕셔너리 목록
+        """
+        words = text.split()
+        if not words:
+            return []
+
+        # trigram 색인은 3글자 이상만 찾을 수 있으므로 짧은 단어가 있으면 LIKE로 찾는다
+        if self.fts and (self.fts != "trigram" or all(len(word) >= 3 for word in words)):
+            query = " ".join('"' + word.replace('"', '""') + '"' for word in words)
+            sql = "SELECT posts.* FROM posts_fts JOIN posts ON posts.rowid = posts_fts.rowid WHERE posts_fts MATCH ?"
+            args = [query]
+        else:
+            sql = "SELECT * FROM posts WHERE " + " AND ".join("title LIKE ? ESCAPE '\\'" for _ in words)
+            args = ["%" + word.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%" for word in words]
+        if imin:
+            sql += " AND posts.imin = ?"
+            args.append(imin)
+        sql += " ORDER BY posts.posted_at IS NULL, posts.posted_at DESC, posts.id DESC LIMIT ?"
+        args.append(limit)
+        return self._query(sql, args)
+
+    def count(self, imin=None):
+        """
+        저장된 게시글 수
+
+        Args:
+            imin (str, optional): 이 아이민의 게시글만 셀 때
+        """
+        if imin:
+            return self._query("SELECT COUNT(*) AS n FROM posts WHERE imin = ?", (imin,))[0]["n"]
+        return self._query("SELECT COUNT(*) AS n FROM posts", ())[0]["n"]
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self.lock:
+            self.conn.close()
+
+# 모든 작업이 공유하는 게시글 저장소
+_shared_archive = None
+_shared_lock = threading.Lock()
+
+def get_archive():
+    """
+    공유 게시글 저장소 반환 (설정 파일의 archive 섹션 사용)
+
+    Returns:
+        PostArchive: 프로세스 전역 저장소. 설정에서 꺼져 있으면 None
+    """
+    global _shared_archive
+    with _shared_lock:
+        if _shared_archive is None:
+            settings = Config().get("archive") or {}
+            if not settings.get("enabled", True):
+                return None
+            db_path = settings.get("db_path", os.path.join("cache", "posts.sqlite3"))
+            os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+            _shared_archive = PostArchive(db_path)
+        return _shared_archive
+
+def close_archive():
+    """공유 게시글 저장소 닫기"""
+    global _shared_archive
+    with _shared_lock:
+        archive, _shared_archive = _shared_archive, None
+    if archive:
+        archive.close()
+
+atexit.register(close_archive)
@@ -1,23 +1,69 @@
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
-from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import WebDriverException, TimeoutException
 import os
+import time
+import atexit
+import threading
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+from utils.config import Config
+
+# 이미지/미디어/글꼴 요청 차단 패턴
+RESOURCE_BLOCK_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp",
+    "*.mp4", "*.webm", "*.mp3", "*.m3u8",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"
+]
+
+# 광고/분석 호스트 차단 패턴
+AD_HOST_PATTERNS = [
+    "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*googletagservices.com*",
+    "*adservice.google.*", "*amazon-adsystem.com*", "*criteo.com*", "*criteo.net*",
+    "*facebook.net*", "*scorecardresearch.com*", "*adnxs.com*", "*taboola.com*",
+    "*mobon.net*", "*realclick.co.kr*", "*dable.io*", "*ad.daum.net*", "*adfit.kakao.com*"
+]
+
+# 브라우저 설정 묶음
+#   page_load_strategy: normal(모든 리소스 로드까지 대기), eager(DOM 완성까지), none(대기 없음)
+#   block_resources: 이미지/미디어/글꼴 차단
+#   block_ads: 광고/분석 호스트 차단
+BROWSER_PROFILES = {
+    # 화면을 그대로 사용하는 작업 (이미지 클릭 등)
+    "default": {"page_load_strategy": "normal", "block_resources": False, "block_ads": False},
+    # 목록 순회/입력 위주 작업: DOM이 준비되면 바로 진행하고 불필요한 리소스는 받지 않음
+    "light": {"page_load_strategy": "eager", "block_resources": True, "block_ads": True}
+}
 
 class Browser:
     """
     브라우저 관리를 위한 유틸리티 클래스
     """
-    def __init__(self, chromedriver_path=None, headless=True):
+    def __init__(self, chromedriver_path=None, headless=True, limiter=None, should_stop=None, profile="default"):
         """
         브라우저 관리자 초기화
         
         Args:
             chromedriver_path (str, optional): ChromeDriver 경로
             headless (bool): 헤드리스 모드 사용 여부
+            limiter (RateLimiter, optional): 페이지 이동 속도 제한기
+            should_stop (callable, optional): True를 반환하면 속도 제한 대기를 중단
+            profile (str): BROWSER_PROFILES의 설정 이름
         """
         self.chromedriver_path = chromedriver_path
         self.headless = headless
+        self.profile = profile if profile in BROWSER_PROFILES else "default"
+        self.limiter = limiter
+        self.should_stop = should_stop
         self.driver = None
+        self.navigation_count = 0  # 시작 후 페이지 이동 횟수 (브라우저 풀의 재시작 기준)
         
     def start(self):
         """
@@ -37,6 +83,20 @@ class Browser:
             chrome_options.add_argument("--no-sandbox")
             chrome_options.add_argument("--disable-dev-shm-usage")
             
+            # 자동화에 필요 없는 확장 프로그램/백그라운드 통신 끄기
+            chrome_options.add_argument("--disable-extensions")
+            chrome_options.add_argument("--disable-background-networking")
+            chrome_options.add_argument("--disable-component-update")
+            chrome_options.add_argument("--disable-default-apps")
+            chrome_options.add_argument("--disable-sync")
+            chrome_options.add_argument("--no-first-run")
+            chrome_options.add_argument("--mute-audio")
+            
+            settings = BROWSER_PROFILES[self.profile]
+            chrome_options.page_load_strategy = settings["page_load_strategy"]
+            if settings["block_resources"]:
+                chrome_options.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+            
             # ChromeDriver 경로가 지정되었으면 사용, 아니면 자동 감지
             if self.chromedriver_path and os.path.exists(self.chromedriver_path):
                 service = Service(executable_path=self.chromedriver_path)
@@ -44,17 +104,37 @@ class Browser:
             else:
                 self.driver = webdriver.Chrome(options=chrome_options)
                 
+            self._block_urls(settings)
+            self.navigation_count = 0
             return True
         except WebDriverException as e:
             print(f"브라우저 시작 중 오류 발생: {e}")
             return False
             
+    def _block_urls(self, settings):
+        """설정에 따라 CDP로 리소스/광고 요청 차단"""
+        patterns = []
+        if settings["block_resources"]:
+            patterns += RESOURCE_BLOCK_PATTERNS
+        if settings["block_ads"]:
+            patterns += AD_HOST_PATTERNS
+        if not patterns:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            print(f"요청 차단 설정 중 오류 발생: {e}")
+            
     def stop(self):
         """
         브라우저 종료
         """
         if self.driver:
-            self.driver.quit()
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"브라우저 종료 중 오류 발생: {e}")
             self.driver = None
             
     def get(self, url):
@@ -71,12 +151,31 @@ class Browser:
             if not self.start():
                 return False
                 
+        # 속도 제한 (중단 요청 시 이동하지 않음)
+        if self.limiter and not self.limiter.acquire(url, self.should_stop):
+            return False
+            
         try:
-            self.driver.get(url)
-            return True
+            self.navigation_count += 1
+            if BROWSER_PROFILES[self.profile]["page_load_strategy"] == "none":
+                # 로드를 기다리지 않는 설정에서도 이전 페이지의 요소를 찾지 않도록 새 문서가 열릴 때까지 대기
+                self.driver.execute_script("window.__orbiPreviousPage = true;")
+                self.driver.get(url)
+                self._wait(lambda driver: driver.execute_script("return !window.__orbiPreviousPage;"), 10)
+            else:
+                self.driver.get(url)
+        except TimeoutException as e:
+            # 서버가 응답하지 않은 경우에만 같은 호스트의 다음 요청을 늦춘다 (요소 찾기/클릭 오류는 해당 없음)
+            if self.limiter:
+                self.limiter.on_error(url)
+            print(f"URL 이동 시간 초과: {e}")
+            return False
         except Exception as e:
             print(f"URL 이동 중 오류 발생: {e}")
             return False
+        if self.limiter:
+            self.limiter.on_success(url)
+        return True
             
     def get_driver(self):
         """
@@ -89,3 +188,443 @@ class Browser:
             self.start()
             
         return self.driver
+        
+    def extract_all(self, selector, fields):
+        """
+        선택자에 해당하는 모든 요소의 값을 한 번의 스크립트 실행으로 가져오기
+        
+        요소/속성마다 WebDriver 요청을 보내는 대신 브라우저 안에서 한 번에 수집한다.
+        
+        Args:
+            selector (str): 항목 요소의 CSS 선택자
+            fields (dict): {이름: (하위 요소 선택자 또는 None, 속성)} 형태.
+                속성이 "text"면 표시된 텍스트, href/src처럼 같은 이름의 속성(property)이 있으면
+                그 값(절대 URL 등), 없으면 HTML 속성값을 가져온다.
+                
+        Returns:
+            list: 항목별 {이름: 값} 목록 (하위 요소가 없으면 값은 None). 실패하면 None
+        """
+        if not self.driver:
+            return None
+        script = """
+            var fields = arguments[1];
+            return Array.prototype.map.call(document.querySelectorAll(arguments[0]), function (element) {
+                var item = {};
+                for (var name in fields) {
+                    var target = fields[name][0] ? element.querySelector(fields[name][0]) : element;
+                    var attribute = fields[name][1];
+                    if (!target) {
+                        item[name] = null;
+                    } else if (attribute === "text") {
+                        item[name] = (target.innerText || target.textContent || "").trim();
+                    } else if (attribute in target && typeof target[attribute] !== "object") {
+                        item[name] = target[attribute];
+                    } else {
+                        item[name] = target.getAttribute(attribute);
+                    }
+                }
+                return item;
+            });
+        """
+        try:
+            return self.driver.execute_script(script, selector, {name: list(field) for name, field in fields.items()})
+        except Exception as e:
+            print(f"요소 정보 추출 중 오류 발생: {e}")
+            return None
+            
+    def _wait(self, condition, timeout):
+        """
+        조건을 만족할 때까지 대기 (중단 요청 시 바로 반환)
+        
+        Args:
+            condition (callable): 드라이버를 받아 참인 값을 반환하면 대기 종료
+            timeout (float): 최대 대기 시간(초)
+            
+        Returns:
+            조건의 반환값. 시간 초과나 중단 시 None
+        """
+        if not self.driver:
+            return None
+            
+        stopped = object()
+        
+        def check(driver):
+            if self.should_stop and self.should_stop():
+                return stopped
+            return condition(driver)
+            
+        try:
+            result = WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(check)
+        except TimeoutException:
+            return None
+        return None if result is stopped else result
+        
+    def wait_for_selector(self, selector, timeout=10, clickable=False):
+        """
+        CSS 선택자에 해당하는 요소가 나타날 때까지 대기
+        
+        Args:
+            selector (str): CSS 선택자
+            timeout (float): 최대 대기 시간(초)
+            clickable (bool): 보이고 클릭할 수 있을 때까지 대기할지 여부
+            
+        Returns:
+            WebElement: 찾은 요소. 시간 초과 시 None
+        """
+        locator = ("css selector", selector)
+        if clickable:
+            return self._wait(EC.element_to_be_clickable(locator), timeout)
+        return self._wait(EC.presence_of_element_located(locator), timeout)
+        
+    def wait_for_url_change(self, old_url, timeout=10):
+        """
+        현재 URL이 바뀔 때까지 대기 (폼 제출 후 이동 등)
+        
+        Args:
+            old_url (str): 이전 URL
+            timeout (float): 최대 대기 시간(초)
+            
+        Returns:
+            bool: URL이 바뀌었으면 True
+        """
+        return bool(self._wait(EC.url_changes(old_url), timeout))
+        
+    def wait_for_alert(self, timeout=3):
+        """
+        알림창이 나타날 때까지 대기
+        
+        Args:
+            timeout (float): 최대 대기 시간(초)
+            
+        Returns:
+            Alert: 알림창. 시간 초과 시 None
+        """
+        return self._wait(EC.alert_is_present(), timeout)
+        
+    def wait_for_staleness(self, element, timeout=10):
+        """
+        요소가 문서에서 사라질 때까지 대기 (다른 페이지로 이동하거나 목록에서 지워진 경우)
+        
+        Args:
+            element (WebElement): 확인할 요소
+            timeout (float): 최대 대기 시간(초)
+            
+        Returns:
+            bool: 요소가 사라졌으면 True
+        """
+        return bool(self._wait(EC.staleness_of(element), timeout))
+        
+    def count_text(self, text):
+        """
+        표시된 텍스트가 text와 같은 요소 수 (공백은 하나로 보고, 가장 안쪽 요소만 셈)
+        
+        Args:
+            text (str): 찾을 텍스트
+            
+        Returns:
+            int: 요소 수
+        """
+        script = """
+            var normalize = function (value) { return (value || "").replace(/\\s+/g, " ").trim(); };
+            var text = normalize(arguments[0]);
+            return Array.prototype.filter.call(document.body.querySelectorAll("*"), function (element) {
+                if (element.matches("script, style, textarea, input") || normalize(element.textContent) !== text) {
+                    return false;
+                }
+                return !Array.prototype.some.call(element.children, function (child) {
+                    return normalize(child.textContent) === text;
+                });
+            }).length;
+        """
+        return self.driver.execute_script(script, text)
+        
+    def wait_for_alert_or_text(self, text, count, timeout=10):
+        """
+        알림창이 나타나거나 text가 표시된 요소가 count개 이상이 될 때까지 대기
+        
+        작성한 댓글/인사말이 목록에 나타났는지(성공), 오류 알림창이 떴는지 확인할 때 사용한다.
+        
+        Args:
+            text (str): 찾을 텍스트 (count_text 기준)
+            count (int): 기다릴 요소 수
+            timeout (float): 최대 대기 시간(초)
+            
+        Returns:
+            Alert 또는 True: 알림창이 뜨면 Alert, 텍스트가 나타나면 True. 시간 초과 시 None
+        """
+        def appeared(driver):
+            alert = EC.alert_is_present()(driver)
+            if alert:
+                return alert
+            return self.count_text(text) >= count
+            
+        return self._wait(appeared, timeout)
+
+    def is_alive(self):
+        """
+        드라이버가 응답하는지 확인
+        
+        Returns:
+            bool: 정상이면 True
+        """
+        if not self.driver:
+            return False
+        try:
+            self.driver.window_handles
+            return True
+        except Exception:
+            return False
+            
+    def reset(self):
+        """
+        다음 작업을 위해 쿠키, 저장소, 추가 탭을 정리하고 빈 페이지로 이동
+        
+        Returns:
+            bool: 성공 여부
+        """
+        if not self.driver:
+            return False
+        try:
+            # 추가로 열린 탭 닫기
+            handles = self.driver.window_handles
+            for handle in handles[1:]:
+                self.driver.switch_to.window(handle)
+                self.driver.close()
+            self.driver.switch_to.window(handles[0])
+            
+            # 현재 페이지의 저장소 비우기
+            try:
+                self.driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+            except Exception:
+                pass  # about:blank 등 저장소가 없는 페이지
+                
+            # 모든 도메인의 쿠키 삭제 (Chrome이 아니면 현재 도메인만)
+            try:
+                self.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            except Exception:
+                self.driver.delete_all_cookies()
+                
+            self.driver.get("about:blank")
+            return True
+        except Exception as e:
+            print(f"브라우저 초기화 중 오류 발생: {e}")
+            return False
+            
+    def memory_mb(self):
+        """
+        chromedriver와 모든 Chrome 프로세스의 메모리 사용량(RSS 합계, MB)
+        
+        Returns:
+            float: 메모리 사용량(MB). psutil이 없거나 측정할 수 없으면 None
+        """
+        if not self.driver or psutil is None:
+            return None
+        try:
+            process = psutil.Process(self.driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / (1024 * 1024)
+        except Exception:
+            return None
+
+class BrowserPool:
+    """
+    시작된 브라우저를 재사용하기 위한 프로세스 전역 브라우저 풀
+    
+    작업이 끝난 브라우저는 쿠키/탭을 정리한 뒤 최대 size개까지 대기 상태로 남겨 두고,
+    같은 설정(profile)을 요청한 다음 작업에 바로 빌려준다. 대기 중인 브라우저가 없으면 새로 시작한다.
+    동시에 빌려줄 수 있는 브라우저도 size개(최소 1개)까지이며, 그 이상은 반납될 때까지 기다린다
+    (스케줄러를 거치지 않고 화면에서 바로 실행한 작업도 Chrome 프로세스 수가 늘지 않도록).
+    대기 자리가 부족하면 가장 오래 쉬던 브라우저를 종료하고,
+    페이지 이동 횟수나 메모리 사용량(psutil 필요)이 기준을 넘은 브라우저는 반납 시 종료한다.
+    """
+    def __init__(self, size=2, chromedriver_path=None, headless=True, max_navigations=300, max_memory_mb=1024):
+        """
+        브라우저 풀 초기화
+        
+        Args:
+            size (int): 대기 상태로 유지하고 동시에 빌려줄 최대 브라우저 수
+            chromedriver_path (str, optional): ChromeDriver 경로
+            headless (bool): 헤드리스 모드 사용 여부
+            max_navigations (int): 이 횟수만큼 페이지를 이동한 브라우저는 재시작
+            max_memory_mb (float): 메모리 사용량이 이 값(MB)을 넘은 브라우저는 재시작
+        """
+        self.size = size
+        self.chromedriver_path = chromedriver_path
+        self.headless = headless
+        self.max_navigations = max_navigations
+        self.max_memory_mb = max_memory_mb
+        self.max_leased = max(1, size)
+        self.lock = threading.Lock()
+        self.available = threading.Condition(self.lock)  # 빌려준 브라우저가 반납되면 알림
+        self.idle = []
+        self.leased = set()
+        self.starting = 0  # 빌려주려고 준비 중인 브라우저 수
+        self.closed = False
+        
+    def _pop_idle(self, profile):
+        """설정이 같은 대기 중인 브라우저 꺼내기 (lock 안에서 호출)"""
+        for index in range(len(self.idle) - 1, -1, -1):
+            if self.idle[index].profile == profile:
+                return self.idle.pop(index)
+        return None
+        
+    def acquire(self, limiter=None, should_stop=None, profile="default"):
+        """
+        브라우저 빌리기 (빌려준 브라우저가 max_leased개면 반납될 때까지 대기, 대기 중인 브라우저가 없으면 새로 시작)
+        
+        Args:
+            limiter (RateLimiter, optional): 페이지 이동 속도 제한기
+            should_stop (callable, optional): True를 반환하면 반납 대기와 속도 제한 대기를 중단
+            profile (str): BROWSER_PROFILES의 설정 이름
+            
+        Returns:
+            Browser: 시작된 브라우저. 시작할 수 없거나 대기 중 중단되면 None
+        """
+        with self.available:
+            while not self.closed and len(self.leased) + self.starting >= self.max_leased:
+                if should_stop and should_stop():
+                    return None
+                self.available.wait(0.2)
+            if self.closed:
+                return None
+            self.starting += 1
+            
+        browser = None
+        try:
+            while True:
+                with self.lock:
+                    candidate = None if self.closed else self._pop_idle(profile)
+                if candidate is None:
+                    break
+                if candidate.is_alive():
+                    browser = candidate
+                    break
+                candidate.stop()  # 응답 없는 브라우저는 버리고 다음 브라우저 확인
+                
+            if browser is None and not self.closed:
+                browser = Browser(self.chromedriver_path, headless=self.headless, profile=profile)
+                if not browser.start():
+                    browser = None
+        finally:
+            with self.available:
+                self.starting -= 1
+                if browser:
+                    self.leased.add(browser)
+                else:
+                    self.available.notify_all()
+                    
+        if browser:
+            browser.limiter = limiter
+            browser.should_stop = should_stop
+        return browser
+        
+    def release(self, browser):
+        """
+        브라우저 반납 (여러 번 호출해도 한 번만 처리)
+        
+        Args:
+            browser (Browser): acquire()로 빌린 브라우저
+        """
+        if browser is None:
+            return
+        with self.available:
+            if browser not in self.leased:
+                return
+            self.leased.discard(browser)
+            self.available.notify_all()
+            
+        browser.limiter = None
+        browser.should_stop = None
+        if self._should_recycle(browser) or not browser.reset():
+            browser.stop()
+            return
+            
+        evicted = None
+        with self.lock:
+            if not self.closed and self.size > 0:
+                if len(self.idle) >= self.size:
+                    evicted = self.idle.pop(0)
+                self.idle.append(browser)
+                browser = None
+        if evicted:
+            evicted.stop()
+        if browser:
+            browser.stop()
+        
+    def _should_recycle(self, browser):
+        """반납된 브라우저를 종료해야 하는지 확인"""
+        if self.closed or not browser.is_alive():
+            return True
+        if self.max_navigations and browser.navigation_count >= self.max_navigations:
+            return True
+        if self.max_memory_mb:
+            memory = browser.memory_mb()
+            if memory is not None and memory > self.max_memory_mb:
+                return True
+        return False
+        
+    def warm_up(self, count=None, profile="default"):
+        """
+        백그라운드에서 브라우저를 미리 시작해 대기 상태로 둔다
+        
+        Args:
+            count (int, optional): 시작할 브라우저 수 (기본: size)
+            profile (str): BROWSER_PROFILES의 설정 이름
+        """
+        def start_browsers():
+            for _ in range(count or self.size):
+                with self.lock:
+                    if self.closed or len(self.idle) >= self.size:
+                        return
+                browser = Browser(self.chromedriver_path, headless=self.headless, profile=profile)
+                if not browser.start():
+                    return
+                with self.lock:
+                    if not self.closed and len(self.idle) < self.size:
+                        self.idle.append(browser)
+                        continue
+                browser.stop()
+                return
+                
+        threading.Thread(target=start_browsers, name="BrowserPoolWarmUp", daemon=True).start()
+        
+    def shutdown(self):
+        """대기 중인 브라우저를 모두 종료 (빌려준 브라우저는 반납 시 종료)"""
+        with self.available:
+            self.closed = True
+            idle, self.idle = self.idle, []
+            self.available.notify_all()
+        for browser in idle:
+            browser.stop()
+
+_shared_pool = None
+_shared_pool_lock = threading.Lock()
+
+def get_browser_pool():
+    """
+    모든 워커가 공유하는 브라우저 풀 반환 (설정 파일의 browser 섹션 사용)
+    
+    Returns:
+        BrowserPool: 프로세스 전역 브라우저 풀
+    """
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            settings = Config().get("browser") or {}
+            _shared_pool = BrowserPool(
+                size=settings.get("pool_size", 2),
+                chromedriver_path=settings.get("chromedriver_path") or None,
+                headless=settings.get("headless", True),
+                max_navigations=settings.get("max_navigations", 300),
+                max_memory_mb=settings.get("max_memory_mb", 1024)
+            )
+        return _shared_pool
+
+def shutdown_browser_pool():
+    """공유 브라우저 풀이 만들어졌으면 종료 (앱 종료 시 호출)"""
+    with _shared_pool_lock:
+        pool = _shared_pool
+    if pool:
+        pool.shutdown()
+
+atexit.register(shutdown_browser_pool)
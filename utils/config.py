@@ -37,11 +37,40 @@ class Config:
             },
             "browser": {
                 "chromedriver_path": "",
-                "headless": True
+                "headless": True,
+                "pool_size": 2,
+                "max_navigations": 300,
+                "max_memory_mb": 1024,
+                "warm_up": False
             },
             "paths": {
                 "download_dir": os.path.expanduser("~/Downloads"),
                 "log_dir": "logs"
+            },
+            "network": {
+                "requests_per_second": 3.0,
+                "burst": 3,
+                "max_backoff": 60.0,
+                "host_limits": {},
+                "write_interval": 2.0
+            },
+            "logging": {
+                "level": "INFO",
+                "rotation": "time",
+                "max_bytes": 5 * 1024 * 1024,
+                "backup_count": 30,
+                "json": False,
+                "console": True
+            },
+            "scheduler": {
+                "max_jobs": 3,
+                "max_browser_jobs": 1,
+                "max_http_jobs": 2,
+                "db_path": os.path.join("cache", "jobs.sqlite3")
+            },
+            "archive": {
+                "enabled": True,
+                "db_path": os.path.join("cache", "posts.sqlite3")
             }
         }
         
@@ -0,0 +1,214 @@
+import os
+import queue
+import hashlib
+import threading
+from urllib.parse import urlparse
+
+class ImageDownloadPool:
+    """
+    이미지 다운로드를 여러 스레드에서 병렬로 처리하는 작업자 풀
+
+    게시글을 순회하는 쪽(생산자)이 submit()으로 이미지 주소를 넣으면
+    작업자 스레드(소비자)가 공유 세션으로 내려받는다.
+    """
+    _STOP = object()
+    CANCELLED = object()
+
+    def __init__(self, client, max_workers=4, per_host_limit=2, queue_size=100, log_callback=None, store=None,
+                 result_callback=None):
+        """
+        다운로드 풀 초기화
+
+        Args:
+            client (HttpClient): 연결 풀을 공유할 HTTP 클라이언트
+            max_workers (int): 작업자 스레드 수
+            per_host_limit (int): 호스트별 동시 다운로드 수 제한
+            queue_size (int): 대기열 최대 길이 (가득 차면 submit이 대기)
+            log_callback (callable, optional): 진행 메시지를 전달받을 함수
+            store (ImageStore, optional): 중복 제거용 이미지 저장소
+            result_callback (callable, optional): (url, 저장 경로, 게시글 ID, 결과)를 전달받을 함수.
+                결과는 True(다운로드), None(이전 다운로드 재사용), False(실패)
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.per_host_limit = max(1, per_host_limit)
+        self.log_callback = log_callback
+        self.store = store
+        self.result_callback = result_callback
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.cancelled = threading.Event()
+        self.lock = threading.Lock()
+        self.host_semaphores = {}
+        self.threads = []
+        self.closed = False
+        self.downloaded_count = 0
+        self.failed_count = 0
+        self.skipped_count = 0
+
+    def start(self):
+        """작업자 스레드 시작"""
+        for i in range(self.max_workers):
+            thread = threading.Thread(target=self._worker, name=f"ImageDownload-{i}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+
+    def submit(self, url, save_path, article_id=None):
+        """
+        다운로드 작업 추가
+
+        Args:
+            url (str): 이미지 URL
+            save_path (str): 저장할 파일 경로
+            article_id (str, optional): 이미지가 속한 게시글 ID
+
+        Returns:
+            bool: 추가 여부 (취소된 경우 False)
+        """
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put((url, save_path, article_id), timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def pending(self):
+        """대기 중인 작업 수"""
+        return self.queue.qsize()
+
+    def cancel(self):
+        """대기 중인 작업을 버리고 진행 중인 다운로드 중단"""
+        self.cancelled.set()
+        self._drain()
+
+    def close(self, cancel=False):
+        """
+        풀 종료. 기본적으로 대기열의 작업을 모두 처리한 뒤 종료한다.
+
+        Args:
+            cancel (bool): True이면 대기 중인 작업을 버리고 즉시 종료
+        """
+        if self.closed:
+            return
+        self.closed = True
+
+        if cancel:
+            self.cancel()
+
+        for _ in self.threads:
+            self.queue.put(self._STOP)
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+
+    def _drain(self):
+        """대기열 비우기"""
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            self.queue.task_done()
+            if item is self._STOP:
+                # 종료 신호는 버리지 않고 다시 넣는다
+                self.queue.put(item)
+                return
+
+    def _log(self, message):
+        """진행 메시지 전달"""
+        if self.log_callback:
+            self.log_callback(message)
+
+    def _host_semaphore(self, url):
+        """호스트별 동시 다운로드 제한용 세마포어"""
+        host = urlparse(url).netloc
+        with self.lock:
+            semaphore = self.host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.per_host_limit)
+                self.host_semaphores[host] = semaphore
+            return semaphore
+
+    def _worker(self):
+        """작업자 스레드 루프"""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is self._STOP:
+                    return
+                if not self.cancelled.is_set():
+                    self._finish(item, self._download(*item))
+            finally:
+                self.queue.task_done()
+
+    def _download(self, url, save_path, article_id=None):
+        """
+        이미지 한 개 다운로드
+
+        Returns:
+            True(다운로드), None(재사용), False(실패) 또는 CANCELLED
+        """
+        ext = os.path.splitext(save_path)[1].lstrip('.')
+
+        # 이전에 받은 URL이면 저장된 이미지를 연결만 한다
+        if self.store:
+            entry = self.store.lookup(url)
+            if entry:
+                self.store.link(entry[0], entry[1], save_path, article_id, url)
+                self._log(f"이미 받은 이미지입니다. 다운로드 생략: {url}")
+                return None
+
+        with self._host_semaphore(url):
+            if self.cancelled.is_set():
+                return self.CANCELLED
+
+            temp_path = self.store.new_temp_path() if self.store else save_path + ".part"
+            try:
+                self._log(f"이미지 다운로드 중: {url}")
+                sha = hashlib.sha256()
+                with self.client.get(url, stream=True) as response:
+                    if response.status_code != 200:
+                        self._log(f"이미지 다운로드 실패. 상태 코드: {response.status_code}")
+                        return False
+
+                    with open(temp_path, 'wb') as file:
+                        for chunk in response.iter_content(64 * 1024):
+                            if self.cancelled.is_set():
+                                break
+                            sha.update(chunk)
+                            file.write(chunk)
+
+                if self.cancelled.is_set():
+                    os.remove(temp_path)
+                    return self.CANCELLED
+
+                if self.store:
+                    digest = sha.hexdigest()
+                    if not self.store.add(url, temp_path, digest, ext):
+                        self._log(f"같은 내용의 이미지가 이미 저장되어 있습니다: {url}")
+                    self.store.link(digest, ext, save_path, article_id, url)
+                else:
+                    os.replace(temp_path, save_path)
+                self._log(f"이미지 저장 완료: {save_path}")
+                return True
+            except Exception as e:
+                if os.path.exists(temp_path):
+                    os.remove(temp_path)
+                self._log(f"이미지 다운로드 중 오류 발생: {e}")
+                return False
+
+    def _finish(self, item, result):
+        """결과 집계 및 전달 (None은 이전 다운로드 재사용)"""
+        if result is self.CANCELLED:
+            return
+
+        with self.lock:
+            if result is None:
+                self.skipped_count += 1
+            elif result:
+                self.downloaded_count += 1
+            else:
+                self.failed_count += 1
+
+        if self.result_callback:
+            self.result_callback(*item, result)
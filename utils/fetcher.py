@@ -0,0 +1,183 @@
+from utils.http import HttpClient
+from utils.parser import parse_article_links, parse_image_urls
+
+CONTENT_SELECTOR = ".content-wrap"
+
+class HttpFetcher:
+    """
+    requests 세션과 BeautifulSoup으로 페이지를 수집하는 클래스
+    """
+    def __init__(self, client=None):
+        """
+        HTTP 수집기 초기화
+
+        Args:
+            client (HttpClient, optional): 공유할 HTTP 클라이언트
+        """
+        self.client = client or HttpClient()
+
+    def get_article_links(self, list_url):
+        """
+        게시글 목록 페이지에서 게시글 링크 가져오기
+
+        Args:
+            list_url (str): 목록 페이지 URL
+
+        Returns:
+            list: 게시글 URL 목록. 실패하면 None
+        """
+        html = self.client.get_text(list_url)
+        if html is None:
+            return None
+        return parse_article_links(html, list_url)
+
+    def get_image_urls(self, article_url):
+        """
+        게시글 페이지에서 이미지 주소 가져오기
+
+        Args:
+            article_url (str): 게시글 URL
+
+        Returns:
+            list: 이미지 URL 목록. 실패하면 None
+        """
+        html = self.client.get_text(article_url)
+        if html is None:
+            return None
+        return parse_image_urls(html, article_url)
+
+    def close(self):
+        """수집기 종료"""
+        self.client.close()
+
+class SeleniumFetcher:
+    """
+    브라우저(Selenium)로 자바스크립트 렌더링 후 페이지를 수집하는 클래스
+    """
+    def __init__(self, limiter=None, should_stop=None):
+        """
+        브라우저 수집기 초기화. 브라우저는 처음 사용할 때 브라우저 풀에서 빌린다.
+
+        Args:
+            limiter (RateLimiter, optional): 페이지 이동 속도 제한기
+            should_stop (callable, optional): True를 반환하면 속도 제한 대기를 중단
+        """
+        self.limiter = limiter
+        self.should_stop = should_stop
+        self.browser = None
+
+    def _get_browser(self):
+        """브라우저 지연 대여 (시작할 수 없으면 None)"""
+        if self.browser is None:
+            from utils.browser import get_browser_pool
+
+            # 이미지 주소만 필요하므로 이미지/광고를 받지 않는 가벼운 설정 사용
+            self.browser = get_browser_pool().acquire(
+                limiter=self.limiter, should_stop=self.should_stop, profile="light"
+            )
+        return self.browser
+
+    def get_article_links(self, list_url):
+        """
+        게시글 목록 페이지에서 게시글 링크 가져오기
+
+        Args:
+            list_url (str): 목록 페이지 URL
+
+        Returns:
+            list: 게시글 URL 목록. 실패하면 None
+        """
+        browser = self._get_browser()
+        if browser is None or not browser.get(list_url):
+            return None
+
+        articles = browser.extract_all("ul.post-list > li:not(.notice)", {"href": ("p.title a", "href")})
+        if articles is None:
+            return None
+        return [article["href"] for article in articles if article["href"]]
+
+    def get_image_urls(self, article_url):
+        """
+        게시글 페이지에서 이미지 주소 가져오기
+
+        Args:
+            article_url (str): 게시글 URL
+
+        Returns:
+            list: 이미지 URL 목록. 실패하면 None
+        """
+        browser = self._get_browser()
+        if browser is None or not browser.get(article_url):
+            return None
+
+        if browser.wait_for_selector(CONTENT_SELECTOR, timeout=10) is None:
+            return None
+
+        if browser.wait_for_selector(CONTENT_SELECTOR + " img", timeout=5) is None:
+            return []
+
+        images = browser.extract_all(CONTENT_SELECTOR + " img", {"src": (None, "src")})
+        if images is None:
+            return None
+        return [image["src"] for image in images if image["src"] and not image["src"].startswith("data:")]
+
+    def close(self):
+        """브라우저 풀에 브라우저 반납"""
+        if self.browser:
+            from utils.browser import get_browser_pool
+
+            get_browser_pool().release(self.browser)
+            self.browser = None
+
+class FallbackFetcher:
+    """
+    기본 수집기가 실패한 페이지만 보조 수집기로 다시 가져오는 클래스
+    """
+    def __init__(self, primary, fallback):
+        """
+        Args:
+            primary: 먼저 시도할 수집기 (HttpFetcher)
+            fallback: 기본 수집기 실패 시 사용할 수집기 (SeleniumFetcher)
+        """
+        self.primary = primary
+        self.fallback = fallback
+        self.fallback_count = 0
+
+    def get_article_links(self, list_url):
+        """게시글 링크 가져오기 (실패 시 보조 수집기 사용)"""
+        links = self.primary.get_article_links(list_url)
+        if links:
+            return links
+        self.fallback_count += 1
+        return self.fallback.get_article_links(list_url)
+
+    def get_image_urls(self, article_url):
+        """이미지 주소 가져오기 (실패 시 보조 수집기 사용)"""
+        urls = self.primary.get_image_urls(article_url)
+        if urls is not None:
+            return urls
+        self.fallback_count += 1
+        return self.fallback.get_image_urls(article_url)
+
+    def close(self):
+        """모든 수집기 종료"""
+        self.primary.close()
+        self.fallback.close()
+
+def create_fetcher(mode="http", client=None):
+    """
+    수집 방식에 맞는 수집기 생성
+
+    Args:
+        mode (str): "http" (HTTP 우선, 필요 시 브라우저) 또는 "browser" (브라우저만 사용)
+        client (HttpClient, optional): 공유할 HTTP 클라이언트 (속도 제한기를 브라우저와 공유)
+
+    Returns:
+        수집기 인스턴스
+    """
+    limiter = client.limiter if client else None
+    should_stop = client.should_stop if client else None
+    browser_fetcher = SeleniumFetcher(limiter=limiter, should_stop=should_stop)
+    if mode == "browser":
+        return browser_fetcher
+    return FallbackFetcher(HttpFetcher(client), browser_fetcher)
@@ -0,0 +1,134 @@
+import sqlite3
+import threading
+from datetime import datetime
+
+# 이미지 다운로드 상태
+STATE_PENDING = "pending"
+STATE_DONE = "done"
+STATE_FAILED = "failed"
+
+class CrawlFrontier:
+    """
+    방문한 게시글과 발견한 이미지의 다운로드 상태를 기록하는 영구 저장소 (SQLite)
+
+    작업이 중단되거나 비정상 종료되어도 다음 실행에서 방문한 게시글은 건너뛰고,
+    다운로드가 끝나지 않은 이미지부터 이어서 받을 수 있다.
+    """
+    def __init__(self, db_path):
+        """
+        크롤링 기록 초기화
+
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                image_count INTEGER NOT NULL DEFAULT 0,
+                visited_at TEXT NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS images (
+                article_id TEXT NOT NULL,
+                url TEXT NOT NULL,
+                save_path TEXT NOT NULL,
+                state TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (article_id, save_path)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_images_state ON images (state);
+        """)
+        self.conn.commit()
+
+    def _now(self):
+        """현재 시각 문자열"""
+        return datetime.now().isoformat(timespec="seconds")
+
+    def is_visited(self, article_id):
+        """
+        방문한 게시글인지 확인
+
+        Args:
+            article_id (str): 게시글 ID
+
+        Returns:
+            bool: 방문 여부
+        """
+        with self.lock:
+            row = self.conn.execute("SELECT 1 FROM articles WHERE id = ?", (article_id,)).fetchone()
+        return row is not None
+
+    def mark_visited(self, article_id, url, images):
+        """
+        게시글 방문 기록과 발견한 이미지를 한 트랜잭션으로 저장
+
+        Args:
+            article_id (str): 게시글 ID
+            url (str): 게시글 URL
+            images (list): (이미지 URL, 저장 경로) 목록
+        """
+        now = self._now()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO articles (id, url, image_count, visited_at) VALUES (?, ?, ?, ?)",
+                (article_id, url, len(images), now)
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO images (article_id, url, save_path, state, updated_at) VALUES (?, ?, ?, ?, ?)",
+                [(article_id, img_url, save_path, STATE_PENDING, now) for img_url, save_path in images]
+            )
+
+    def set_image_state(self, article_id, save_path, state):
+        """
+        이미지 다운로드 상태 변경
+
+        Args:
+            article_id (str): 게시글 ID
+            save_path (str): 저장 경로
+            state (str): STATE_PENDING, STATE_DONE, STATE_FAILED 중 하나
+        """
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE images SET state = ?, updated_at = ? WHERE article_id = ? AND save_path = ?",
+                (state, self._now(), article_id, save_path)
+            )
+
+    def pending_images(self):
+        """
+        다운로드가 끝나지 않은 이미지 목록
+
+        Returns:
+            list: (이미지 URL, 저장 경로, 게시글 ID) 목록
+        """
+        with self.lock:
+            return self.conn.execute(
+                "SELECT url, save_path, article_id FROM images WHERE state = ?", (STATE_PENDING,)
+            ).fetchall()
+
+    def stats(self):
+        """
+        기록 통계
+
+        Returns:
+            dict: 방문한 게시글 수와 상태별 이미지 수
+        """
+        with self.lock:
+            articles = self.conn.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+            states = dict(self.conn.execute("SELECT state, COUNT(*) FROM images GROUP BY state").fetchall())
+        return {"articles": articles, **states}
+
+    def reset(self):
+        """모든 기록 삭제"""
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM articles")
+            self.conn.execute("DELETE FROM images")
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,176 @@
+import requests
+from requests.adapters import HTTPAdapter
+
+from utils.logger import Logger
+from utils.rate_limiter import RETRY_STATUS_CODES, parse_retry_after
+
+# 일반 브라우저와 동일하게 보이도록 기본 헤더 설정
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/124.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+# 모든 HttpClient 세션에 등록할 응답 훅 (벤치마크 등 측정용, requests의 response 훅 형식)
+RESPONSE_HOOKS = []
+
+class RequestCancelled(requests.RequestException):
+    """속도 제한 대기 중 작업이 중단된 경우"""
+
+class HttpClient:
+    """
+    연결 풀을 공유하는 requests 세션 관리를 위한 유틸리티 클래스
+    """
+    def __init__(self, pool_size=10, timeout=10, cache=None, limiter=None, should_stop=None, max_retries=2,
+                 log_callback=None):
+        """
+        HTTP 클라이언트 초기화
+
+        Args:
+            pool_size (int): 호스트별로 유지할 연결 수
+            timeout (float): 요청 타임아웃(초)
+            cache (HttpCache, optional): 조건부 요청에 사용할 디스크 캐시
+            limiter (RateLimiter, optional): 요청 속도 제한기
+            should_stop (callable, optional): True를 반환하면 속도 제한 대기를 중단
+            max_retries (int): 429/5xx 응답 시 재시도 횟수 (속도 제한기가 있을 때만)
+            log_callback (callable, optional): get_text 실패 메시지를 받을 함수 (없으면 utils.logger에 기록)
+        """
+        self.timeout = timeout
+        self.cache = cache
+        self.limiter = limiter
+        self.should_stop = should_stop
+        self.max_retries = max_retries
+        self.log_callback = log_callback
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.hooks["response"].extend(RESPONSE_HOOKS)
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def get(self, url, params=None, should_stop=None, **kwargs):
+        """
+        GET 요청
+
+        Args:
+            url (str): 요청할 URL
+            params (dict, optional): 쿼리 파라미터
+            should_stop (callable, optional): 이 요청에만 쓸 중단 신호 (기본: 클라이언트의 should_stop)
+
+        Returns:
+            requests.Response: 응답 객체. 캐시를 사용한 경우 from_cache 속성이 True
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if self.cache is None or kwargs.get("stream"):
+            return self._send(url, should_stop, params=params, **kwargs)
+
+        return self._cached_get(url, params, should_stop, **kwargs)
+
+    def _send(self, url, should_stop=None, **kwargs):
+        """속도 제한을 지키며 요청 (429/5xx, 연결 오류 시 백오프 후 재시도)"""
+        if self.limiter is None:
+            return self.session.get(url, **kwargs)
+
+        for attempt in range(self.max_retries + 1):
+            if not self.limiter.acquire(url, should_stop or self.should_stop):
+                raise RequestCancelled("작업이 중단되었습니다.")
+
+            try:
+                response = self.session.get(url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.limiter.on_error(url)
+                if attempt == self.max_retries:
+                    raise
+                continue
+
+            if response.status_code not in RETRY_STATUS_CODES:
+                self.limiter.on_success(url)
+                return response
+
+            self.limiter.on_error(url, parse_retry_after(response.headers.get("Retry-After")))
+            if attempt == self.max_retries:
+                return response
+            response.close()
+
+    def _cached_get(self, url, params, should_stop=None, **kwargs):
+        """캐시를 이용한 조건부 GET 요청"""
+        full_url = requests.Request("GET", url, params=params).prepare().url
+        entry = self.cache.lookup(full_url)
+
+        # 만료되지 않은 항목은 요청 없이 사용
+        if entry and entry["fresh"]:
+            cached = self.cache.load(full_url)
+            if cached:
+                self.cache.record(True, len(cached[0]))
+                return self._cached_response(full_url, cached)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = self._send(full_url, should_stop, headers=headers, **kwargs)
+
+        if response.status_code == 304 and entry:
+            cached = self.cache.load(full_url)
+            if cached:
+                self.cache.refresh(full_url, response)
+                self.cache.record(True, len(cached[0]), revalidated=True)
+                return self._cached_response(full_url, cached, response)
+
+        self.cache.record(False)
+        if response.status_code == 200:
+            self.cache.store(full_url, response)
+        return response
+
+    def _cached_response(self, url, cached, original=None):
+        """캐시된 본문으로 응답 객체 생성"""
+        body, encoding = cached
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response._content = body
+        response.encoding = encoding
+        if original is not None:
+            response.headers.update(original.headers)
+        response.from_cache = True
+        return response
+
+    def get_text(self, url, params=None):
+        """
+        페이지 HTML 가져오기
+
+        Args:
+            url (str): 요청할 URL
+            params (dict, optional): 쿼리 파라미터
+
+        Returns:
+            str: 응답 본문. 실패하면 None
+        """
+        try:
+            response = self.get(url, params=params)
+        except RequestCancelled:
+            return None  # 중단 요청
+        except requests.RequestException as e:
+            self._log(f"페이지 요청 중 오류 발생: {e} ({url})")
+            return None
+
+        if response.status_code != 200:
+            self._log(f"페이지 요청 실패. HTTP 상태 코드: {response.status_code} ({url})")
+            return None
+
+        return response.text
+
+    def _log(self, message):
+        """오류 메시지 전달 (작업 로그 콜백이 없으면 로그 파일에 기록)"""
+        if self.log_callback:
+            self.log_callback(message)
+            return
+        Logger().warning(message)
+
+    def close(self):
+        """세션 종료"""
+        self.session.close()
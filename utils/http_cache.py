@@ -0,0 +1,218 @@
+import os
+import re
+import time
+import zlib
+import sqlite3
+import hashlib
+import threading
+
+class HttpCache:
+    """
+    조건부 요청(ETag/Last-Modified)을 위한 디스크 HTTP 캐시
+
+    응답 본문은 zlib으로 압축해 SQLite에 저장하고, 전체 크기가 제한을 넘으면
+    가장 오래 사용하지 않은 항목부터 삭제한다(LRU).
+    """
+    def __init__(self, cache_dir="cache", max_bytes=100 * 1024 * 1024):
+        """
+        HTTP 캐시 초기화
+
+        Args:
+            cache_dir (str): 캐시 디렉토리
+            max_bytes (int): 압축된 본문의 최대 저장 크기
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(cache_dir, "http_cache.sqlite3"), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                expires_at REAL,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at);
+        """)
+        self.conn.commit()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.saved_bytes = 0
+
+    def _key(self, url):
+        """URL에 해당하는 캐시 키"""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def lookup(self, url):
+        """
+        캐시 항목 조회
+
+        Args:
+            url (str): 쿼리 문자열을 포함한 전체 URL
+
+        Returns:
+            dict: etag, last_modified, fresh(재검증 없이 사용 가능 여부) 정보. 없으면 None
+        """
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT etag, last_modified, expires_at FROM entries WHERE key = ?", (self._key(url),)
+            ).fetchone()
+        if row is None:
+            return None
+
+        etag, last_modified, expires_at = row
+        return {
+            "etag": etag,
+            "last_modified": last_modified,
+            "fresh": expires_at is not None and expires_at > time.time()
+        }
+
+    def load(self, url):
+        """
+        캐시된 본문 가져오기 (사용 시각 갱신)
+
+        Args:
+            url (str): 전체 URL
+
+        Returns:
+            tuple: (본문 bytes, 인코딩). 없으면 None
+        """
+        key = self._key(url)
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT body, encoding FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (time.time(), key))
+        return zlib.decompress(row[0]), row[1]
+
+    def store(self, url, response):
+        """
+        응답을 캐시에 저장. 검증자(ETag/Last-Modified)나 max-age가 없으면 저장하지 않는다.
+
+        Args:
+            url (str): 전체 URL
+            response (requests.Response): 200 응답
+
+        Returns:
+            bool: 저장 여부
+        """
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control:
+            return False
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        expires_at = None
+        if "no-cache" not in cache_control:
+            match = re.search(r"max-age=(\d+)", cache_control)
+            if match:
+                expires_at = time.time() + int(match.group(1))
+
+        if not etag and not last_modified and expires_at is None:
+            return False
+
+        body = zlib.compress(response.content)
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries "
+                "(key, url, etag, last_modified, expires_at, encoding, body, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (self._key(url), url, etag, last_modified, expires_at, response.encoding,
+                 body, len(body), time.time())
+            )
+            self._evict()
+        return True
+
+    def refresh(self, url, response):
+        """
+        304 응답의 헤더로 캐시 항목의 만료 시각 갱신
+
+        Args:
+            url (str): 전체 URL
+            response (requests.Response): 304 응답
+        """
+        match = re.search(r"max-age=(\d+)", response.headers.get("Cache-Control", "").lower())
+        if not match:
+            return
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE entries SET expires_at = ? WHERE key = ?",
+                (time.time() + int(match.group(1)), self._key(url))
+            )
+
+    def _evict(self):
+        """최대 크기를 넘으면 오래 사용하지 않은 항목 삭제 (lock 안에서 호출)"""
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self.conn.execute("SELECT key, size FROM entries ORDER BY accessed_at").fetchall()
+        expired = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            expired.append((key,))
+            total -= size
+        self.conn.executemany("DELETE FROM entries WHERE key = ?", expired)
+
+    def record(self, hit, size=0, revalidated=False):
+        """
+        적중/실패 집계
+
+        Args:
+            hit (bool): 캐시 사용 여부
+            size (int): 캐시 덕분에 받지 않은 본문 크기
+            revalidated (bool): 304 재검증으로 사용했는지 여부
+        """
+        with self.lock:
+            if hit:
+                self.hits += 1
+                self.saved_bytes += size
+                if revalidated:
+                    self.revalidated += 1
+            else:
+                self.misses += 1
+
+    def hit_ratio(self):
+        """캐시 적중률 (0.0 ~ 1.0)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self):
+        """
+        캐시 통계
+
+        Returns:
+            dict: 적중/실패 횟수, 적중률, 절약한 바이트 수, 저장된 항목 수와 크기
+        """
+        with self.lock:
+            count, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+            "hit_ratio": self.hit_ratio(),
+            "saved_bytes": self.saved_bytes,
+            "entries": count,
+            "stored_bytes": size
+        }
+
+    def summary(self):
+        """로그용 통계 문자열"""
+        stats = self.stats()
+        return (f"캐시 적중 {stats['hits']}회 / 실패 {stats['misses']}회 "
+                f"(적중률 {stats['hit_ratio'] * 100:.0f}%, 절약 {stats['saved_bytes'] / 1024:.0f} KB)")
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self.lock:
+            self.conn.close()
@@ -0,0 +1,147 @@
+import os
+import json
+import shutil
+import threading
+from datetime import datetime
+
+class ImageStore:
+    """
+    내용 해시 기반으로 이미지를 한 번만 저장하는 저장소
+
+    - objects/<해시 앞 2자리>/<해시>.<확장자> : 실제 이미지 데이터 (한 번만 저장)
+    - url_index.jsonl : URL -> 해시 색인 (추가 기록 방식, 다음 실행에서도 재사용)
+    - manifest.jsonl : 게시글 ID, 파일 경로와 저장된 이미지의 대응 기록
+    """
+    def __init__(self, root_dir):
+        """
+        이미지 저장소 초기화
+
+        Args:
+            root_dir (str): 저장소 디렉토리
+        """
+        self.root_dir = root_dir
+        self.objects_dir = os.path.join(root_dir, "objects")
+        self.temp_dir = os.path.join(root_dir, "tmp")
+        self.index_path = os.path.join(root_dir, "url_index.jsonl")
+        self.manifest_path = os.path.join(root_dir, "manifest.jsonl")
+        self.lock = threading.Lock()
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.temp_dir, exist_ok=True)
+
+        self.url_index = self._load_index()
+        self.stored_count = 0
+        self.duplicate_count = 0
+        self.saved_bytes = 0
+
+    def _load_index(self):
+        """URL 색인 로드"""
+        index = {}
+        if not os.path.exists(self.index_path):
+            return index
+
+        with open(self.index_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue  # 비정상 종료로 잘린 마지막 줄 무시
+                index[entry["url"]] = (entry["hash"], entry["ext"])
+        return index
+
+    def _append(self, path, entry):
+        """JSONL 파일에 한 줄 추가"""
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def blob_path(self, digest, ext):
+        """
+        해시에 해당하는 저장 경로
+
+        Args:
+            digest (str): SHA-256 해시
+            ext (str): 파일 확장자
+
+        Returns:
+            str: 이미지 데이터 경로
+        """
+        return os.path.join(self.objects_dir, digest[:2], f"{digest}.{ext}")
+
+    def lookup(self, url):
+        """
+        이미 받은 URL인지 확인
+
+        Args:
+            url (str): 이미지 URL
+
+        Returns:
+            tuple: (해시, 확장자). 없거나 데이터가 사라졌으면 None
+        """
+        with self.lock:
+            entry = self.url_index.get(url)
+        if entry and os.path.exists(self.blob_path(*entry)):
+            return entry
+        return None
+
+    def new_temp_path(self):
+        """다운로드용 임시 파일 경로 생성"""
+        return os.path.join(self.temp_dir, f"{threading.get_ident()}_{os.urandom(4).hex()}.part")
+
+    def add(self, url, temp_path, digest, ext):
+        """
+        다운로드한 파일을 저장소에 추가. 같은 내용이 이미 있으면 임시 파일만 삭제한다.
+
+        Args:
+            url (str): 이미지 URL
+            temp_path (str): 다운로드된 임시 파일
+            digest (str): 파일 내용의 SHA-256 해시
+            ext (str): 파일 확장자
+
+        Returns:
+            bool: 새로 저장되었으면 True, 중복이면 False
+        """
+        with self.lock:
+            blob = self.blob_path(digest, ext)
+            if os.path.exists(blob):
+                self.saved_bytes += os.path.getsize(temp_path)
+                os.remove(temp_path)
+                self.duplicate_count += 1
+                is_new = False
+            else:
+                os.makedirs(os.path.dirname(blob), exist_ok=True)
+                os.replace(temp_path, blob)
+                self.stored_count += 1
+                is_new = True
+
+            if url not in self.url_index:
+                self.url_index[url] = (digest, ext)
+                self._append(self.index_path, {"url": url, "hash": digest, "ext": ext})
+        return is_new
+
+    def link(self, digest, ext, save_path, article_id=None, url=None):
+        """
+        저장된 이미지를 다운로드 폴더에 연결 (하드링크, 실패 시 복사)
+
+        Args:
+            digest (str): SHA-256 해시
+            ext (str): 파일 확장자
+            save_path (str): 사용자에게 보일 파일 경로
+            article_id (str, optional): 게시글 ID
+            url (str, optional): 이미지 URL
+        """
+        blob = self.blob_path(digest, ext)
+        if not os.path.exists(save_path):
+            try:
+                os.link(blob, save_path)
+            except OSError:
+                # 하드링크를 지원하지 않는 파일 시스템
+                shutil.copyfile(blob, save_path)
+
+        with self.lock:
+            self._append(self.manifest_path, {
+                "article": article_id,
+                "url": url,
+                "hash": digest,
+                "path": os.path.basename(save_path),
+                "time": datetime.now().isoformat(timespec="seconds")
+            })
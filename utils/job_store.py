@@ -0,0 +1,244 @@
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+# 작업 상태
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_DONE = "done"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+JOB_NEEDS_CREDENTIALS = "needs_credentials"  # 비밀번호를 다시 입력해야 실행할 수 있음 (앱 재시작 후 등)
+
+# 저장하지 않는 작업 인자 (메모리에만 보관)
+SECRET_PARAMS = ("password",)
+
+class JobStore:
+    """
+    예약된 작업 목록을 보관하는 영구 저장소 (SQLite)
+
+    앱을 종료해도 대기 중인 작업은 남아 다음 실행에서 이어서 처리된다.
+    비밀번호 같은 인자는 파일에 저장하지 않는다.
+    """
+    def __init__(self, db_path):
+        """
+        작업 저장소 초기화
+
+        Args:
+            db_path (str): SQLite 데이터베이스 파일 경로
+        """
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                task TEXT NOT NULL,
+                params TEXT NOT NULL,
+                priority INTEGER NOT NULL DEFAULT 0,
+                resource TEXT NOT NULL,
+                state TEXT NOT NULL,
+                message TEXT NOT NULL DEFAULT '',
+                metrics TEXT NOT NULL DEFAULT '{}',
+                created_at TEXT NOT NULL,
+                started_at TEXT,
+                finished_at TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_queue ON jobs (state, priority DESC, id);
+        """)
+        self.conn.commit()
+
+    def _now(self):
+        """현재 시각 문자열"""
+        return datetime.now().isoformat(timespec="seconds")
+
+    def _to_dict(self, row):
+        """조회 결과 행을 딕셔너리로 변환"""
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["metrics"] = json.loads(job["metrics"])
+        return job
+
+    def add(self, name, task, params, priority=0, resource="http"):
+        """
+        작업 추가
+
+        Args:
+            name (str): 표시 이름
+            task (str): 작업 종류 (modules.jobs.TASK_TYPES)
+            params (dict): 작업 인자 (SECRET_PARAMS는 저장하지 않음)
+            priority (int): 우선순위 (클수록 먼저 실행)
+            resource (str): 사용하는 자원 ("browser" 또는 "http")
+
+        Returns:
+            int: 작업 ID
+        """
+        stored = {key: value for key, value in params.items() if key not in SECRET_PARAMS}
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "INSERT INTO jobs (name, task, params, priority, resource, state, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, task, json.dumps(stored, ensure_ascii=False), priority, resource, JOB_QUEUED, self._now())
+            )
+        return cursor.lastrowid
+
+    def get(self, job_id):
+        """작업 하나 조회 (없으면 None)"""
+        with self.lock:
+            row = self.conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, states=None):
+        """
+        작업 목록 조회
+
+        Args:
+            states (tuple, optional): 조회할 상태 (None이면 전체)
+
+        Returns:
+            list: 작업 딕셔너리 목록 (ID 순)
+        """
+        query = "SELECT * FROM jobs"
+        args = ()
+        if states:
+            query += f" WHERE state IN ({', '.join('?' * len(states))})"
+            args = tuple(states)
+        with self.lock:
+            rows = self.conn.execute(query + " ORDER BY id", args).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def next_queued(self, resources):
+        """
+        실행할 다음 작업 (우선순위가 높고 먼저 추가된 순)
+
+        Args:
+            resources (tuple): 지금 실행할 수 있는 자원 종류
+
+        Returns:
+            dict: 작업. 없으면 None
+        """
+        if not resources:
+            return None
+        with self.lock:
+            row = self.conn.execute(
+                f"SELECT * FROM jobs WHERE state = ? AND resource IN ({', '.join('?' * len(resources))}) "
+                "ORDER BY priority DESC, id LIMIT 1",
+                (JOB_QUEUED,) + tuple(resources)
+            ).fetchone()
+        return self._to_dict(row) if row else None
+
+    def mark_running(self, job_id):
+        """
+        대기 중인 작업의 실행 시작 기록
+
+        Returns:
+            bool: 실행 상태로 바꿨으면 True (그 사이 취소되어 대기 상태가 아니면 False)
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET state = ?, started_at = ?, message = '' WHERE id = ? AND state = ?",
+                (JOB_RUNNING, self._now(), job_id, JOB_QUEUED)
+            )
+        return cursor.rowcount > 0
+
+    def mark_needs_credentials(self, job_id, message):
+        """비밀번호가 없어 실행하지 못한 작업 기록 (provide_credentials 후 다시 대기)"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET state = ?, message = ? WHERE id = ?",
+                (JOB_NEEDS_CREDENTIALS, message, job_id)
+            )
+
+    def requeue_waiting(self, job_id):
+        """
+        비밀번호를 기다리던 작업을 다시 대기 상태로
+
+        Returns:
+            bool: 다시 대기시켰으면 True
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET state = ?, message = '' WHERE id = ? AND state = ?",
+                (JOB_QUEUED, job_id, JOB_NEEDS_CREDENTIALS)
+            )
+        return cursor.rowcount > 0
+
+    def mark_finished(self, job_id, state, message, metrics=None):
+        """
+        실행 결과 기록
+
+        Args:
+            job_id (int): 작업 ID
+            state (str): JOB_DONE, JOB_FAILED, JOB_CANCELLED 또는 다시 대기시킬 때 JOB_QUEUED
+            message (str): 결과 메시지
+            metrics (dict, optional): Task.metrics() 결과
+        """
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET state = ?, message = ?, metrics = ?, finished_at = ? WHERE id = ?",
+                (state, message, json.dumps(metrics or {}, ensure_ascii=False), self._now(), job_id)
+            )
+
+    def cancel_queued(self, job_id):
+        """
+        대기 중인(비밀번호를 기다리는 작업 포함) 작업 취소
+
+        Returns:
+            bool: 취소되었으면 True (이미 실행 중이거나 끝난 작업이면 False)
+        """
+        with self.lock, self.conn:
+            cursor = self.conn.execute(
+                "UPDATE jobs SET state = ?, finished_at = ? WHERE id = ? AND state IN (?, ?)",
+                (JOB_CANCELLED, self._now(), job_id, JOB_QUEUED, JOB_NEEDS_CREDENTIALS)
+            )
+        return cursor.rowcount > 0
+
+    def update_metrics(self, job_id, metrics):
+        """실행 중인 작업의 진행 상황 기록 (앱이 도중에 종료되어도 어디까지 처리했는지 남김)"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "UPDATE jobs SET metrics = ? WHERE id = ?",
+                (json.dumps(metrics, ensure_ascii=False), job_id)
+            )
+
+    def requeue_running(self, repeatable=None, message=""):
+        """
+        실행 중으로 남은 작업 정리 (앱이 작업 도중 종료된 경우)
+
+        다시 실행해도 되는 작업은 대기 상태로 되돌리고, 나머지(쓰기 작업)는 기록된 진행 상황을 남긴 채
+        취소 상태로 바꿔 다시 실행할지 사용자가 정하게 한다.
+
+        Args:
+            repeatable (callable, optional): 작업 딕셔너리를 받아 다시 실행해도 되면 True를 반환 (없으면 모두 다시 대기)
+            message (str): 취소한 작업에 남길 메시지
+
+        Returns:
+            int: 다시 대기시킨 작업 수
+        """
+        jobs = self.list((JOB_RUNNING,))
+        requeued = [job["id"] for job in jobs if repeatable is None or repeatable(job)]
+        stopped = [job["id"] for job in jobs if job["id"] not in requeued]
+        with self.lock, self.conn:
+            self.conn.executemany("UPDATE jobs SET state = ? WHERE id = ?", [(JOB_QUEUED, job_id) for job_id in requeued])
+            self.conn.executemany(
+                "UPDATE jobs SET state = ?, message = ?, finished_at = ? WHERE id = ?",
+                [(JOB_CANCELLED, message, self._now(), job_id) for job_id in stopped]
+            )
+        return len(requeued)
+
+    def clear_finished(self):
+        """끝난 작업(완료/실패/취소) 기록 삭제"""
+        with self.lock, self.conn:
+            self.conn.execute(
+                "DELETE FROM jobs WHERE state IN (?, ?, ?)",
+                (JOB_DONE, JOB_FAILED, JOB_CANCELLED)
+            )
+
+    def close(self):
+        """데이터베이스 연결 종료"""
+        with self.lock:
+            self.conn.close()
@@ -1,59 +1,123 @@
 import os
+import json
+import queue
+import atexit
 import logging
+import threading
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+
+from utils.config import Config
+
+LOGGER_NAME = "OrbiApp"
+
+# 처음 Logger를 만들 때 한 번만 설정하는 공유 상태
+_setup_lock = threading.Lock()
+_listener = None
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체로 기록하는 포맷터"""
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "name": record.name,
+            "thread": record.threadName,
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+def _create_file_handler(log_dir, settings):
+    """설정에 따라 크기 또는 날짜 기준으로 교체되는 파일 핸들러 생성"""
+    extension = ".jsonl" if settings.get("json") else ".log"
+    log_path = os.path.join(log_dir, "orbiapp" + extension)
+    backup_count = settings.get("backup_count", 30)
+
+    if settings.get("rotation") == "size":
+        return RotatingFileHandler(
+            log_path,
+            maxBytes=settings.get("max_bytes", 5 * 1024 * 1024),
+            backupCount=backup_count,
+            encoding='utf-8'
+        )
+    return TimedRotatingFileHandler(log_path, when="midnight", backupCount=backup_count, encoding='utf-8')
+
+def _setup(log_dir):
+    """OrbiApp 로거에 큐 핸들러를 한 번만 연결하고 파일/콘솔 기록 스레드 시작"""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return
+
+        settings = Config().get("logging") or {}
+        os.makedirs(log_dir, exist_ok=True)
+
+        # 포맷 설정
+        if settings.get("json"):
+            formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
+        handlers = [_create_file_handler(log_dir, settings)]
+        if settings.get("console", True):
+            handlers.append(logging.StreamHandler())
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        # 호출한 스레드는 큐에 넣기만 하고, 실제 기록은 별도 스레드가 처리
+        log_queue = queue.SimpleQueue()
+        logger = logging.getLogger(LOGGER_NAME)
+        logger.setLevel(getattr(logging, str(settings.get("level", "INFO")).upper(), logging.INFO))
+        logger.propagate = False
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        logger.addHandler(QueueHandler(log_queue))
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+
+def shutdown_logging():
+    """남은 로그를 모두 기록하고 기록 스레드 종료"""
+    global _listener
+    with _setup_lock:
+        listener, _listener = _listener, None
+    if listener:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
 class Logger:
     """
     로깅 기능을 제공하는 유틸리티 클래스
+
+    여러 곳에서 만들어도 같은 로거를 공유하며, 파일/콘솔 기록은 별도 스레드에서 처리된다.
+    로그 파일 교체 방식과 JSON 형식은 설정 파일의 logging 섹션으로 정한다.
     """
     def __init__(self, log_dir="logs"):
         """
         로거 초기화
-        
+
         Args:
-            log_dir (str): 로그 파일이 저장될 디렉토리
+            log_dir (str): 로그 파일이 저장될 디렉토리 (처음 만들 때만 적용)
         """
-        # 로그 디렉토리 생성
-        if not os.path.exists(log_dir):
-            os.makedirs(log_dir)
-            
-        # 로그 파일명 설정 (현재 날짜 기준)
-        log_filename = f"{datetime.now().strftime('%Y-%m-%d')}.log"
-        log_path = os.path.join(log_dir, log_filename)
-        
-        # 로거 설정
-        self.logger = logging.getLogger("OrbiApp")
-        self.logger.setLevel(logging.INFO)
-        
-        # 파일 핸들러 설정
-        file_handler = logging.FileHandler(log_path, encoding='utf-8')
-        file_handler.setLevel(logging.INFO)
-        
-        # 콘솔 핸들러 설정
-        console_handler = logging.StreamHandler()
-        console_handler.setLevel(logging.INFO)
-        
-        # 포맷 설정
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        file_handler.setFormatter(formatter)
-        console_handler.setFormatter(formatter)
-        
-        # 핸들러 추가
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-        
+        _setup(log_dir)
+        self.logger = logging.getLogger(LOGGER_NAME)
+
     def info(self, message):
         """정보 로그 기록"""
         self.logger.info(message)
-        
+
     def warning(self, message):
         """경고 로그 기록"""
         self.logger.warning(message)
-        
+
     def error(self, message):
         """오류 로그 기록"""
         self.logger.error(message)
-        
+
     def debug(self, message):
         """디버그 로그 기록"""
         self.logger.debug(message)
@@ -0,0 +1,149 @@
+import re
+from urllib.parse import urljoin
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml이 설치되어 있으면 더 빠른 lxml 파서 사용
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+# 게시글 목록/본문 영역만 파싱하도록 제한
+POST_LIST_STRAINER = SoupStrainer("ul", class_="post-list")
+CONTENT_STRAINER = SoupStrainer(class_="content-wrap")
+
+POST_ID_PATTERN = re.compile(r"/(\d+)(?:[/?#]|$)")
+
+def make_soup(html, strainer=None):
+    """
+    HTML 파싱
+
+    Args:
+        html (str): HTML 문자열
+        strainer (SoupStrainer, optional): 파싱할 영역 제한
+
+    Returns:
+        BeautifulSoup: 파싱 결과
+    """
+    return BeautifulSoup(html, HTML_PARSER, parse_only=strainer)
+
+def post_id_from_href(href):
+    """
+    게시글 링크에서 게시글 ID 추출
+
+    Args:
+        href (str): 게시글 링크
+
+    Returns:
+        str: 게시글 ID. 없으면 None
+    """
+    if not href:
+        return None
+    match = POST_ID_PATTERN.search(href)
+    if match:
+        return match.group(1)
+    return href.rstrip('/').split('/')[-1] or None
+
+def _element_text(element):
+    """
+    요소의 글자 (앞뒤 공백만 제거)
+
+    get_text(strip=True)는 텍스트 조각마다 공백을 지운 뒤 붙이므로 "Hello <b>world</b>"가 "Helloworld"가 된다.
+    """
+    return element.get_text().strip()
+
+def _parse_post_item(li):
+    """목록 항목 하나에서 제목/ID/날짜/게시판을 한 번의 순회로 추출"""
+    title_element = first_link = date_element = board_element = time_element = None
+
+    for tag in li.find_all(True):
+        name = tag.name
+        classes = tag.get("class") or ()
+        if name == "p" and title_element is None and "title" in classes:
+            title_element = tag
+        elif name == "a" and first_link is None:
+            first_link = tag
+        elif name == "time" and time_element is None:
+            time_element = tag
+
+        if date_element is None and "date" in classes:
+            date_element = tag
+        if board_element is None and ("board" in classes or "category" in classes):
+            board_element = tag
+
+    # 제목 안의 링크를 우선 사용
+    link = (title_element.find("a") if title_element is not None else None) or first_link
+    date_element = date_element or time_element
+    return {
+        "id": post_id_from_href(link.get("href")) if link is not None else None,
+        "title": _element_text(title_element) if title_element is not None else "",
+        "date": _element_text(date_element) if date_element is not None else None,
+        "board": _element_text(board_element) if board_element is not None else None
+    }
+
+def parse_post_items(html):
+    """
+    게시글 목록(검색 결과, 내 글 목록) HTML에서 공지사항이 아닌 항목 추출
+
+    Args:
+        html (str): 목록 페이지 HTML
+
+    Returns:
+        list: {"id", "title", "date", "board"} 목록 (title이 없는 항목은 빈 문자열).
+            목록 영역이 없으면 None
+    """
+    post_list = make_soup(html, POST_LIST_STRAINER).find("ul")
+    if post_list is None:
+        return None
+
+    items = []
+    for li in post_list.find_all("li", recursive=False):  # 댓글/태그 목록 같은 안쪽 li 제외
+        if "notice" in (li.get("class") or ()):
+            continue
+        items.append(_parse_post_item(li))
+    return items
+
+def parse_article_links(html, base_url):
+    """
+    게시글 목록 HTML에서 게시글 링크 추출
+
+    Args:
+        html (str): 목록 페이지 HTML
+        base_url (str): 상대 경로를 변환할 기준 URL
+
+    Returns:
+        list: 게시글 절대 URL 목록. 목록 영역이 없으면 None
+    """
+    post_list = make_soup(html, POST_LIST_STRAINER).find("ul")
+    if post_list is None:
+        return None
+
+    links = []
+    for a in post_list.select(":scope > li:not(.notice) p.title a"):
+        href = a.get("href")
+        if href:
+            links.append(urljoin(base_url, href))
+    return links
+
+def parse_image_urls(html, base_url):
+    """
+    게시글 본문 HTML에서 이미지 주소 추출
+
+    Args:
+        html (str): 게시글 페이지 HTML
+        base_url (str): 상대 경로를 변환할 기준 URL
+
+    Returns:
+        list: 이미지 절대 URL 목록. 본문 영역이 없으면 None
+    """
+    content = make_soup(html, CONTENT_STRAINER).find(class_="content-wrap")
+    if content is None:
+        return None
+
+    urls = []
+    for img in content.find_all("img"):
+        src = img.get("src") or img.get("data-src")
+        if src and not src.startswith("data:"):
+            urls.append(urljoin(base_url, src))
+    return urls
@@ -0,0 +1,91 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+class StopSignal(threading.Event):
+    """
+    미리 가져오기 중단 신호
+
+    set()으로 중단하거나 상위 중단 신호(작업 중단 등)가 켜지면 중단된다.
+    호출하면 중단 여부를 반환하고 wait(timeout)으로 대기할 수 있어 속도 제한기의 should_stop 자리에 넘길 수 있다.
+    """
+    poll_interval = 0.1  # 상위 중단 신호 확인 간격(초)
+
+    def __init__(self, parent=None):
+        """
+        중단 신호 초기화
+
+        Args:
+            parent (callable, optional): True를 반환하면 함께 중단할 상위 중단 신호
+        """
+        super().__init__()
+        self.parent = parent
+
+    def __call__(self):
+        return self.is_set() or bool(self.parent and self.parent())
+
+    def wait(self, timeout=None):
+        """중단되거나 timeout이 지날 때까지 대기 (상위 중단 신호는 poll_interval마다 확인)"""
+        if self.parent is None:
+            return super().wait(timeout)
+        remaining = timeout
+        while not self():
+            interval = self.poll_interval if remaining is None else min(self.poll_interval, remaining)
+            if interval <= 0:
+                break
+            super().wait(interval)
+            if remaining is not None:
+                remaining -= interval
+        return self()
+
+class PagePrefetcher:
+    """
+    다음 페이지들을 미리 병렬로 가져오고 결과는 페이지 순서대로 돌려주는 클래스
+
+    현재 페이지를 처리하는 동안 최대 depth개의 페이지 요청이 동시에 진행된다.
+    마지막 페이지를 만나 반복을 멈추면 close()로 남은 요청을 중단하고 작업 스레드가 끝날 때까지 기다린다.
+    """
+    def __init__(self, fetch_page, start_page=1, depth=4, should_stop=None):
+        """
+        페이지 미리 가져오기 초기화
+
+        Args:
+            fetch_page (callable): (페이지 번호, 중단 신호)를 받아 결과를 반환하는 함수.
+                중단 신호(StopSignal)는 HttpClient.get(should_stop=...)에 넘겨 close() 시 속도 제한 대기를 멈춘다.
+            start_page (int): 첫 페이지 번호
+            depth (int): 동시에 진행할 최대 요청 수 (1이면 순차 처리)
+            should_stop (callable, optional): True를 반환하면 요청을 중단할 상위 중단 신호 (작업의 cancel 등)
+        """
+        self.fetch_page = fetch_page
+        self.start_page = start_page
+        self.depth = max(1, depth)
+        self.stop = StopSignal(should_stop)
+        self.executor = ThreadPoolExecutor(max_workers=self.depth, thread_name_prefix="PagePrefetch")
+        self.futures = {}
+        self.next_page = start_page
+        self.closed = False
+
+    def __iter__(self):
+        """(페이지 번호, 결과)를 페이지 순서대로 반환"""
+        page = self.start_page
+        while not self.closed:
+            # 현재 페이지부터 depth개까지 요청 유지
+            while self.next_page < page + self.depth:
+                self.futures[self.next_page] = self.executor.submit(self.fetch_page, self.next_page, self.stop)
+                self.next_page += 1
+
+            future = self.futures.pop(page)
+            yield page, future.result()
+            page += 1
+
+    def close(self):
+        """
+        남은 요청을 중단하고 진행 중인 요청이 끝날 때까지 대기
+
+        반환된 뒤에는 fetch_page가 더 이상 실행되지 않으므로 클라이언트와 캐시를 닫아도 된다.
+        """
+        self.closed = True
+        self.stop.set()
+        for future in self.futures.values():
+            future.cancel()
+        self.futures = {}
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,178 @@
+import time
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+from utils.config import Config
+
+# 서버가 속도 제한/과부하를 알리는 상태 코드
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+class _Bucket:
+    """호스트별 토큰 버킷 상태"""
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self.backoff = 0.0
+
+class RateLimiter:
+    """
+    호스트별 토큰 버킷 방식의 요청 속도 제한기
+
+    허용된 속도까지는 대기 없이 요청하고, 429/5xx 응답이나 연결 오류가 나면
+    Retry-After 또는 지수 백오프만큼 해당 호스트의 요청을 멈춘다.
+    """
+    def __init__(self, rate=3.0, burst=3, base_backoff=1.0, max_backoff=60.0, host_limits=None):
+        """
+        속도 제한기 초기화
+
+        Args:
+            rate (float): 호스트별 초당 요청 수
+            burst (int): 연속으로 허용할 최대 요청 수
+            base_backoff (float): 첫 오류 시 대기 시간(초)
+            max_backoff (float): 최대 대기 시간(초)
+            host_limits (dict, optional): {호스트: [초당 요청 수, 버스트]} 형태의 호스트별 설정
+        """
+        self.rate = rate
+        self.burst = burst
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.host_limits = host_limits or {}
+        self.lock = threading.Lock()
+        self.buckets = {}
+
+    def _bucket(self, url):
+        """URL의 호스트에 해당하는 버킷 (lock 안에서 호출)"""
+        host = urlparse(url).netloc or url
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            rate, burst = self.host_limits.get(host, (self.rate, self.burst))
+            bucket = _Bucket(rate, burst)
+            self.buckets[host] = bucket
+        return bucket
+
+    def acquire(self, url, should_stop=None):
+        """
+        요청 전 호출. 허용될 때까지 대기한다.
+
+        Args:
+            url (str): 요청할 URL (호스트 단위로 제한)
+            should_stop (callable, optional): True를 반환하면 대기를 중단
+                (wait(timeout)이 있는 중단 신호면 대기 중에도 바로 깨어남)
+
+        Returns:
+            bool: 요청 가능하면 True, 대기 중 중단되면 False
+        """
+        wait_for_stop = getattr(should_stop, "wait", None)
+        while True:
+            with self.lock:
+                bucket = self._bucket(url)
+                now = time.monotonic()
+                bucket.tokens = min(bucket.burst, bucket.tokens + (now - bucket.updated) * bucket.rate)
+                bucket.updated = now
+
+                if bucket.blocked_until > now:
+                    wait = bucket.blocked_until - now
+                elif bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return True
+                else:
+                    wait = (1 - bucket.tokens) / bucket.rate
+
+            if should_stop and should_stop():
+                return False
+            if wait_for_stop:
+                wait_for_stop(wait)
+            else:
+                time.sleep(min(wait, 0.2))
+
+    def on_success(self, url):
+        """
+        요청 성공 시 호출. 백오프를 절반씩 줄인다.
+
+        Args:
+            url (str): 요청한 URL
+        """
+        with self.lock:
+            bucket = self._bucket(url)
+            bucket.backoff = bucket.backoff / 2 if bucket.backoff > self.base_backoff else 0.0
+
+    def on_error(self, url, retry_after=None):
+        """
+        요청 실패(429/5xx, 연결 오류) 시 호출. 해당 호스트의 요청을 잠시 멈춘다.
+
+        Args:
+            url (str): 요청한 URL
+            retry_after (float, optional): 서버가 알려준 대기 시간(초)
+
+        Returns:
+            float: 적용된 대기 시간(초)
+        """
+        with self.lock:
+            bucket = self._bucket(url)
+            bucket.backoff = min(self.max_backoff, bucket.backoff * 2 if bucket.backoff else self.base_backoff)
+            delay = max(bucket.backoff, retry_after or 0.0)
+            bucket.blocked_until = max(bucket.blocked_until, time.monotonic() + delay)
+            bucket.tokens = 0
+        return delay
+
+def parse_retry_after(value):
+    """
+    Retry-After 헤더 값을 초 단위로 변환
+
+    Args:
+        value (str): 초 또는 HTTP 날짜 형식의 헤더 값
+
+    Returns:
+        float: 대기 시간(초). 해석할 수 없으면 None
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+_shared_limiter = None
+_shared_lock = threading.Lock()
+
+def get_limiter():
+    """
+    모든 워커가 공유하는 속도 제한기 반환 (설정 파일의 network 섹션 사용)
+
+    Returns:
+        RateLimiter: 프로세스 전역 속도 제한기
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            network = Config().get("network") or {}
+            _shared_limiter = RateLimiter(
+                rate=network.get("requests_per_second", 3.0),
+                burst=network.get("burst", 3),
+                max_backoff=network.get("max_backoff", 60.0),
+                host_limits=network.get("host_limits")
+            )
+        return _shared_limiter
+
+def set_limiter(limiter):
+    """
+    모든 워커가 공유할 속도 제한기 교체 (벤치마크 등에서 사용)
+
+    Args:
+        limiter (RateLimiter): 새 속도 제한기
+    """
+    global _shared_limiter
+    with _shared_lock:
+        _shared_limiter = limiter
@@ -0,0 +1,377 @@
+import os
+import sys
+import hmac
+import json
+import time
+import hashlib
+import threading
+
+import requests
+
+from utils.http import HttpClient
+from utils.site import login_url, site_url
+
+# 로그인이 필요한 페이지 (로그인하지 않으면 로그인 페이지로 이동됨)
+VALIDATE_PATH = "/my/post"
+
+# 세션과 함께 저장하는 비밀번호 확인값(PBKDF2)의 반복 횟수
+PASSWORD_HASH_ITERATIONS = 100000
+
+def _hash_password(password, salt=None):
+    """비밀번호 확인값 생성 ("salt$hash" 형식, 비밀번호 자체는 저장하지 않음)"""
+    salt = salt or os.urandom(16).hex()
+    digest = hashlib.pbkdf2_hmac('sha256', password.encode('utf-8'), salt.encode('ascii'), PASSWORD_HASH_ITERATIONS)
+    return f"{salt}${digest.hex()}"
+
+class _DpapiProtector:
+    """Windows 사용자 계정에 묶인 DPAPI 암호화"""
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class DataBlob(ctypes.Structure):
+            _fields_ = [("cbData", wintypes.DWORD), ("pbData", ctypes.POINTER(ctypes.c_char))]
+
+        self.ctypes = ctypes
+        self.DataBlob = DataBlob
+        self.crypt32 = ctypes.windll.crypt32
+        self.kernel32 = ctypes.windll.kernel32
+
+    def _call(self, func, data):
+        ctypes = self.ctypes
+        buffer = ctypes.create_string_buffer(data, len(data))
+        blob_in = self.DataBlob(len(data), ctypes.cast(buffer, ctypes.POINTER(ctypes.c_char)))
+        blob_out = self.DataBlob()
+        if not func(ctypes.byref(blob_in), None, None, None, None, 0, ctypes.byref(blob_out)):
+            raise OSError("DPAPI 처리 실패")
+        try:
+            return ctypes.string_at(blob_out.pbData, blob_out.cbData)
+        finally:
+            self.kernel32.LocalFree(blob_out.pbData)
+
+    def encrypt(self, data):
+        return self._call(self.crypt32.CryptProtectData, data)
+
+    def decrypt(self, data):
+        return self._call(self.crypt32.CryptUnprotectData, data)
+
+class _FernetProtector:
+    """cryptography 패키지의 Fernet 암호화 (키는 사용자만 읽을 수 있는 파일에 보관)"""
+    def __init__(self, key_path):
+        from cryptography.fernet import Fernet
+
+        if not os.path.exists(key_path):
+            fd = os.open(key_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(Fernet.generate_key())
+        with open(key_path, 'rb') as f:
+            self.fernet = Fernet(f.read())
+
+    def encrypt(self, data):
+        return self.fernet.encrypt(data)
+
+    def decrypt(self, data):
+        return self.fernet.decrypt(data)
+
+def _create_protector(session_dir):
+    """사용 가능한 암호화 방식 선택. 없으면 None (디스크에 저장하지 않음)"""
+    if sys.platform == 'win32':
+        try:
+            return _DpapiProtector()
+        except (ImportError, AttributeError, OSError):
+            pass
+    try:
+        return _FernetProtector(os.path.join(session_dir, "session.key"))
+    except ImportError:
+        print("cryptography 패키지가 없어 로그인 세션을 디스크에 저장하지 않습니다. (pip install cryptography)")
+        return None
+
+class SessionManager:
+    """
+    로그인 세션(쿠키) 관리를 위한 유틸리티 클래스
+
+    한 번 로그인한 쿠키를 암호화해 디스크에 저장하고, 다음 작업에서는 가벼운 HTTP 요청으로
+    유효한지만 확인한 뒤 Selenium 드라이버나 requests 세션에 넣어 로그인 과정을 건너뛴다.
+    세션에는 로그인한 비밀번호의 확인값을 함께 저장해, 입력한 비밀번호가 다르면 세션을 쓰지 않고 다시 로그인한다.
+    (비밀번호를 비워 두면 저장된 세션을 그대로 사용한다. 예약 작업을 앱 재시작 후 이어서 실행할 때 등)
+    암호화는 Windows에서는 DPAPI, 그 외에는 cryptography 패키지(requirements.txt)를 사용하며,
+    둘 다 사용할 수 없으면 쿠키를 메모리에만 보관해 앱을 다시 시작하면 다시 로그인한다.
+    """
+    def __init__(self, session_dir="sessions", validate_interval=300):
+        """
+        세션 관리자 초기화
+
+        Args:
+            session_dir (str): 암호화된 쿠키 파일을 저장할 디렉토리
+            validate_interval (float): 마지막 확인 후 이 시간(초) 안에는 다시 확인하지 않음
+        """
+        self.session_dir = session_dir
+        self.validate_interval = validate_interval
+        self.lock = threading.Lock()
+        self.sessions = {}  # {아이디: {"cookies": [...], "validated_at": float, "password_hash": str 또는 None}}
+        os.makedirs(session_dir, exist_ok=True)
+        self.protector = _create_protector(session_dir)
+
+    def _path(self, username):
+        """아이디별 쿠키 파일 경로"""
+        name = hashlib.sha256(username.encode('utf-8')).hexdigest()[:32]
+        return os.path.join(self.session_dir, f"{name}.session")
+
+    def _load(self, username):
+        """메모리 또는 디스크에서 쿠키 로드"""
+        with self.lock:
+            session = self.sessions.get(username)
+        if session:
+            return session
+
+        path = self._path(username)
+        if self.protector is None or not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                data = json.loads(self.protector.decrypt(f.read()).decode('utf-8'))
+        except Exception as e:
+            print(f"저장된 세션 로드 중 오류 발생: {e}")
+            return None
+        if data.get("username") != username:
+            return None
+
+        session = {"cookies": data.get("cookies") or [], "validated_at": 0.0, "password_hash": data.get("password_hash")}
+        with self.lock:
+            self.sessions[username] = session
+        return session
+
+    def save(self, username, cookies, password=None):
+        """
+        쿠키 저장
+
+        Args:
+            username (str): 아이디
+            cookies (list): Selenium get_cookies() 형식의 쿠키 목록
+            password (str, optional): 로그인한 비밀번호 (확인값만 저장)
+        """
+        password_hash = _hash_password(password) if password else None
+        with self.lock:
+            self.sessions[username] = {"cookies": cookies, "validated_at": time.time(), "password_hash": password_hash}
+        if self.protector is None:
+            return
+
+        data = json.dumps({
+            "username": username,
+            "cookies": cookies,
+            "password_hash": password_hash,
+            "saved_at": time.time()
+        }).encode('utf-8')
+        path = self._path(username)
+        try:
+            with open(path + ".tmp", 'wb') as f:
+                f.write(self.protector.encrypt(data))
+            os.replace(path + ".tmp", path)
+        except Exception as e:
+            print(f"세션 저장 중 오류 발생: {e}")
+
+    def invalidate(self, username):
+        """
+        저장된 세션 삭제 (로그인 정보가 바뀌었거나 세션이 만료된 경우)
+
+        Args:
+            username (str): 아이디
+        """
+        with self.lock:
+            self.sessions.pop(username, None)
+        path = self._path(username)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def has_session(self, username):
+        """
+        만료되지 않은 저장된 세션이 있는지 확인 (서버에 확인 요청은 보내지 않음)
+
+        Args:
+            username (str): 아이디
+
+        Returns:
+            bool: 저장된 쿠키가 있고 만료 시간이 지나지 않았으면 True
+        """
+        session = self._load(username)
+        return bool(session and session["cookies"] and not self._expired(session["cookies"]))
+
+    def _password_matches(self, session, password):
+        """
+        세션을 만든 로그인의 비밀번호와 같은지 확인
+
+        비밀번호가 비어 있으면 저장된 세션을 그대로 쓰겠다는 뜻으로 보고 True,
+        확인값이 없는 세션(이전 버전에서 저장)은 확인할 수 없으므로 False.
+        """
+        if not password:
+            return True
+        stored = session.get("password_hash")
+        if not stored or "$" not in stored:
+            return False
+        return hmac.compare_digest(_hash_password(password, stored.split("$", 1)[0]), stored)
+
+    def _expired(self, cookies):
+        """만료 시간이 지난 쿠키가 있는지 확인"""
+        now = time.time()
+        return any(cookie.get("expiry") and cookie["expiry"] < now for cookie in cookies)
+
+    def valid_cookies(self, username, password=None):
+        """
+        다시 사용할 수 있는 쿠키 반환
+
+        입력한 비밀번호가 세션을 만든 로그인의 비밀번호와 다르면 사용하지 않는다.
+        마지막 확인 후 validate_interval이 지났으면 로그인이 필요한 페이지를
+        리다이렉트 없이 요청해 로그인 페이지로 보내지 않는지 확인한다.
+
+        Args:
+            username (str): 아이디
+            password (str, optional): 입력한 비밀번호 (비어 있으면 확인하지 않고 저장된 세션 사용)
+
+        Returns:
+            list: 유효한 쿠키 목록. 없거나 만료되었으면 None
+        """
+        session = self._load(username)
+        if not session or not session["cookies"] or self._expired(session["cookies"]):
+            return None
+        if not self._password_matches(session, password):
+            return None  # 비밀번호가 바뀌었거나 잘못 입력한 경우 다시 로그인해 확인
+        if time.time() - session["validated_at"] < self.validate_interval:
+            return session["cookies"]
+
+        client = HttpClient(pool_size=1)
+        try:
+            self.apply_to_session(client.session, session["cookies"])
+            response = client.get(site_url(VALIDATE_PATH), allow_redirects=False)
+            valid = response.status_code == 200
+        except requests.RequestException:
+            return None  # 확인할 수 없으면 일반 로그인
+        finally:
+            client.close()
+
+        if not valid:
+            self.invalidate(username)
+            return None
+        with self.lock:
+            session["validated_at"] = time.time()
+        return session["cookies"]
+
+    def apply_to_driver(self, driver, cookies):
+        """
+        Selenium 드라이버에 쿠키 넣기
+
+        Args:
+            driver (WebDriver): 대상 드라이버
+            cookies (list): 쿠키 목록
+        """
+        try:
+            # Chrome은 페이지 이동 없이 모든 도메인의 쿠키를 한 번에 설정
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": [
+                {key: value for key, value in {
+                    "name": cookie["name"],
+                    "value": cookie["value"],
+                    "domain": cookie.get("domain"),
+                    "path": cookie.get("path", "/"),
+                    "secure": cookie.get("secure", False),
+                    "httpOnly": cookie.get("httpOnly", False),
+                    "expires": cookie.get("expiry")
+                }.items() if value is not None}
+                for cookie in cookies
+            ]})
+        except Exception:
+            # 쿠키는 해당 도메인 페이지에서만 추가할 수 있다
+            driver.get(site_url("/"))
+            for cookie in cookies:
+                try:
+                    driver.add_cookie(cookie)
+                except Exception:
+                    pass  # 다른 도메인(로그인 서버 등)의 쿠키
+
+    def apply_to_session(self, session, cookies):
+        """
+        requests 세션에 쿠키 넣기
+
+        Args:
+            session (requests.Session): 대상 세션
+            cookies (list): 쿠키 목록
+        """
+        for cookie in cookies:
+            session.cookies.set(
+                cookie["name"],
+                cookie["value"],
+                domain=cookie.get("domain", ""),
+                path=cookie.get("path", "/"),
+                secure=cookie.get("secure", False),
+                expires=cookie.get("expiry")
+            )
+
+    def _driver_cookies(self, driver):
+        """드라이버의 모든 도메인 쿠키 (Chrome이 아니면 현재 도메인만)"""
+        try:
+            cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        except Exception:
+            return driver.get_cookies()
+        return [
+            {key: value for key, value in {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie.get("domain"),
+                "path": cookie.get("path", "/"),
+                "secure": cookie.get("secure", False),
+                "httpOnly": cookie.get("httpOnly", False),
+                "expiry": int(cookie["expires"]) if cookie.get("expires", -1) > 0 else None
+            }.items() if value is not None}
+            for cookie in cookies
+        ]
+
+    def login(self, browser, username, password):
+        """
+        브라우저 로그인 (저장된 세션이 유효하고 비밀번호가 같으면 로그인 페이지를 거치지 않음)
+
+        Args:
+            browser (Browser): 로그인할 브라우저
+            username (str): 아이디
+            password (str): 비밀번호 (비어 있으면 저장된 세션만 사용)
+
+        Returns:
+            bool: 로그인 성공 여부
+        """
+        driver = browser.get_driver()
+        cookies = self.valid_cookies(username, password)
+        if cookies:
+            self.apply_to_driver(driver, cookies)
+            return True
+        if not password:
+            return False  # 사용할 수 있는 세션이 없음
+
+        browser.get(login_url())
+
+        # 아이디/비밀번호 입력 후 로그인 페이지를 벗어날 때까지 대기
+        page_url = driver.current_url
+        driver.find_element("name", "username").send_keys(username)
+        driver.find_element("name", "password").send_keys(password)
+        driver.find_element("name", "password").send_keys("\n")
+        browser.wait_for_url_change(page_url, timeout=10)
+
+        # 로그인 성공 확인
+        if "login" in driver.current_url:
+            self.invalidate(username)
+            return False
+
+        self.save(username, self._driver_cookies(driver), password)
+        return True
+
+_shared_manager = None
+_shared_lock = threading.Lock()
+
+def get_session_manager():
+    """
+    모든 워커가 공유하는 세션 관리자 반환
+
+    Returns:
+        SessionManager: 프로세스 전역 세션 관리자
+    """
+    global _shared_manager
+    with _shared_lock:
+        if _shared_manager is None:
+            _shared_manager = SessionManager()
+        return _shared_manager
@@ -0,0 +1,40 @@
+import os
+
+DEFAULT_BASE_URL = "https://orbi.kr"
+DEFAULT_LOGIN_URL = "https://login.orbi.kr/login"
+
+# 환경 변수로 다른 서버(로컬 벤치마크 서버 등)를 가리킬 수 있다
+_base_url = os.environ.get("ORBI_BASE_URL", DEFAULT_BASE_URL).rstrip("/")
+_login_url = os.environ.get("ORBI_LOGIN_URL") or (
+    f"{_base_url}/login" if "ORBI_BASE_URL" in os.environ else DEFAULT_LOGIN_URL
+)
+
+def set_base_url(base_url, login_url=None):
+    """
+    오르비 사이트 주소 변경
+
+    Args:
+        base_url (str): 사이트 기본 주소 (예: http://127.0.0.1:8000)
+        login_url (str, optional): 로그인 페이지 주소. 없으면 <기본 주소>/login
+    """
+    global _base_url, _login_url
+    _base_url = base_url.rstrip("/")
+    _login_url = login_url or f"{_base_url}/login"
+
+def site_url(path=""):
+    """
+    사이트 내 경로의 전체 URL
+
+    Args:
+        path (str): "/list"와 같은 경로
+
+    Returns:
+        str: 전체 URL
+    """
+    if path and not path.startswith("/"):
+        path = "/" + path
+    return _base_url + path
+
+def login_url():
+    """로그인 페이지 URL"""
+    return _login_url
@@ -0,0 +1,170 @@
+import os
+import csv
+import json
+
+# 구조화 출력 형식별 확장자
+EXTRA_FORMATS = {
+    "jsonl": ".jsonl",
+    "csv": ".csv"
+}
+CSV_FIELDS = ["page", "id", "title", "date", "board"]
+
+class TitleWriter:
+    """
+    추출한 제목을 페이지 단위로 바로 파일에 기록하는 클래스
+
+    페이지마다 fsync 후 진행 상황(<저장 경로>.progress.json)을 기록하므로,
+    중간에 중단되어도 마지막으로 기록한 페이지 다음부터 이어서 추출할 수 있다.
+    """
+    def __init__(self, save_path, extra_format=None):
+        """
+        제목 기록기 초기화
+
+        Args:
+            save_path (str): 제목 텍스트 파일 경로
+            extra_format (str, optional): 함께 기록할 구조화 형식 ("jsonl" 또는 "csv")
+        """
+        self.save_path = save_path
+        self.extra_format = extra_format if extra_format in EXTRA_FORMATS else None
+        self.extra_path = None
+        if self.extra_format:
+            self.extra_path = os.path.splitext(save_path)[0] + EXTRA_FORMATS[self.extra_format]
+        self.progress_path = save_path + ".progress.json"
+
+        self.key = None
+        self.last_page = 0
+        self.count = 0
+        self.text_file = None
+        self.extra_file = None
+        self.csv_writer = None
+
+    def start(self, key, resume=False):
+        """
+        기록 시작
+
+        Args:
+            key (str): 작업 식별자 (아이민 번호). 진행 기록과 같을 때만 이어서 진행
+            resume (bool): 이전 진행 기록에서 이어서 할지 여부
+
+        Returns:
+            int: 가져와야 할 첫 페이지 번호
+        """
+        self.key = key
+        progress = self._load_progress() if resume else None
+
+        if progress and progress.get("key") == key and not progress.get("complete"):
+            # 마지막 체크포인트 이후에 기록된 불완전한 내용 잘라내기
+            self._truncate(self.save_path, progress.get("text_size", 0))
+            if self.extra_path:
+                self._truncate(self.extra_path, progress.get("extra_size", 0))
+            self.last_page = progress.get("page", 0)
+            self.count = progress.get("count", 0)
+            self._open(append=True)
+        else:
+            for path in (self.save_path, self.extra_path, self.progress_path):
+                if path and os.path.exists(path):
+                    os.remove(path)
+
+        return self.last_page + 1
+
+    def completed_count(self, key):
+        """
+        이전 실행에서 마지막 페이지까지 기록을 마친 경우 저장된 제목 수
+
+        Args:
+            key (str): 작업 식별자 (아이민 번호)
+
+        Returns:
+            int: 같은 작업의 완료 기록이 있으면 제목 수, 없으면 None
+        """
+        progress = self._load_progress()
+        if progress and progress.get("key") == key and progress.get("complete"):
+            return progress.get("count", 0)
+        return None
+
+    def _load_progress(self):
+        """진행 기록 로드"""
+        if not os.path.exists(self.progress_path):
+            return None
+        try:
+            with open(self.progress_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _truncate(self, path, size):
+        """파일을 지정한 크기로 자르기"""
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, 'r+b') as f:
+                f.truncate(size)
+
+    def _open(self, append):
+        """출력 파일 열기 (처음 기록할 때 생성)"""
+        mode = 'a' if append else 'w'
+        self.text_file = open(self.save_path, mode, encoding='utf-8')
+
+        if self.extra_path:
+            new_file = not append or not os.path.exists(self.extra_path) or os.path.getsize(self.extra_path) == 0
+            self.extra_file = open(self.extra_path, mode, encoding='utf-8', newline='')
+            if self.extra_format == "csv":
+                self.csv_writer = csv.DictWriter(self.extra_file, fieldnames=CSV_FIELDS, extrasaction='ignore')
+                if new_file:
+                    self.csv_writer.writeheader()
+
+    def write_page(self, page, items):
+        """
+        한 페이지의 결과 기록 후 체크포인트 저장
+
+        Args:
+            page (int): 페이지 번호
+            items (list): {"id", "title", "date", "board"} 목록
+        """
+        if self.text_file is None:
+            self._open(append=False)
+
+        for item in items:
+            self.text_file.write(item["title"] + "\n")
+            if self.extra_format == "jsonl":
+                self.extra_file.write(json.dumps({"page": page, **item}, ensure_ascii=False) + "\n")
+            elif self.extra_format == "csv":
+                self.csv_writer.writerow({"page": page, **item})
+
+        self.count += len(items)
+        self.last_page = page
+        self._checkpoint()
+
+    def _sync(self, file):
+        """버퍼를 디스크까지 기록"""
+        file.flush()
+        os.fsync(file.fileno())
+
+    def _checkpoint(self, complete=False):
+        """파일을 디스크에 기록하고 진행 상황 저장"""
+        progress = {"key": self.key, "page": self.last_page, "count": self.count, "complete": complete}
+        if self.text_file:
+            self._sync(self.text_file)
+            progress["text_size"] = self.text_file.tell()
+        if self.extra_file:
+            self._sync(self.extra_file)
+            progress["extra_size"] = self.extra_file.tell()
+
+        temp_path = self.progress_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(progress, f)
+            self._sync(f)
+        os.replace(temp_path, self.progress_path)
+
+    def close(self, complete=False):
+        """
+        기록 종료
+
+        Args:
+            complete (bool): 마지막 페이지까지 추출했는지 여부 (완료되면 다음 실행은 처음부터)
+        """
+        if self.text_file:
+            self._checkpoint(complete=complete)
+            self.text_file.close()
+            self.text_file = None
+        if self.extra_file:
+            self.extra_file.close()
+            self.extra_file = None